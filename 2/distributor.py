@@ -1,6 +1,6 @@
 import re
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Optional, Tuple, Union
 from models import Assignment, AssignmentStatus, Course
 
 
@@ -25,8 +25,8 @@ class Distributor:
             raise ValueError(f"Ошибка парсинга значения: {value}") from e
 
     @staticmethod
-    def create_from_string(description: str, course: Course) -> Assignment:
-        """Create an assignment from a string description."""
+    def parse_record(description: str) -> Assignment:
+        """Build an assignment from a string description without touching a course."""
         tokens = re.findall(r'"[^"]*"|\d{4}\.\d{2}\.\d{2}|\S+', description)
         if len(tokens) != 5:
             raise ValueError("Ожидалось 5 значений: ФИО, тема, дата выдачи, статус, оценка")
@@ -36,27 +36,49 @@ class Distributor:
         # Convert status string to AssignmentStatus
         for status in AssignmentStatus:
             if status.value == status_str:
-                assignment = Assignment(student_name, theme_name, issue_date, status, grade)
-                break
-        else:
-            raise ValueError(f"Недопустимый статус: {status_str}")
+                return Assignment(student_name, theme_name, issue_date, status, grade)
+        raise ValueError(f"Недопустимый статус: {status_str}")
 
+    @staticmethod
+    def create_from_string(description: str, course: Course) -> Assignment:
+        """Create an assignment from a string description."""
+        assignment = Distributor.parse_record(description)
         course.add_assignment(assignment)
         return assignment
 
     @staticmethod
-    def create_from_file(file_path: str, course: Course) -> List[Assignment]:
-        """Read assignments from a file."""
-        assignments = []
+    def iter_from_file(file_path: str, course: Optional[Course] = None,
+                       yield_errors: bool = False) -> Iterator[Union[Assignment, Tuple[int, ValueError]]]:
+        """Lazily yield assignments from a file, one line at a time.
+
+        Assignments are attached to ``course`` when one is given. An invalid
+        line raises ``ValueError`` unless ``yield_errors`` is set, in which case
+        it is yielded as a ``(line_number, error)`` pair and reading goes on.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    if line.strip():
-                        assignment = Distributor.create_from_string(line.strip(), course)
-                        assignments.append(assignment)
+            file = open(file_path, 'r', encoding='utf-8')
         except FileNotFoundError:
             raise FileNotFoundError(f"Файл {file_path} не найден")
-        return assignments
+        with file:
+            for line_number, line in enumerate(file, 1):
+                description = line.strip()
+                if not description:
+                    continue
+                try:
+                    assignment = Distributor.parse_record(description)
+                except ValueError as e:
+                    if not yield_errors:
+                        raise
+                    yield line_number, e
+                    continue
+                if course is not None:
+                    course.add_assignment(assignment)
+                yield assignment
+
+    @staticmethod
+    def create_from_file(file_path: str, course: Course) -> List[Assignment]:
+        """Read assignments from a file."""
+        return list(Distributor.iter_from_file(file_path, course))
 
     @staticmethod
     def save_to_file(file_path: str, course: Course) -> None:
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
-from models import Course, Assignment, AssignmentStatus
+from models import Course, Assignment, AssignmentStatus, ChangeKind
 from distributor import Distributor
 
 
@@ -17,7 +17,10 @@ class AssignmentApp:
             AssignmentStatus.SUBMITTED.value: "Сдано",
             AssignmentStatus.GRADED.value: "Оценено"
         }
+        self._row_ids = []  # Treeview iid для каждой позиции в курсе
+        self._loading = False
         self._setup_ui()
+        self._course.subscribe(self._on_course_change)
 
     def _setup_ui(self):
         """Set up the GUI components."""
@@ -80,7 +83,6 @@ class AssignmentApp:
             date = datetime.strptime(date_str, '%Y.%m.%d')
             assignment = Assignment(name, theme, date)
             self._course.add_assignment(assignment)
-            self._update_table()
             self._name_entry.delete(0, tk.END)
             self._theme_entry.delete(0, tk.END)
             self._date_entry.delete(0, tk.END)
@@ -93,7 +95,6 @@ class AssignmentApp:
         if selected:
             index = int(self._tree.index(selected[0]))
             self._course.remove_assignment(index)
-            self._update_table()
         else:
             messagebox.showwarning("Предупреждение", "Выберите задание для удаления")
 
@@ -105,7 +106,6 @@ class AssignmentApp:
             return
 
         index = int(self._tree.index(selected[0]))
-        assignment = self._course.get_assignments()[index]
 
         try:
             # Update status if selected
@@ -115,7 +115,7 @@ class AssignmentApp:
                     if rus_status == status_value:
                         for status in AssignmentStatus:
                             if status.value == eng_status:
-                                assignment.update_status(status)
+                                self._course.update_status(index, status)
                                 break
                         break
 
@@ -123,9 +123,8 @@ class AssignmentApp:
             grade_str = self._grade_entry.get()
             if grade_str:
                 grade = float(grade_str)
-                assignment.set_grade(grade)
+                self._course.set_grade(index, grade)
 
-            self._update_table()
             self._status_var.set("")  # Clear status selection
             self._grade_entry.delete(0, tk.END)  # Clear grade entry
         except ValueError as e:
@@ -135,13 +134,16 @@ class AssignmentApp:
         """Load assignments from a file."""
         file_path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt")])
         if file_path:
+            self._loading = True  # Таблица перестраивается целиком после загрузки
             try:
-                self._course.get_assignments().clear()  # Очищаем текущие задания
+                self._course.clear()  # Очищаем текущие задания
                 Distributor.create_from_file(file_path, self._course)
                 self._default_file = file_path  # Обновляем путь к файлу
-                self._update_table()
             except (FileNotFoundError, ValueError) as e:
                 messagebox.showerror("Ошибка", str(e))
+            finally:
+                self._loading = False
+                self._update_table()
 
     def _save_to_file(self):
         """Save assignments to a file."""
@@ -155,17 +157,36 @@ class AssignmentApp:
                 messagebox.showerror("Ошибка", str(e))
 
     def _update_table(self):
-        """Update the table with current assignments."""
-        for item in self._tree.get_children():
-            self._tree.delete(item)
-        for assignment in self._course.get_assignments():
-            self._tree.insert("", tk.END, values=(
-                assignment.student_name,
-                assignment.theme_name,
-                assignment.issue_date.strftime('%Y.%m.%d'),
-                self._status_translations.get(assignment.status.value, assignment.status.value),
-                assignment.grade if assignment.grade is not None else ""
-            ))
+        """Rebuild the table with current assignments."""
+        if self._row_ids:
+            self._tree.delete(*self._row_ids)
+        self._row_ids = [self._tree.insert("", tk.END, values=self._row_values(assignment))
+                         for assignment in self._course.get_assignments()]
+
+    def _on_course_change(self, kind: ChangeKind, index):
+        """Apply a single course change to the table instead of rebuilding it."""
+        if self._loading:
+            return
+        if kind is ChangeKind.ADDED:
+            self._row_ids.append(self._tree.insert("", tk.END, values=self._row_values(
+                self._course.get_assignments()[index])))
+        elif kind is ChangeKind.UPDATED:
+            self._tree.item(self._row_ids[index], values=self._row_values(self._course.get_assignments()[index]))
+        elif kind is ChangeKind.REMOVED:
+            self._tree.delete(self._row_ids.pop(index))
+        elif kind is ChangeKind.CLEARED and self._row_ids:
+            self._tree.delete(*self._row_ids)
+            self._row_ids = []
+
+    def _row_values(self, assignment: Assignment) -> tuple:
+        """Format an assignment as a table row."""
+        return (
+            assignment.student_name,
+            assignment.theme_name,
+            assignment.issue_date.strftime('%Y.%m.%d'),
+            self._status_translations.get(assignment.status.value, assignment.status.value),
+            assignment.grade if assignment.grade is not None else ""
+        )
 
     def run(self):
         """Run the application."""
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import Callable, List, Optional
 
 
 class AssignmentStatus(Enum):
@@ -10,6 +10,17 @@ class AssignmentStatus(Enum):
     GRADED = "Graded"
 
 
+class ChangeKind(Enum):
+    """Виды изменений курса, о которых уведомляются подписчики."""
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+    CLEARED = "cleared"
+
+
+ChangeListener = Callable[[ChangeKind, Optional[int]], None]
+
+
 class AssignmentBase:
     """Базовый класс для хранения информации о задании."""
     
@@ -80,6 +91,20 @@ class Course:
         self.course_name = course_name
         self.instructor = instructor
         self.assignments: List[Assignment] = []
+        self._listeners: List[ChangeListener] = []
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        """Подписка на изменения курса.
+
+        Подписчик вызывается как ``listener(kind, index)``; для
+        ``ChangeKind.CLEARED`` индекс равен ``None``.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, kind: ChangeKind, index: Optional[int] = None) -> None:
+        """Рассылка уведомления об изменении подписчикам."""
+        for listener in self._listeners:
+            listener(kind, index)
 
     def add_assignment(self, assignment: Assignment) -> None:
         """Добавление задания в курс.
@@ -88,6 +113,7 @@ class Course:
             assignment: Объект задания.
         """
         self.assignments.append(assignment)
+        self._notify(ChangeKind.ADDED, len(self.assignments) - 1)
 
     def remove_assignment(self, index: int) -> None:
         """Удаление задания по индексу.
@@ -100,9 +126,25 @@ class Course:
         """
         if 0 <= index < len(self.assignments):
             self.assignments.pop(index)
+            self._notify(ChangeKind.REMOVED, index)
         else:
             raise IndexError("Недопустимый индекс задания")
 
+    def update_status(self, index: int, new_status: AssignmentStatus) -> None:
+        """Обновление статуса задания по индексу с уведомлением подписчиков."""
+        self.assignments[index].update_status(new_status)
+        self._notify(ChangeKind.UPDATED, index)
+
+    def set_grade(self, index: int, grade: float) -> None:
+        """Установка оценки заданию по индексу с уведомлением подписчиков."""
+        self.assignments[index].set_grade(grade)
+        self._notify(ChangeKind.UPDATED, index)
+
+    def clear(self) -> None:
+        """Удаление всех заданий курса."""
+        self.assignments.clear()
+        self._notify(ChangeKind.CLEARED)
+
     def get_assignments(self) -> List[Assignment]:
         """Получение списка всех заданий.
 
@@ -0,0 +1,185 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from datagen import write_file
+from distributor import Distributor
+from models import Course, RecordStore
+from storage import ColumnStore
+
+
+_DEFAULT_SIZES = (1000, 10000, 100000)
+_QUERY_REPEATS = 1000
+
+
+def measure(action: Callable[[], object], memory: bool = True) -> Dict[str, Optional[float]]:
+    """Time one call of ``action``; with ``memory`` repeat it under tracemalloc.
+
+    The timed run is untraced because tracemalloc slows allocation-heavy code
+    several times over; the peak is taken from a second, traced run.
+    """
+    start = time.perf_counter()
+    action()
+    seconds = time.perf_counter() - start
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            action()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {'seconds': seconds, 'peak_bytes': peak}
+
+
+def _new_course(storage_type) -> Course:
+    return Course("Программирование на Python", "Иванов И.И.", storage_type())
+
+
+def _scenarios(size: int, input_path: str, output_path: str, tree_limit: int, workers: int):
+    """Yield (name, number of lines processed, action) for one data size."""
+    yield "parse", size, lambda: _parse_file(input_path)
+    for storage_type in (RecordStore, ColumnStore):
+        suffix = storage_type.__name__
+        yield f"load[{suffix}]", size, lambda storage_type=storage_type: Distributor.create_from_file(
+            input_path, _new_course(storage_type))
+    if workers > 1:
+        yield f"load[parallel:{workers}]", size, lambda: Distributor.create_from_file(
+            input_path, _new_course(ColumnStore), workers=workers)
+
+    course = _new_course(ColumnStore)
+    Distributor.create_from_file(input_path, course)
+    yield "save", len(course), lambda: Distributor.save_to_file(output_path, course)
+
+    def build_indexes():
+        # A fresh course over a filled store builds its indexes on the first query.
+        Course(course.course_name, course.instructor, course.store).query_ids(student="")
+    yield "index", len(course), build_indexes
+    students = sorted({assignment.student_name for assignment in course.get_assignments()})[:_QUERY_REPEATS]
+    course.query_ids(student="")
+    yield "query", len(students), lambda: [course.query_ids(student=name) for name in students]
+
+    tree = _headless_tree()
+    if tree is not None:
+        rows = min(len(course), tree_limit)
+
+        def refresh():
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            for position in range(rows):
+                record_id = course.id_at(position)
+                assignment = course.get_by_id(record_id)
+                tree.insert("", "end", iid=str(record_id), values=(
+                    assignment.student_name, assignment.theme_name,
+                    assignment.date_text, assignment.status.value,
+                    assignment.grade if assignment.grade is not None else ""))
+            tree.update_idletasks()
+        yield "treeview", rows, refresh
+
+
+def _parse_file(file_path: str) -> None:
+    """Parse every line of a file the way ``create_from_string`` does, keeping nothing."""
+    with open(file_path, encoding='utf-8') as file:
+        for line in file:
+            try:
+                Distributor.parse_record(line.strip())
+            except ValueError:
+                pass
+
+
+_tree = None
+_no_display = False
+
+
+def _headless_tree():
+    """A withdrawn Tk window with a Treeview, or None when there is no display."""
+    global _tree, _no_display
+    if _tree is None and not _no_display:
+        try:
+            import tkinter as tk
+            from tkinter import ttk
+            root = tk.Tk()
+        except Exception:
+            _no_display = True
+            return None
+        root.withdraw()
+        _tree = ttk.Treeview(root, columns=("Name", "Theme", "Date", "Status", "Grade"), show="headings")
+    return _tree
+
+
+def run(sizes=_DEFAULT_SIZES, malformed: float = 0.05, memory: bool = True,
+        tree_limit: int = 100000, seed: int = 0, log: Callable[[str], None] = print,
+        workers: Optional[int] = None) -> dict:
+    """Run every scenario for every size and return the results as a dict.
+
+    ``workers`` (the number of CPUs by default) sets the process count of the
+    parallel load, which is skipped when it is 1.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # create_from_file writes error.log into the working directory.
+        os.chdir(directory)
+        try:
+            for size in sizes:
+                input_path = os.path.join(directory, f"input_{size}.txt")
+                write_file(input_path, size, malformed=malformed, seed=seed)
+                output_path = os.path.join(directory, "output.txt")
+                for name, items, action in _scenarios(size, input_path, output_path, tree_limit, workers):
+                    result = {'scenario': name, 'size': size, 'items': items}
+                    result.update(measure(action, memory))
+                    result['items_per_second'] = items / result['seconds'] if result['seconds'] else None
+                    results.append(result)
+                    log(f"{name:>22} {size:>10} {result['seconds']:10.4f} s"
+                        + (f" {result['peak_bytes'] / 2 ** 20:10.1f} MiB" if memory else ""))
+                if _headless_tree() is None:
+                    log(f"{'treeview':>22} {size:>10}    пропущено: нет дисплея")
+        finally:
+            os.chdir(cwd)
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'malformed': malformed,
+        'workers': workers,
+        'results': results,
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Замеры производительности загрузки, сохранения и поиска")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(_DEFAULT_SIZES),
+                        help="количества строк (например, 1000 1000000 10000000)")
+    parser.add_argument("--malformed", type=float, default=0.05, help="доля ошибочных строк")
+    parser.add_argument("--no-memory", action="store_true", help="не измерять память (tracemalloc)")
+    parser.add_argument("--tree-limit", type=int, default=100000, help="максимум строк в Treeview")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="процессов для параллельной загрузки (по умолчанию по числу ядер)")
+    parser.add_argument("-o", "--output", help="файл для результатов в JSON (по умолчанию stdout)")
+    args = parser.parse_args()
+
+    def log(message: str) -> None:
+        print(message, file=sys.stderr)
+    report = run(args.sizes, args.malformed, not args.no_memory, args.tree_limit, args.seed, log,
+                 args.workers)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import os
+import sqlite3
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from ingest import FileReport, IngestReport, ingest
+from models import Assignment, Course
+from snapshot import Snapshot
+from storage import ColumnStore
+
+
+_INDEX_FILE = "catalog.db"
+_COURSES_DIR = "courses"
+_DEFAULT_BUDGET = 256 * 2 ** 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS courses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    instructor TEXT NOT NULL,
+    assignments INTEGER NOT NULL DEFAULT 0,
+    students INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS enrolments (
+    student TEXT NOT NULL,
+    course_id INTEGER NOT NULL,
+    assignments INTEGER NOT NULL,
+    PRIMARY KEY (student, course_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS enrolments_course ON enrolments(course_id);
+"""
+_HEADER_COLUMNS = "id, name, instructor, assignments, students"
+
+
+class CourseHeader:
+    """What the catalog knows about a course without loading it."""
+    __slots__ = ('course_id', 'course_name', 'instructor', 'assignments', 'students')
+
+    def __init__(self, course_id: int, course_name: str, instructor: str, assignments: int, students: int):
+        self.course_id = course_id
+        self.course_name = course_name
+        self.instructor = instructor
+        self.assignments = assignments
+        self.students = students
+
+    def __str__(self) -> str:
+        return (f"Курс: {self.course_name}, Преподаватель: {self.instructor}, "
+                f"Количество заданий: {self.assignments}, студентов: {self.students}")
+
+
+class Catalog:
+    """Many courses in a directory, with only recently used ones in memory.
+
+    ``catalog.db`` holds a header per course and a student index
+    (student -> courses with assignment counts); each course's assignments
+    are a binary snapshot in ``courses/<id>.snap``. ``course()`` loads a
+    course into a ``ColumnStore`` on first access and keeps it until the
+    estimated size of the loaded courses exceeds ``memory_budget``, when the
+    least recently used ones are saved (if changed) and dropped. The course
+    being returned is never evicted, even if it alone exceeds the budget.
+
+    A course counts as changed when its name, instructor, store or store
+    ``version`` differ from the last load or save, so writes made through
+    ``AssignmentView`` objects are saved too. A ``Course`` is only tracked
+    while it is loaded: changes made to a reference kept after its eviction
+    are lost, so call ``course()`` again rather than holding on to it.
+    Headers and the student index reflect the last save of a course;
+    ``flush()`` saves all changed courses.
+    """
+
+    def __init__(self, directory: str, memory_budget: int = _DEFAULT_BUDGET):
+        """Open the catalog in ``directory``, creating it if needed."""
+        self.directory = directory
+        self.memory_budget = memory_budget
+        os.makedirs(os.path.join(directory, _COURSES_DIR), exist_ok=True)
+        self._connection = sqlite3.connect(os.path.join(directory, _INDEX_FILE))
+        self._connection.executescript(_SCHEMA)
+        self._loaded: "OrderedDict[int, Course]" = OrderedDict()
+        self._sizes: Dict[int, int] = {}
+        self._saved: Dict[int, tuple] = {}
+
+    def headers(self) -> List[CourseHeader]:
+        """Headers of all courses in the order they were added."""
+        rows = self._connection.execute(f"SELECT {_HEADER_COLUMNS} FROM courses ORDER BY id")
+        return [CourseHeader(*row) for row in rows]
+
+    def header(self, course_id: int) -> CourseHeader:
+        """Header of one course; raises ``KeyError`` for an unknown id."""
+        row = self._connection.execute(f"SELECT {_HEADER_COLUMNS} FROM courses WHERE id = ?",
+                                       (course_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Курс с идентификатором {course_id} не найден")
+        return CourseHeader(*row)
+
+    def add_course(self, course_name: str, instructor: str, assignments: Iterable[Assignment] = ()) -> int:
+        """Store a new course and return its id; it is not kept in memory."""
+        course = Course(course_name, instructor, ColumnStore())
+        for assignment in assignments:
+            course.add_assignment(assignment)
+        with self._connection:
+            course_id = self._connection.execute(
+                "INSERT INTO courses (name, instructor) VALUES (?, ?)", (course_name, instructor)).lastrowid
+            self._write(course_id, course)
+        return course_id
+
+    def remove_course(self, course_id: int) -> None:
+        """Delete a course, its snapshot and its student index entries."""
+        self.header(course_id)
+        self._unload(course_id)
+        with self._connection:
+            self._connection.execute("DELETE FROM enrolments WHERE course_id = ?", (course_id,))
+            self._connection.execute("DELETE FROM courses WHERE id = ?", (course_id,))
+        try:
+            os.remove(self._path(course_id))
+        except FileNotFoundError:
+            pass
+
+    def course(self, course_id: int) -> Course:
+        """The course with its assignments, loading it if it is not in memory."""
+        course = self._loaded.get(course_id)
+        if course is None:
+            header = self.header(course_id)
+            course = Course(header.course_name, header.instructor, ColumnStore())
+            Snapshot.load_from_file(self._path(course_id), course)
+            self._saved[course_id] = self._state(course)
+            self._loaded[course_id] = course
+        else:
+            self._loaded.move_to_end(course_id)
+        # Re-measured on every access: the course may have grown or built its indexes.
+        self._sizes[course_id] = course.memory_usage()
+        self._evict()
+        return course
+
+    def student_courses(self, student: str) -> List[Tuple[CourseHeader, int]]:
+        """Courses with work by ``student`` and how many assignments, from the index alone."""
+        rows = self._connection.execute(
+            "SELECT c.id, c.name, c.instructor, c.assignments, c.students, e.assignments "
+            "FROM enrolments e JOIN courses c ON c.id = e.course_id "
+            "WHERE e.student = ? ORDER BY c.id", (student,))
+        return [(CourseHeader(*row[:5]), row[5]) for row in rows]
+
+    def student_assignments(self, student: str) -> Iterator[Tuple[int, Assignment]]:
+        """All work by ``student`` as ``(course_id, assignment)``.
+
+        Only the courses listed for the student in the index are loaded.
+        """
+        for header, _ in self.student_courses(student):
+            course = self.course(header.course_id)
+            for assignment in course.query(student=student):
+                yield header.course_id, assignment
+
+    def ingest(self, sources: Iterable[str], instructor: str = "", **options) -> IngestReport:
+        """Add one course per input file, named after the file (see ``ingest.ingest``).
+
+        Files that could not be read are reported but not added.
+        """
+        def on_file(report: FileReport, assignments: List[Assignment]) -> None:
+            if report.failure is None:
+                name = os.path.splitext(os.path.basename(report.path))[0]
+                self.add_course(name, instructor, assignments)
+        return ingest(sources, on_file=on_file, **options)
+
+    @property
+    def loaded_ids(self) -> List[int]:
+        """Ids of the courses in memory, least recently used first."""
+        return list(self._loaded)
+
+    @property
+    def memory_used(self) -> int:
+        """Estimated bytes held by the loaded courses."""
+        return sum(self._sizes.values())
+
+    def flush(self) -> None:
+        """Save every loaded course that changed since it was loaded or saved."""
+        for course_id in list(self._loaded):
+            if self._changed(course_id):
+                self._save(course_id)
+
+    def close(self) -> None:
+        """Save changed courses, unload everything and close the index."""
+        self.flush()
+        for course_id in list(self._loaded):
+            self._unload(course_id)
+        self._connection.close()
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM courses").fetchone()[0]
+
+    def __contains__(self, course_id: int) -> bool:
+        return self._connection.execute("SELECT 1 FROM courses WHERE id = ?", (course_id,)).fetchone() is not None
+
+    def _path(self, course_id: int) -> str:
+        return os.path.join(self.directory, _COURSES_DIR, f"{course_id}.snap")
+
+    def _evict(self) -> None:
+        """Drop least recently used courses until the rest fit into the budget."""
+        while len(self._loaded) > 1 and self.memory_used > self.memory_budget:
+            course_id = next(iter(self._loaded))
+            if self._changed(course_id):
+                self._save(course_id)
+            self._unload(course_id)
+
+    def _unload(self, course_id: int) -> None:
+        self._loaded.pop(course_id, None)
+        self._sizes.pop(course_id, None)
+        self._saved.pop(course_id, None)
+
+    @staticmethod
+    def _state(course: Course) -> tuple:
+        """What has to stay the same for a loaded course to count as unchanged."""
+        return course.course_name, course.instructor, course.store, getattr(course.store, 'version', None)
+
+    def _changed(self, course_id: int) -> bool:
+        saved = self._saved[course_id]
+        current = self._state(self._loaded[course_id])
+        return saved[:2] != current[:2] or saved[2] is not current[2] or saved[3] != current[3]
+
+    def _save(self, course_id: int) -> None:
+        course = self._loaded[course_id]
+        with self._connection:
+            self._write(course_id, course)
+        self._saved[course_id] = self._state(course)
+
+    def _write(self, course_id: int, course: Course) -> None:
+        """Write the snapshot and refresh the header and student index (inside a transaction)."""
+        Snapshot.save_to_file(self._path(course_id), course)
+        students = Counter(assignment.student_name for assignment in course.get_assignments())
+        self._connection.execute("UPDATE courses SET name = ?, instructor = ?, assignments = ?, students = ? "
+                                 "WHERE id = ?", (course.course_name, course.instructor, len(course),
+                                                  len(students), course_id))
+        self._connection.execute("DELETE FROM enrolments WHERE course_id = ?", (course_id,))
+        self._connection.executemany("INSERT INTO enrolments (student, course_id, assignments) VALUES (?, ?, ?)",
+                                     ((student, course_id, count) for student, count in students.items()))
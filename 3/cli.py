@@ -0,0 +1,388 @@
+import argparse
+import io
+import json
+import os
+import sqlite3
+import sys
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterator, List, Optional, TextIO
+
+from distributor import Distributor
+from follow import FileFollower, FollowUpdate
+from grade_stats import GradeAggregate
+from ingest import ingest
+from instrumentation import LoadStats, profiled
+from models import Assignment, AssignmentStatus, Course
+from snapshot import Snapshot
+from sqlite_store import SqliteStore
+from storage import ColumnStore
+
+
+EXIT_OK = 0
+EXIT_INVALID_LINES = 1
+EXIT_FAILURE = 2
+_STDIO = "-"
+
+
+class ErrorReport:
+    """Counts invalid input lines and prints the first few of them to stderr."""
+
+    def __init__(self, show: int = 10, stream: Optional[TextIO] = None):
+        self.show = show
+        self.stream = stream
+        self.count = 0
+
+    def add(self, line_number: int, error: ValueError) -> None:
+        self.count += 1
+        if self.count <= self.show:
+            print(f"Строка {line_number}: {error}", file=self.stream or sys.stderr)
+
+
+def _format_of(path: str, explicit: Optional[str] = None) -> str:
+    """Data format from ``--to``/``--from`` or the file extension: txt, snap or db."""
+    if explicit:
+        return explicit
+    extension = os.path.splitext(path)[1].lower()
+    return {".snap": "snap", ".db": "db"}.get(extension, "txt")
+
+
+def _text_input(path: str):
+    """Open a text source; ``-`` is stdin decoded as UTF-8 (left open)."""
+    if path == _STDIO:
+        return nullcontext(io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8'))
+    try:
+        return open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Файл {path} не найден")
+
+
+def read_records(path: str, errors: ErrorReport, source_format: Optional[str] = None,
+                 legacy: bool = False, stats: Optional[LoadStats] = None) -> Iterator[Assignment]:
+    """Stream assignments from a text file, stdin, snapshot or SQLite database.
+
+    Text input is read line by line, so it may be larger than memory;
+    invalid lines go to ``errors``. ``legacy`` reads the three-field format
+    of ``1.py``. A snapshot is loaded whole into a column store.
+    """
+    source_format = _format_of(path, source_format)
+    if source_format == "db":
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Файл {path} не найден")
+        store = SqliteStore(path)
+        try:
+            for record_id in store.ids():
+                yield store.get(record_id)
+        finally:
+            store.close()
+        return
+    if source_format == "snap":
+        course = Course("", "", ColumnStore())
+        Snapshot.load_from_file(path, course)
+        yield from course.get_assignments()
+        return
+    with _text_input(path) as file:
+        if legacy:
+            for line_number, line in enumerate(file, 1):
+                description = line.strip()
+                if not description:
+                    continue
+                try:
+                    yield Distributor.parse_legacy_record(description)
+                except ValueError as e:
+                    errors.add(line_number, e)
+            return
+        for item in Distributor.iter_from_stream(file, yield_errors=True, stats=stats):
+            if isinstance(item, tuple):
+                errors.add(*item)
+            else:
+                yield item
+
+
+def write_records(path: str, assignments: Iterator[Assignment], target_format: Optional[str] = None) -> int:
+    """Write assignments to a text file, stdout, snapshot or SQLite database; return the count."""
+    target_format = _format_of(path, target_format)
+    if target_format == "db":
+        store = SqliteStore(path)
+        try:
+            return store.import_records(assignments)
+        finally:
+            store.close()
+    if target_format == "snap":
+        course = Course("", "", ColumnStore())
+        for assignment in assignments:
+            course.add_assignment(assignment)
+        Snapshot.save_to_file(path, course)
+        return len(course)
+    if path == _STDIO:
+        return Distributor.write_records(sys.stdout, assignments)
+    written = 0
+
+    def counted():
+        nonlocal written
+        for assignment in assignments:
+            written += 1
+            yield assignment
+    Distributor.save_records(path, counted())
+    return written
+
+
+def _matches(assignment, student: Optional[str], theme: Optional[str],
+             status: Optional[AssignmentStatus]) -> bool:
+    return ((student is None or assignment.student_name == student)
+            and (theme is None or assignment.theme_name == theme)
+            and (status is None or assignment.status is status))
+
+
+def _exit_code(errors: ErrorReport) -> int:
+    if errors.count:
+        print(f"Некорректных строк: {errors.count}", file=sys.stderr)
+        return EXIT_INVALID_LINES
+    return EXIT_OK
+
+
+def command_validate(args, errors: ErrorReport, stats: Optional[LoadStats]) -> int:
+    """Parse the whole input and report how many lines are valid."""
+    records = sum(1 for _ in read_records(args.source, errors, args.source_format, args.legacy, stats))
+    print(f"Записей: {records}, ошибок: {errors.count}")
+    return EXIT_INVALID_LINES if errors.count else EXIT_OK
+
+
+def command_import(args, errors: ErrorReport, stats: Optional[LoadStats]) -> int:
+    """Append the input to a SQLite database in one transaction."""
+    records = read_records(args.source, errors, args.source_format, args.legacy, stats)
+    added = write_records(args.database, records, "db")
+    print(f"Импортировано записей: {added}", file=sys.stderr)
+    return _exit_code(errors)
+
+
+def command_convert(args, errors: ErrorReport, stats: Optional[LoadStats]) -> int:
+    """Rewrite the input in another format."""
+    records = read_records(args.source, errors, args.source_format, args.legacy, stats)
+    write_records(args.target, records, args.target_format)
+    return _exit_code(errors)
+
+
+def command_ingest(args, errors: ErrorReport, stats: Optional[LoadStats]) -> int:
+    """Read many files concurrently and merge them, in sorted path order, into one target."""
+    target_format = _format_of(args.target, args.target_format) if args.target else None
+    options = dict(workers=args.workers, error_dir=args.errors_dir, pattern=args.pattern)
+    if target_format == "db":
+        store = SqliteStore(args.target)
+        try:
+            report = ingest(args.sources, on_file=lambda _, assignments: store.import_records(assignments),
+                            **options)
+        finally:
+            store.close()
+    elif target_format is not None:
+        course = Course("", "", ColumnStore())
+        report = ingest(args.sources, course, **options)
+        write_records(args.target, course.get_assignments(), target_format)
+    else:
+        # Without a target only the per-file summary is produced.
+        report = ingest(args.sources, on_file=lambda report, assignments: None, **options)
+    print(report.summary(args.show_errors), file=sys.stderr)
+    if report.failed:
+        return EXIT_FAILURE
+    return EXIT_INVALID_LINES if report.errors else EXIT_OK
+
+
+def command_query(args, errors: ErrorReport, stats: Optional[LoadStats]) -> int:
+    """Print the records matching the filters, using database indexes when possible."""
+    status = AssignmentStatus(args.status) if args.status else None
+    if _format_of(args.source, args.source_format) == "db":
+        if not os.path.exists(args.source):
+            raise FileNotFoundError(f"Файл {args.source} не найден")
+        store = SqliteStore(args.source)
+        matches = (store.get(record_id) for record_id in store.query_ids(args.student, args.theme, status))
+    else:
+        store = None
+        matches = (assignment for assignment in
+                   read_records(args.source, errors, args.source_format, args.legacy, stats)
+                   if _matches(assignment, args.student, args.theme, status))
+    try:
+        for count, assignment in enumerate(matches, 1):
+            if args.limit is not None and count > args.limit:
+                break
+            _print_record(assignment, args.display)
+    finally:
+        if store is not None:
+            store.close()
+    return _exit_code(errors)
+
+
+def command_follow(args, errors: ErrorReport, stats: Optional[LoadStats]) -> int:
+    """Print records as they are appended to a text file, like ``tail -F``.
+
+    Runs until interrupted. When the file is rotated, truncated or rewritten
+    it is printed again from the start, with a notice on stderr.
+    """
+    follower = FileFollower(args.source)
+    update = follower.poll()
+    if args.new_only:
+        update = FollowUpdate()
+    try:
+        while True:
+            for assignment in update.assignments:
+                _print_record(assignment, args.display)
+            for line_number, message in update.errors:
+                errors.add(line_number, ValueError(message))
+            sys.stdout.flush()
+            time.sleep(args.interval)
+            try:
+                update = follower.poll()
+            except FileNotFoundError:
+                # Rotated away; keep waiting for the new file to appear.
+                update = FollowUpdate()
+                continue
+            if update.reloaded:
+                print(f"Файл {args.source} заменён или усечён, чтение с начала", file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
+    return _exit_code(errors)
+
+
+def _print_record(assignment, display: bool) -> None:
+    if display:
+        print(assignment)
+    else:
+        sys.stdout.write(Distributor.format_record(assignment))
+
+
+def command_stats(args, errors: ErrorReport, stats: Optional[LoadStats]) -> int:
+    """Print grade aggregates for the whole input or per student/theme."""
+    total = GradeAggregate()
+    groups: Dict[str, GradeAggregate] = {}
+    for assignment in read_records(args.source, errors, args.source_format, args.legacy, stats):
+        total.add(assignment.status, assignment.grade)
+        if args.by:
+            key = assignment.student_name if args.by == "student" else assignment.theme_name
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = GradeAggregate()
+            group.add(assignment.status, assignment.grade)
+    rows = [("Всего", total)] + sorted(groups.items())
+    if args.json:
+        json.dump({name: _aggregate_dict(aggregate) for name, aggregate in rows},
+                  sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print("\t".join(("Группа", "Заданий", "Оценок", "Средняя", "Мин", "Макс", "Ст. откл.")
+                        + tuple(status.value for status in AssignmentStatus)))
+        for name, aggregate in rows:
+            values = _aggregate_dict(aggregate)
+            print("\t".join([name] + ["" if values[key] is None else _number(values[key])
+                                      for key in ("size", "count", "mean", "min", "max", "std")]
+                            + [str(values["statuses"][status.value]) for status in AssignmentStatus]))
+    return _exit_code(errors)
+
+
+def _aggregate_dict(aggregate: GradeAggregate) -> dict:
+    variance = aggregate.variance
+    return {
+        "size": aggregate.size,
+        "count": aggregate.count,
+        "mean": aggregate.mean,
+        "min": aggregate.min,
+        "max": aggregate.max,
+        "std": None if variance is None else variance ** 0.5,
+        "statuses": {status.value: aggregate.statuses[status] for status in AssignmentStatus},
+    }
+
+
+def _number(value) -> str:
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser with one subcommand per operation."""
+    parser = argparse.ArgumentParser(
+        description="Пакетная обработка заданий курса без графического интерфейса",
+        epilog="Коды выхода: 0 - успешно, 1 - есть некорректные строки, 2 - ошибка.")
+    parser.add_argument("--stats", action="store_true", help="вывести статистику загрузки в stderr")
+    parser.add_argument("--profile", action="store_true", help="вывести профиль cProfile в stderr")
+    parser.add_argument("--show-errors", type=int, default=10, metavar="N",
+                        help="сколько некорректных строк показать (по умолчанию 10)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_source(command: argparse.ArgumentParser) -> None:
+        command.add_argument("source", help="входной файл (.txt, .snap, .db) или - для stdin")
+        command.add_argument("--from", dest="source_format", choices=("txt", "snap", "db"),
+                             help="формат входа (по умолчанию по расширению)")
+        command.add_argument("--legacy", action="store_true", help="текст в формате из 3 полей (1.py)")
+
+    command = commands.add_parser("validate", help="проверить файл и посчитать ошибки")
+    add_source(command)
+    command.set_defaults(handler=command_validate)
+
+    command = commands.add_parser("import", help="добавить записи в базу SQLite")
+    add_source(command)
+    command.add_argument("database", help="файл базы SQLite")
+    command.set_defaults(handler=command_import)
+
+    command = commands.add_parser("convert", help="преобразовать между форматами")
+    add_source(command)
+    command.add_argument("target", help="выходной файл (.txt, .snap, .db) или - для stdout")
+    command.add_argument("--to", dest="target_format", choices=("txt", "snap", "db"),
+                         help="формат выхода (по умолчанию по расширению)")
+    command.set_defaults(handler=command_convert)
+
+    command = commands.add_parser("ingest", help="параллельно загрузить много файлов")
+    command.add_argument("sources", nargs="+", help="файлы, каталоги или шаблоны (например, 'groups/**/*.txt')")
+    command.add_argument("--into", dest="target", help="куда сохранить объединённые записи (.txt, .snap, .db, -)")
+    command.add_argument("--to", dest="target_format", choices=("txt", "snap", "db"),
+                         help="формат выхода (по умолчанию по расширению)")
+    command.add_argument("--pattern", default="*.txt", help="шаблон файлов в каталогах (по умолчанию *.txt)")
+    command.add_argument("--workers", type=int, help="процессов для разбора (по умолчанию по числу ядер)")
+    command.add_argument("--errors-dir", help="каталог для журналов ошибок по каждому файлу")
+    command.set_defaults(handler=command_ingest)
+
+    command = commands.add_parser("query", help="вывести записи по фильтрам")
+    add_source(command)
+    command.add_argument("--student", help="ФИО студента")
+    command.add_argument("--theme", help="тема")
+    command.add_argument("--status", choices=[status.value for status in AssignmentStatus])
+    command.add_argument("--limit", type=int, help="не больше N записей")
+    command.add_argument("--display", action="store_true", help="человекочитаемый вывод")
+    command.set_defaults(handler=command_query)
+
+    command = commands.add_parser("follow", help="выводить новые записи по мере дописывания файла")
+    command.add_argument("source", help="текстовый файл заданий")
+    command.add_argument("--interval", type=float, default=1.0, help="период опроса в секундах (по умолчанию 1)")
+    command.add_argument("--new-only", action="store_true", help="не выводить уже имеющиеся записи")
+    command.add_argument("--display", action="store_true", help="человекочитаемый вывод")
+    command.set_defaults(handler=command_follow)
+
+    command = commands.add_parser("stats", help="статистика оценок")
+    add_source(command)
+    command.add_argument("--by", choices=("student", "theme"), help="группировка")
+    command.add_argument("--json", action="store_true", help="вывод в JSON")
+    command.set_defaults(handler=command_stats)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run one command and return its exit code."""
+    args = build_parser().parse_args(argv)
+    errors = ErrorReport(args.show_errors)
+    stats = LoadStats(args.command) if args.stats else None
+    handler: Callable = args.handler
+    try:
+        with profiled() if args.profile else nullcontext():
+            code = handler(args, errors, stats)
+    except BrokenPipeError:
+        # The reader (e.g. ``head``) went away; silence the final flush.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXIT_FAILURE
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return EXIT_FAILURE
+    if stats is not None:
+        if not stats.elapsed:
+            stats.finish()
+        print(stats.summary(), file=sys.stderr)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
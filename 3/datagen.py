@@ -0,0 +1,79 @@
+import argparse
+import random
+from datetime import date, timedelta
+from typing import Iterator
+
+from models import AssignmentStatus
+
+
+_SURNAMES = ("Иванов", "Петров", "Сидоров", "Кузнецов", "Лебедев", "Тихонов", "Смирнов", "Попов",
+             "Васильев", "Соколов", "Михайлов", "Новиков", "Фёдоров", "Морозов", "Волков", "Алексеев")
+_INITIALS = "АБВГДЕИКЛМНОПРСТ"
+_THEMES = ("Введение в Python", "Работа с файлами", "ООП", "Тесты", "Система мониторинга",
+           "Автоматизация учёта", "Модель прогнозирования", "Анализ данных",
+           "Разработка веб-приложения", "Базы данных", "Сетевое программирование", "Алгоритмы")
+# Broken lines of the kinds found in input.txt and test.txt.
+_MALFORMED = (
+    'invalid line',
+    '912309 1291 ',
+    '"{name}"  "{theme}"',
+    '"{name}" "{theme}" invalid_date Pending ""',
+    '"{name}" "{theme}" {date} Invalid 100',
+    '"{name}" "{theme}" 2025.13.01 Pending ""',
+    '"" "" {date} Pending ""',
+)
+_FIRST_DAY = date(2023, 9, 1)
+
+
+def generate_lines(count: int, fields: int = 5, malformed: float = 0.0, students: int = 1000,
+                   seed: int = 0) -> Iterator[str]:
+    """Yield ``count`` deterministic assignment lines (without line breaks).
+
+    ``fields=3`` produces the ``1.py`` format (name, theme, date); ``fields=5``
+    adds status and grade as read by ``2/`` and ``3/``. About ``malformed`` of
+    the lines are broken in one of the ways seen in real input files.
+    """
+    if fields not in (3, 5):
+        raise ValueError("Поддерживаются форматы из 3 и 5 полей")
+    rng = random.Random(seed)
+    names = [f"{_SURNAMES[i % len(_SURNAMES)]} {_INITIALS[i // len(_SURNAMES) % len(_INITIALS)]}."
+             f"{_INITIALS[i // (len(_SURNAMES) * len(_INITIALS)) % len(_INITIALS)]}. {i}"
+             for i in range(students)]
+    statuses = [status.value for status in AssignmentStatus]
+    for _ in range(count):
+        name = rng.choice(names)
+        theme = rng.choice(_THEMES)
+        issue_date = (_FIRST_DAY + timedelta(days=rng.randrange(730))).strftime("%Y.%m.%d")
+        if malformed and rng.random() < malformed:
+            yield rng.choice(_MALFORMED).format(name=name, theme=theme, date=issue_date)
+        elif fields == 3:
+            yield f'"{name}"  "{theme}" {issue_date}'
+        else:
+            status = rng.choice(statuses)
+            grade = f'{rng.randrange(101)}.0' if status == AssignmentStatus.GRADED.value else '""'
+            yield f'"{name}" "{theme}" {issue_date} {status} {grade}'
+
+
+def write_file(file_path: str, count: int, fields: int = 5, malformed: float = 0.0,
+               students: int = 1000, seed: int = 0) -> None:
+    """Write ``generate_lines`` output to a UTF-8 file, one line each."""
+    with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as file:
+        for line in generate_lines(count, fields, malformed, students, seed):
+            file.write(line + "\n")
+
+
+def main():
+    """Command-line entry point: write a synthetic assignments file."""
+    parser = argparse.ArgumentParser(description="Генерация тестового файла заданий")
+    parser.add_argument("output", help="путь к создаваемому файлу")
+    parser.add_argument("-n", "--count", type=int, default=1000, help="количество строк")
+    parser.add_argument("--fields", type=int, choices=(3, 5), default=5, help="формат строки")
+    parser.add_argument("--malformed", type=float, default=0.0, help="доля ошибочных строк")
+    parser.add_argument("--students", type=int, default=1000, help="количество разных студентов")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_file(args.output, args.count, args.fields, args.malformed, args.students, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,71 @@
+import io
+import os
 import re
-from datetime import datetime
-from typing import List
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 from models import Assignment, AssignmentStatus, Course
 from file_logger import FileLogger
+from instrumentation import LoadStats
+from interning import InternPool
+
+
+_TOKEN_PATTERN = re.compile(r'"[^"]*"|\d{4}\.\d{2}\.\d{2}|\S+')
+_DATE_PREFIX_PATTERN = re.compile(r'\d{4}\.\d{2}\.\d{2}')
+# Well-formed record: the fast path handles it in a single match. Anything else
+# falls back to the token-by-token parser, which produces the detailed errors.
+_RECORD_PATTERN = re.compile(
+    r'"(?P<name>[^"]+)"\s+"(?P<theme>[^"]+)"\s+'
+    r'(?P<date>[0-9]{4}\.[0-9]{2}\.[0-9]{2})\s+'
+    r'(?P<status>\S+)\s+'
+    r'(?P<grade>""|[0-9]+(?:\.[0-9]*)?|\.[0-9]+)'
+)
+# Three-field line of the original ``1.py`` format: name, theme, issue date.
+_LEGACY_PATTERN = re.compile(r'"(?P<name>[^"]+)"\s+"(?P<theme>[^"]+)"\s+(?P<date>[0-9]{4}\.[0-9]{2}\.[0-9]{2})')
+_STATUS_BY_VALUE = {status.value: status for status in AssignmentStatus}
+_PROGRESS_LINES = 4096
+_SAVE_BATCH = 10000
+_SAVE_BUFFER = 1 << 20
+
+
+def _parse_ordinal(value: str) -> int:
+    """Decode a fixed-width YYYY.MM.DD date into a day ordinal without strptime."""
+    return date(int(value[0:4]), int(value[5:7]), int(value[8:10])).toordinal()
+
+
+def _split_ranges(file_path: str, parts: int) -> List[Tuple[int, int]]:
+    """Split a file into up to ``parts`` byte ranges that end on a newline."""
+    size = os.path.getsize(file_path)
+    step = max(size // parts, 1)
+    ranges = []
+    start = 0
+    with open(file_path, 'rb') as file:
+        while start < size:
+            end = start + step
+            if end >= size:
+                end = size
+            else:
+                file.seek(end)
+                file.readline()
+                end = min(file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _parse_chunk(file_path: str, start: int, end: int) -> Tuple[int, list]:
+    """Parse one byte range of a file in a worker process.
+
+    Returns ``Distributor.parse_rows`` for the range, so line numbers are
+    local to it.
+    """
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return Distributor.parse_rows(data)
 
 
 class Distributor:
@@ -15,9 +78,9 @@ class Distributor:
                 return None
             if value.startswith('"') and value.endswith('"'):
                 return value.strip('"')
-            if re.match(r'\d{4}\.\d{2}\.\d{2}', value):
+            if _DATE_PREFIX_PATTERN.match(value):
                 return datetime.strptime(value, '%Y.%m.%d')
-            if value in [status.value for status in AssignmentStatus]:
+            if value in _STATUS_BY_VALUE:
                 return value
             if value.replace('.', '', 1).isdigit():
                 return float(value)
@@ -26,68 +89,359 @@ class Distributor:
             raise ValueError(f"Ошибка парсинга значения: {value}") from e
 
     @staticmethod
-    def create_from_string(description: str, course: Course, logger: FileLogger) -> Assignment:
-        """Create an assignment from a string description."""
+    def parse_bytes(data: bytes) -> Tuple[int, list]:
+        """Parse a block of UTF-8 lines, e.g. in a worker process.
+
+        Returns the number of lines and, in order, either the parsed
+        assignment or ``(line_number, description, message)``. Names and
+        themes repeated within the block share one object, which keeps the
+        block small when it is pickled back from a worker.
+        """
+        strings = InternPool()
+        results = []
+        line_count = 0
+        for line_count, line in enumerate(io.StringIO(data.decode('utf-8'), newline=None), 1):
+            description = line.strip()
+            if not description:
+                continue
+            try:
+                assignment = Distributor.parse_record(description)
+                assignment.student_name = strings.intern(assignment.student_name)
+                assignment.theme_name = strings.intern(assignment.theme_name)
+                results.append(assignment)
+            except ValueError as e:
+                results.append((line_count, description, str(e)))
+        return line_count, results
+
+    @staticmethod
+    def parse_rows(data: bytes) -> Tuple[int, list]:
+        """``parse_bytes`` for worker processes.
+
+        Records are returned as ``(name, theme, ordinal, status, grade)``
+        tuples, which unpickle about four times faster than ``Assignment``
+        objects; errors keep the ``(line_number, description, message)`` form.
+        """
+        line_count, results = Distributor.parse_bytes(data)
+        return line_count, [(result.student_name, result.theme_name, result.issue_ordinal, result.status, result.grade)
+                            if isinstance(result, Assignment) else result for result in results]
+
+    @staticmethod
+    def parse_record(description: str, lap: Optional[Callable[[Optional[str]], None]] = None) -> Assignment:
+        """Build an assignment from a string description without touching a course.
+
+        ``lap`` (``LoadStats.lap``) is called with the name of each parsing
+        stage as it ends, to time the stages.
+        """
+        match = _RECORD_PATTERN.fullmatch(description)
+        if lap is not None:
+            lap('tokenize')
+        if match is not None:
+            status = _STATUS_BY_VALUE.get(match.group('status'))
+            if status is not None:
+                try:
+                    issue_date = _parse_ordinal(match.group('date'))
+                except ValueError:
+                    issue_date = None
+                if lap is not None:
+                    lap('date')
+                if issue_date is not None:
+                    grade = match.group('grade')
+                    assignment = Assignment(match.group('name'), match.group('theme'),
+                                            issue_date, status, None if grade == '""' else float(grade))
+                    if lap is not None:
+                        lap('validate')
+                    return assignment
         try:
-            tokens = re.findall(r'"[^"]*"|\d{4}\.\d{2}\.\d{2}|\S+', description)
-            if len(tokens) != 5:
-                raise ValueError(f"Ожидалось 5 значений (ФИО, тема, дата, статус, оценка), получено: {len(tokens)}")
-            parsed_values = [Distributor.parse_value(token) for token in tokens]
-            student_name, theme_name, issue_date, status_str, grade = parsed_values
-
-            if not isinstance(student_name, str) or not student_name:
-                raise ValueError("ФИО должно быть непустой строкой")
-            if not isinstance(theme_name, str) or not theme_name:
-                raise ValueError("Тема должна быть непустой строкой")
-            if not isinstance(issue_date, datetime):
-                raise ValueError("Дата должна быть в формате ГГГГ.ММ.ДД")
-            if grade is not None and not isinstance(grade, float):
-                raise ValueError("Оценка должна быть числом или пустой")
-
-            # Convert status string to AssignmentStatus
-            for status in AssignmentStatus:
-                if status.value == status_str:
-                    assignment = Assignment(student_name, theme_name, issue_date, status, grade)
-                    break
-            else:
-                raise ValueError(f"Недопустимый статус: {status_str}")
+            return Distributor._parse_tokens(description)
+        finally:
+            if lap is not None:
+                lap('fallback')
+
+    @staticmethod
+    def parse_legacy_record(description: str) -> Assignment:
+        """Build a pending assignment from a three-field line of the ``1.py`` format."""
+        match = _LEGACY_PATTERN.fullmatch(description)
+        if match is None:
+            raise ValueError("Ожидалось 3 значения (ФИО, тема, дата выдачи)")
+        try:
+            issue_date = _parse_ordinal(match.group('date'))
+        except ValueError:
+            raise ValueError("Дата должна быть в формате ГГГГ.ММ.ДД") from None
+        return Assignment(match.group('name'), match.group('theme'), issue_date)
+
+    @staticmethod
+    def _parse_tokens(description: str) -> Assignment:
+        """Token-by-token parser used for lines the fast path does not accept."""
+        tokens = _TOKEN_PATTERN.findall(description)
+        if len(tokens) != 5:
+            raise ValueError(f"Ожидалось 5 значений (ФИО, тема, дата, статус, оценка), получено: {len(tokens)}")
+        parsed_values = [Distributor.parse_value(token) for token in tokens]
+        student_name, theme_name, issue_date, status_str, grade = parsed_values
+
+        if not isinstance(student_name, str) or not student_name:
+            raise ValueError("ФИО должно быть непустой строкой")
+        if not isinstance(theme_name, str) or not theme_name:
+            raise ValueError("Тема должна быть непустой строкой")
+        if not isinstance(issue_date, datetime):
+            raise ValueError("Дата должна быть в формате ГГГГ.ММ.ДД")
+        if grade is not None and not isinstance(grade, float):
+            raise ValueError("Оценка должна быть числом или пустой")
+
+        status = _STATUS_BY_VALUE.get(status_str)
+        if status is None:
+            raise ValueError(f"Недопустимый статус: {status_str}")
+        return Assignment(student_name, theme_name, issue_date, status, grade)
+
+    @staticmethod
+    def create_from_string(description: str, course: Course, logger: FileLogger,
+                           stats: Optional[LoadStats] = None) -> Assignment:
+        """Create an assignment from a string description.
 
-            course.add_assignment(assignment)
-            return assignment
+        With ``stats`` the call is counted and timed; the caller owns the
+        object and calls ``stats.finish()`` when its batch of lines is done.
+        """
+        lap = None
+        if stats is not None:
+            stats.lines += 1
+            stats.bytes += len(description.encode('utf-8'))
+            lap = stats.lap
+            lap(None)
+        try:
+            assignment = Distributor.parse_record(description, lap)
         except ValueError as e:
+            if stats is not None:
+                stats.errors += 1
             logger.log_error(f"Ошибка обработки строки: '{description}'. Причина: {str(e)}")
+            if lap is not None:
+                lap('log')
             raise
+        course.add_assignment(assignment)
+        if stats is not None:
+            lap('add')
+            stats.records += 1
+        return assignment
 
     @staticmethod
-    def create_from_file(file_path: str, course: Course) -> List[Assignment]:
-        """Read assignments from a file, skipping invalid lines."""
-        assignments = []
-        logger = FileLogger("error.log")
+    def iter_from_file(file_path: str, course: Optional[Course] = None,
+                       logger: Optional[FileLogger] = None,
+                       yield_errors: bool = False,
+                       on_progress: Optional[Callable[[int], None]] = None,
+                       stats: Optional[LoadStats] = None
+                       ) -> Iterator[Union[Assignment, Tuple[int, ValueError]]]:
+        """Lazily yield assignments from a file, one line at a time.
+
+        Only the current line is held in memory. Assignments are attached to
+        ``course`` when one is given; invalid lines are logged when a logger is
+        given and yielded as ``(line_number, error)`` pairs if ``yield_errors``.
+        ``on_progress`` is called every few thousand lines with the number of
+        bytes read so far (rounded up to the reader's buffer). ``stats``
+        switches on counters and stage timings; it is finished when the file
+        has been read.
+        """
+        try:
+            file = open(file_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            if logger is not None:
+                logger.log_error(f"Файл не найден: {file_path}")
+            raise FileNotFoundError(f"Файл {file_path} не найден")
+        with file:
+            yield from Distributor.iter_from_stream(file, course, logger, yield_errors, on_progress, stats)
+
+    @staticmethod
+    def iter_from_stream(file: TextIO, course: Optional[Course] = None,
+                         logger: Optional[FileLogger] = None,
+                         yield_errors: bool = False,
+                         on_progress: Optional[Callable[[int], None]] = None,
+                         stats: Optional[LoadStats] = None
+                         ) -> Iterator[Union[Assignment, Tuple[int, ValueError]]]:
+        """Like ``iter_from_file``, but reads an already open text stream such as stdin.
+
+        The stream is not closed. ``on_progress`` needs a seekable stream.
+        With ``stats``, time spent by the consumer between items is not
+        counted in any stage.
+        """
+        lap = None
+        if stats is not None:
+            lap = stats.lap
+            lap(None)
+        for line_number, line in enumerate(file, 1):
+            if lap is not None:
+                lap('read')
+                stats.lines = line_number
+            if on_progress is not None and not line_number % _PROGRESS_LINES:
+                on_progress(file.buffer.tell())
+            description = line.strip()
+            if not description:
+                continue
+            try:
+                assignment = Distributor.parse_record(description, lap)
+            except ValueError as e:
+                if stats is not None:
+                    stats.errors += 1
+                if logger is not None:
+                    logger.log_error(f"Пропущена строка {line_number}: '{description}'. "
+                                     f"Причина: {str(e)}")
+                    if lap is not None:
+                        lap('log')
+                if yield_errors:
+                    yield line_number, e
+                    if lap is not None:
+                        lap(None)
+                continue
+            if course is not None:
+                course.add_assignment(assignment)
+                if lap is not None:
+                    lap('add')
+            if stats is not None:
+                stats.records += 1
+            yield assignment
+            if lap is not None:
+                lap(None)
+        if stats is not None:
+            try:
+                stats.bytes = file.buffer.tell()
+            except (AttributeError, OSError):
+                pass  # Pipes cannot report a position.
+            stats.finish()
+
+    @staticmethod
+    def create_from_file(file_path: str, course: Course, workers: Optional[int] = None,
+                         stats: Optional[LoadStats] = None) -> List[Assignment]:
+        """Read assignments from a file, skipping invalid lines.
+
+        With ``workers`` above one the file is split into newline-aligned byte
+        ranges parsed in a process pool; results are merged in file order.
+        ``stats`` collects counters and stage timings (see ``LoadStats``); in
+        parallel mode time spent waiting for the workers is the ``parse`` stage.
+        """
+        with FileLogger("error.log", buffered=True) as logger:
+            if workers is None or workers <= 1:
+                return list(Distributor.iter_from_file(file_path, course, logger, stats=stats))
+            return Distributor._create_from_file_parallel(file_path, course, logger, workers, stats)
+
+    @staticmethod
+    def _create_from_file_parallel(file_path: str, course: Course, logger: FileLogger,
+                                   workers: int, stats: Optional[LoadStats] = None) -> List[Assignment]:
+        """Parse byte ranges in worker processes and merge them in order.
+
+        Workers return plain tuples (see ``parse_rows``); the assignments are
+        built here, in the parent.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line_number, line in enumerate(file, 1):
-                    if line.strip():
-                        try:
-                            assignment = Distributor.create_from_string(line.strip(), course, logger)
-                            assignments.append(assignment)
-                        except ValueError as e:
-                            logger.log_error(f"Пропущена строка {line_number}: {str(e)}")
-                            continue
+            ranges = _split_ranges(file_path, workers * 4)
         except FileNotFoundError:
             logger.log_error(f"Файл не найден: {file_path}")
             raise FileNotFoundError(f"Файл {file_path} не найден")
+        assignments = []
+        line_offset = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(_parse_chunk, [file_path] * len(ranges),
+                                  [start for start, _ in ranges], [end for _, end in ranges])
+            if stats is not None:
+                chunks = Distributor._timed_chunks(chunks, stats)
+            add = course.add_assignment
+            for line_count, results in chunks:
+                for result in results:
+                    if len(result) == 5:
+                        assignment = Assignment(*result)
+                        add(assignment)
+                        assignments.append(assignment)
+                        continue
+                    line_number, description, message = result
+                    logger.log_error(f"Пропущена строка {line_offset + line_number}: '{description}'. "
+                                     f"Причина: {message}")
+                line_offset += line_count
+        if stats is not None:
+            stats.lines = line_offset
+            stats.records = len(assignments)
+            stats.bytes = ranges[-1][1] if ranges else 0
+            stats.finish()
         return assignments
 
     @staticmethod
-    def save_to_file(file_path: str, course: Course) -> None:
-        """Save all assignments from the course to a file."""
+    def _timed_chunks(chunks: Iterator[Tuple[int, list]], stats: LoadStats) -> Iterator[Tuple[int, list]]:
+        """Pass worker results through, timing the wait as ``parse`` and the merge as ``add``."""
+        clock = time.perf_counter
+        while True:
+            start = clock()
+            try:
+                line_count, results = next(chunks)
+            except StopIteration:
+                return
+            resumed = clock()
+            stats.add_time('parse', resumed - start)
+            stats.errors += sum(len(result) == 3 for result in results)
+            yield line_count, results
+            stats.add_time('add', clock() - resumed)
+
+    @staticmethod
+    def format_record(assignment: Assignment) -> str:
+        """Format an assignment as one line of the text format."""
+        grade_str = str(assignment.grade) if assignment.grade is not None else '""'
+        return (f'"{assignment.student_name}" "{assignment.theme_name}" '
+                f'{assignment.date_text} '
+                f'{assignment.status.value} {grade_str}\n')
+
+    @staticmethod
+    def save_to_file(file_path: str, course: Course, fsync: bool = False,
+                     stats: Optional[LoadStats] = None) -> None:
+        """Save all assignments from the course to a file.
+
+        Lines are formatted in batches of ``_SAVE_BATCH`` and written into a
+        temporary file next to the target, which then replaces it with
+        ``os.replace``, so readers see either the old file or the new one.
+        ``fsync`` forces the data to disk before the replace. ``stats`` times
+        the ``format`` and ``write`` stages per batch.
+        """
+        Distributor.save_records(file_path, course.get_assignments(), fsync, stats)
+
+    @staticmethod
+    def save_records(file_path: str, assignments: Iterable[Assignment], fsync: bool = False,
+                     stats: Optional[LoadStats] = None) -> None:
+        """Save any iterable of assignments the way ``save_to_file`` saves a course."""
+        clock = time.perf_counter
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                for assignment in course.get_assignments():
-                    grade_str = f'"{assignment.grade}"' if assignment.grade is not None else '""'
-                    line = (f'"{assignment.student_name}" "{assignment.theme_name}" '
-                            f'{assignment.issue_date.strftime("%Y.%m.%d")} '
-                            f'{assignment.status.value} {grade_str}\n')
-                    file.write(line)
+            try:
+                with open(temp_path, 'w', encoding='utf-8', buffering=_SAVE_BUFFER) as file:
+                    Distributor.write_records(file, assignments, stats)
+                    start = clock()
+                    if fsync:
+                        file.flush()
+                        os.fsync(file.fileno())
+                if os.path.exists(file_path):
+                    shutil.copymode(file_path, temp_path)
+                os.replace(temp_path, file_path)
+                if stats is not None:
+                    stats.add_time('write', clock() - start)
+                    stats.lines = stats.records
+                    stats.bytes = os.path.getsize(file_path)
+                    stats.finish()
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
         except IOError as e:
-            raise IOError(f"Ошибка записи в файл {file_path}: {e}") from e
\ No newline at end of file
+            raise IOError(f"Ошибка записи в файл {file_path}: {e}") from e
+
+    @staticmethod
+    def write_records(file: TextIO, assignments: Iterable[Assignment],
+                      stats: Optional[LoadStats] = None) -> int:
+        """Write assignments to an open text stream in batches; return how many were written."""
+        clock = time.perf_counter
+        assignments = iter(assignments)
+        written = 0
+        while True:
+            start = clock() if stats is not None else 0.0
+            batch = list(map(Distributor.format_record, islice(assignments, _SAVE_BATCH)))
+            if not batch:
+                return written
+            if stats is not None:
+                formatted = clock()
+                stats.add_time('format', formatted - start)
+                file.write(''.join(batch))
+                stats.add_time('write', clock() - formatted)
+                stats.records += len(batch)
+            else:
+                file.write(''.join(batch))
+            written += len(batch)
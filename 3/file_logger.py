@@ -1,17 +1,195 @@
+import os
+import queue
+import threading
+import time
 from datetime import datetime
+from typing import Dict, List, Optional
+
+
+# Most distinct messages remembered for deduplication at a time.
+_DEDUP_LIMIT = 10000
 
 
 class FileLogger:
-    """Class for logging errors to a file."""
-    def __init__(self, log_file: str):
-        """Initialize the logger with a log file path."""
+    """Class for logging errors to a file.
+
+    By default every message is appended synchronously. With ``buffered=True``
+    messages go to an in-memory queue drained by a background thread that
+    writes them in batches, flushing on ``batch_size`` messages, every
+    ``flush_interval`` seconds and on ``flush()``/``close()``.
+    """
+    def __init__(self, log_file: str, buffered: bool = False, batch_size: int = 1000,
+                 flush_interval: float = 1.0, max_bytes: int = 0, backup_count: int = 3,
+                 dedup_window: float = 0.0):
+        """Initialize the logger with a log file path.
+
+        ``max_bytes`` enables size-based rotation into ``log_file.1`` ...
+        ``log_file.<backup_count>``. ``dedup_window`` suppresses repeats of the
+        same message within that many seconds and reports how many were dropped;
+        messages whose window has passed are forgotten, and at most
+        ``_DEDUP_LIMIT`` distinct messages are remembered.
+        """
         self.log_file = log_file
+        self.buffered = buffered
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dedup_window = dedup_window
+        self._last_seen: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._write_lock = threading.Lock()
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        if buffered:
+            self._queue = queue.Queue()
+            self._worker = threading.Thread(target=self._drain, name="FileLogger", daemon=True)
+            self._worker.start()
 
     def log_error(self, message: str) -> None:
         """Log an error message to the file with a timestamp."""
+        if self.dedup_window > 0 and self._is_repeat(message):
+            return
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        line = f"[{timestamp}] {message}\n"
+        if self._queue is not None:
+            self._queue.put(line)
+        else:
+            self._write([line])
+
+    def flush(self) -> None:
+        """Write out everything queued so far (buffered mode only).
+
+        If the background writer has died, the queue is written out here.
+        """
+        if self._queue is not None:
+            done = threading.Event()
+            self._queue.put(done)
+            while not done.wait(0.1):
+                if not self._worker.is_alive():
+                    self._write_queued()
+                    return
+
+    def close(self) -> None:
+        """Flush pending messages and stop the background writer."""
+        self._report_suppressed()
+        if self._queue is not None and self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._write_queued()
+            self._queue = None
+            self._worker = None
+
+    def __enter__(self) -> "FileLogger":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _is_repeat(self, message: str) -> bool:
+        """Check a message against the dedup window, counting suppressed repeats."""
+        now = time.monotonic()
+        self._forget_expired(now)
+        last = self._last_seen.get(message)
+        if last is not None and now - last < self.dedup_window:
+            self._suppressed[message] = self._suppressed.get(message, 0) + 1
+            return True
+        # Re-inserted so that the dict stays ordered by time last logged.
+        self._last_seen.pop(message, None)
+        self._last_seen[message] = now
+        count = self._suppressed.pop(message, 0)
+        if count:
+            self._log_suppressed(message, count)
+        return False
+
+    def _forget_expired(self, now: float) -> None:
+        """Drop messages whose window has passed, oldest first, reporting their repeats."""
+        last_seen = self._last_seen
+        while last_seen:
+            message = next(iter(last_seen))
+            if now - last_seen[message] < self.dedup_window and len(last_seen) < _DEDUP_LIMIT:
+                return
+            del last_seen[message]
+            count = self._suppressed.pop(message, 0)
+            if count:
+                self._log_suppressed(message, count)
+
+    def _log_suppressed(self, message: str, count: int) -> None:
+        """Record how many repeats of a message were dropped by deduplication."""
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        line = f"[{timestamp}] Повтор подавлен {count} раз: {message}\n"
+        if self._queue is not None:
+            self._queue.put(line)
+        else:
+            self._write([line])
+
+    def _report_suppressed(self) -> None:
+        """Flush the suppressed-repeat counters into the log."""
+        suppressed, self._suppressed = self._suppressed, {}
+        for message, count in suppressed.items():
+            self._log_suppressed(message, count)
+
+    def _write_queued(self) -> None:
+        """Write lines left in the queue without the background thread."""
+        lines = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, str) and item:
+                lines.append(item)
+            elif isinstance(item, threading.Event):
+                item.set()
+        if lines:
+            self._write(lines)
+
+    def _drain(self) -> None:
+        """Background thread: collect queued lines and write them in batches."""
+        batch: List[str] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = ""
+            if isinstance(item, str) and item:
+                batch.append(item)
+                if len(batch) < self.batch_size and time.monotonic() < deadline:
+                    continue
+            if batch:
+                self._write(batch)
+                batch = []
+            deadline = time.monotonic() + self.flush_interval
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                return
+
+    def _write(self, lines: List[str]) -> None:
+        """Append lines to the log file, rotating it when it grows too large."""
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as file:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                file.write(f"[{timestamp}] {message}\n")
+            with self._write_lock:
+                if self.max_bytes > 0:
+                    self._rotate_if_needed(sum(len(line.encode('utf-8')) for line in lines))
+                with open(self.log_file, 'a', encoding='utf-8') as file:
+                    file.writelines(lines)
         except IOError as e:
-            print(f"Ошибка записи в лог: {e}")
\ No newline at end of file
+            print(f"Ошибка записи в лог: {e}")
+
+    def _rotate_if_needed(self, incoming: int) -> None:
+        """Shift log_file -> log_file.1 -> ... when the size limit is reached."""
+        try:
+            size = os.path.getsize(self.log_file)
+        except OSError:
+            return
+        if size == 0 or size + incoming <= self.max_bytes:
+            return
+        if self.backup_count <= 0:
+            os.remove(self.log_file)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.log_file}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.log_file}.{index + 1}")
+        os.replace(self.log_file, f"{self.log_file}.1")
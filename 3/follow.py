@@ -0,0 +1,151 @@
+import os
+from typing import Callable, List, Optional, Tuple
+
+from distributor import Distributor
+from file_logger import FileLogger
+from models import Assignment, Course
+
+
+_CHUNK_SIZE = 1 << 20
+# Bytes at the start of the file and before the offset remembered to
+# notice a file rewritten in place.
+_FINGERPRINT = 64
+
+
+class FollowUpdate:
+    """What one ``FileFollower.poll`` found.
+
+    ``assignments`` are the new records, or all records of the file when
+    ``reloaded`` is set; ``errors`` are ``(line_number, message)`` pairs.
+    """
+
+    def __init__(self, reloaded: bool = False):
+        self.reloaded = reloaded
+        self.assignments: List[Assignment] = []
+        self.errors: List[Tuple[int, str]] = []
+
+    def __bool__(self) -> bool:
+        return self.reloaded or bool(self.assignments) or bool(self.errors)
+
+
+class FileFollower:
+    """Incremental reader for an assignments file that is appended to.
+
+    Remembers the device and inode of the file, its size and modification
+    time at the last poll, and the byte offset just past the last line
+    parsed. ``poll`` then parses only the bytes appended since; a line is
+    taken once its newline has been written, so an unterminated last line is
+    left unread (the offset stays before it) until the writer finishes it.
+    Use the ``Distributor`` loaders for a one-shot read that should include
+    such a line. If the file was replaced (new inode, as on
+    log rotation), truncated, or rewritten in place (noticed by comparing the
+    first bytes and the bytes before the offset), the whole file is read
+    again instead.
+
+    With a ``course`` new records are added to it, and a full reload builds a
+    course from ``storage_factory`` (the course's store type by default) and
+    swaps it in, so listeners get a single ``RELOADED``. The first poll is
+    such a reload. Without a course the follower only reports records.
+    """
+
+    def __init__(self, file_path: str, course: Optional[Course] = None,
+                 logger: Optional[FileLogger] = None, storage_factory: Optional[Callable[[], object]] = None):
+        self.file_path = file_path
+        self.course = course
+        self.logger = logger
+        self.storage_factory = storage_factory
+        self.offset = 0
+        self.line_number = 0
+        self.size = 0
+        self._identity: Optional[Tuple[int, int]] = None
+        self._mtime = 0
+        self._head = b''
+        self._fingerprint = b''
+
+    def poll(self) -> FollowUpdate:
+        """Parse whatever was appended since the last poll.
+
+        Raises:
+            FileNotFoundError: If the file does not exist (e.g. between a
+                rotation and the creation of the new file); the state is kept.
+        """
+        try:
+            file = open(self.file_path, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл {self.file_path} не найден")
+        with file:
+            info = os.fstat(file.fileno())
+            identity = (info.st_dev, info.st_ino)
+            if identity == self._identity and info.st_size == self.size and info.st_mtime_ns == self._mtime:
+                return FollowUpdate()
+            if identity != self._identity or info.st_size < self.offset or not self._same_prefix(file):
+                update = self._reload(file)
+            else:
+                update = FollowUpdate()
+                self._consume(file, update, self.course)
+            self._identity = identity
+            self.size = info.st_size
+            self._mtime = info.st_mtime_ns
+            return update
+
+    def _same_prefix(self, file) -> bool:
+        """Check that the start of the file and the bytes before the offset are unchanged."""
+        file.seek(0)
+        if file.read(len(self._head)) != self._head:
+            return False
+        file.seek(self.offset - len(self._fingerprint))
+        return file.read(len(self._fingerprint)) == self._fingerprint
+
+    def _reload(self, file) -> FollowUpdate:
+        """Read the file from the start into a fresh course and swap it in."""
+        self.offset = self.line_number = 0
+        self._head = self._fingerprint = b''
+        update = FollowUpdate(reloaded=True)
+        staging = None
+        if self.course is not None:
+            factory = self.storage_factory or type(self.course.store)
+            staging = Course(self.course.course_name, self.course.instructor, factory())
+        self._consume(file, update, staging)
+        if staging is not None:
+            self.course.swap_contents(staging)
+        return update
+
+    def _consume(self, file, update: FollowUpdate, course: Optional[Course]) -> None:
+        """Parse complete lines from the offset to the end of the file."""
+        file.seek(self.offset)
+        pending = b''
+        while True:
+            chunk = file.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            data = pending + chunk
+            end = data.rfind(b'\n') + 1
+            if not end:
+                pending = data
+                continue
+            self._parse(data[:end], update, course)
+            self._advance(data[:end])
+            pending = data[end:]
+
+    def _advance(self, data: bytes) -> None:
+        """Move the offset past parsed bytes and remember them for ``_same_prefix``."""
+        if len(self._head) < _FINGERPRINT:
+            self._head = (self._head + data)[:_FINGERPRINT]
+        self._fingerprint = (self._fingerprint + data)[-_FINGERPRINT:]
+        self.offset += len(data)
+
+    def _parse(self, data: bytes, update: FollowUpdate, course: Optional[Course]) -> None:
+        line_count, results = Distributor.parse_bytes(data)
+        for result in results:
+            if isinstance(result, Assignment):
+                if course is not None:
+                    course.add_assignment(result)
+                update.assignments.append(result)
+                continue
+            line_number, description, message = result
+            line_number += self.line_number
+            if self.logger is not None:
+                self.logger.log_error(f"Пропущена строка {line_number}: '{description}'. "
+                                      f"Причина: {message}")
+            update.errors.append((line_number, message))
+        self.line_number += line_count
@@ -0,0 +1,220 @@
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+from models import AssignmentStatus, ChangeKind, Course
+from storage import ColumnStore
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; recompute() falls back to pure Python.
+    np = None
+
+
+_PERCENTILES = (25, 50, 75, 90)
+_HISTOGRAM_BINS = 10
+
+
+class GradeAggregate:
+    """Running grade aggregates for one group of assignments.
+
+    Count, sum and sum of squares give the mean and variance in O(1); a
+    counter of grade values keeps min/max correct when grades are removed.
+    Status counts include ungraded assignments.
+    """
+    __slots__ = ('count', 'total', 'total_sq', 'statuses', '_values')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.statuses: Counter = Counter()
+        self._values: Counter = Counter()
+
+    def add(self, status: AssignmentStatus, grade: Optional[float]) -> None:
+        """Account for one assignment."""
+        self.statuses[status] += 1
+        if grade is not None:
+            self.count += 1
+            self.total += grade
+            self.total_sq += grade * grade
+            self._values[grade] += 1
+
+    def remove(self, status: AssignmentStatus, grade: Optional[float]) -> None:
+        """Undo ``add`` for one assignment."""
+        self.statuses[status] -= 1
+        if not self.statuses[status]:
+            del self.statuses[status]
+        if grade is not None:
+            self.count -= 1
+            self.total -= grade
+            self.total_sq -= grade * grade
+            self._values[grade] -= 1
+            if not self._values[grade]:
+                del self._values[grade]
+            if not self.count:
+                # Drop accumulated rounding error once the group is empty.
+                self.total = self.total_sq = 0.0
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Population variance of the grades."""
+        if not self.count:
+            return None
+        mean = self.total / self.count
+        return max(self.total_sq / self.count - mean * mean, 0.0)
+
+    @property
+    def min(self) -> Optional[float]:
+        return min(self._values) if self._values else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return max(self._values) if self._values else None
+
+    @property
+    def size(self) -> int:
+        """Number of assignments, graded or not."""
+        return sum(self.statuses.values())
+
+
+class GradeStatistics:
+    """Grade statistics for a course, kept current from its change events.
+
+    Aggregates exist for the whole course and per student and per theme.
+    Every add, removal, status or grade change adjusts them in O(1): the old
+    contribution of a record is undone from the course's notification sent
+    before the change, so no copy of the records is kept. A clear or reload
+    rebuilds them. ``recompute`` does a full pass over the grades for
+    verification, percentiles and a histogram.
+    """
+
+    def __init__(self, course: Course):
+        """Build the aggregates and subscribe to the course."""
+        self._course = course
+        self.course = GradeAggregate()
+        self.by_student: Dict[str, GradeAggregate] = {}
+        self.by_theme: Dict[str, GradeAggregate] = {}
+        self._rebuild()
+        course.subscribe(self._before_change, before=True)
+        course.subscribe(self._on_change)
+
+    def close(self) -> None:
+        """Stop following the course."""
+        self._course.unsubscribe(self._before_change, before=True)
+        self._course.unsubscribe(self._on_change)
+
+    def student(self, name: str) -> GradeAggregate:
+        """Aggregates for one student (empty if there are none)."""
+        return self.by_student.get(name) or GradeAggregate()
+
+    def theme(self, name: str) -> GradeAggregate:
+        """Aggregates for one theme (empty if there are none)."""
+        return self.by_theme.get(name) or GradeAggregate()
+
+    def recompute(self) -> dict:
+        """Full pass over the course grades, vectorized when NumPy is available.
+
+        Returns count, mean, min, max, variance, ``percentiles`` (25/50/75/90)
+        and ``histogram``: counts for ten equal bins over 0-100.
+        """
+        grades = self._grades()
+        if not len(grades):
+            return {'count': 0, 'mean': None, 'min': None, 'max': None, 'variance': None,
+                    'percentiles': {p: None for p in _PERCENTILES}, 'histogram': [0] * _HISTOGRAM_BINS}
+        if np is not None:
+            values = np.asarray(grades, dtype=float)
+            return {
+                'count': int(values.size),
+                'mean': float(values.mean()),
+                'min': float(values.min()),
+                'max': float(values.max()),
+                'variance': float(values.var()),
+                'percentiles': dict(zip(_PERCENTILES, map(float, np.percentile(values, _PERCENTILES)))),
+                'histogram': np.histogram(values, bins=_HISTOGRAM_BINS, range=(0, 100))[0].tolist(),
+            }
+        values = sorted(grades)
+        mean = math.fsum(values) / len(values)
+        histogram = [0] * _HISTOGRAM_BINS
+        for value in values:
+            histogram[min(int(value * _HISTOGRAM_BINS / 100), _HISTOGRAM_BINS - 1)] += 1
+        return {
+            'count': len(values),
+            'mean': mean,
+            'min': values[0],
+            'max': values[-1],
+            'variance': math.fsum((value - mean) ** 2 for value in values) / len(values),
+            'percentiles': {p: _percentile(values, p) for p in _PERCENTILES},
+            'histogram': histogram,
+        }
+
+    def _grades(self) -> Sequence[float]:
+        """All grades of the course; read straight from the column when possible."""
+        store = self._course.store
+        if isinstance(store, ColumnStore) and not store.dead_rows:
+            if np is not None:
+                grades = np.frombuffer(store.grades, dtype=float)
+                return grades[~np.isnan(grades)]
+            return [grade for grade in store.grades if grade == grade]
+        return [assignment.grade for assignment in self._course.get_assignments() if assignment.grade is not None]
+
+    def _rebuild(self) -> None:
+        """Recompute every aggregate from the course."""
+        self.course = GradeAggregate()
+        self.by_student.clear()
+        self.by_theme.clear()
+        for assignment in self._course.get_assignments():
+            self._apply(assignment, GradeAggregate.add)
+
+    def _add(self, record_id: int) -> None:
+        self._apply(self._course.get_by_id(record_id), GradeAggregate.add)
+
+    def _remove(self, record_id: int) -> None:
+        self._apply(self._course.get_by_id(record_id), GradeAggregate.remove)
+
+    def _apply(self, assignment, method) -> None:
+        """Add or remove an assignment in the course, student and theme aggregates."""
+        student, theme = assignment.student_name, assignment.theme_name
+        status, grade = assignment.status, assignment.grade
+        student_stats = self.by_student.get(student)
+        if student_stats is None:
+            student_stats = self.by_student[student] = GradeAggregate()
+        theme_stats = self.by_theme.get(theme)
+        if theme_stats is None:
+            theme_stats = self.by_theme[theme] = GradeAggregate()
+        for aggregate in (self.course, student_stats, theme_stats):
+            method(aggregate, status, grade)
+        if not student_stats.statuses:
+            del self.by_student[student]
+        if not theme_stats.statuses:
+            del self.by_theme[theme]
+
+    def _before_change(self, kind: ChangeKind, record_id) -> None:
+        """Course listener called before a change: undo the old contribution."""
+        if kind is ChangeKind.UPDATED_MANY:
+            for changed_id in record_id:
+                self._remove(changed_id)
+        else:
+            self._remove(record_id)
+
+    def _on_change(self, kind: ChangeKind, record_id) -> None:
+        """Course listener: add the new contribution of a changed record."""
+        if kind is ChangeKind.ADDED or kind is ChangeKind.UPDATED:
+            self._add(record_id)
+        elif kind is ChangeKind.UPDATED_MANY:
+            for changed_id in record_id:
+                self._add(changed_id)
+        elif kind is not ChangeKind.REMOVED:
+            self._rebuild()
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Linear-interpolation percentile of sorted values (NumPy's default method)."""
+    position = (len(values) - 1) * percent / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
@@ -1,14 +1,36 @@
+import bisect
+import os
+import queue
+import sqlite3
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
-from models import Course, Assignment, AssignmentStatus
+from models import Course, Assignment, AssignmentStatus, ChangeKind
 from distributor import Distributor
+from file_logger import FileLogger
+from follow import FileFollower
+from grade_stats import GradeStatistics
+from instrumentation import LoadStats
+from snapshot import Snapshot
+from sqlite_store import SqliteStore
+from storage import ColumnStore
+from virtual_table import VirtualTable
 
 
 class AssignmentApp:
-    """GUI application for managing assignments."""
-    def __init__(self, root: tk.Tk, course: Course, default_file: str = "assignments.txt"):
+    """GUI application for managing assignments.
+
+    With ``virtual=True`` the table only materializes the visible rows, which
+    keeps UI time and memory constant for very large courses.
+    ``follow_interval`` is how often, in milliseconds, a followed file is
+    checked for appended lines.
+    """
+    def __init__(self, root: tk.Tk, course: Course, default_file: str = "assignments.txt",
+                 virtual: bool = False, follow_interval: int = 1000):
         self._root = root
+        self._virtual = virtual
+        self._visible_ids = None
         self._course = course
         self._default_file = default_file
         self._root.title(f"Управление заданиями - {course.course_name}")
@@ -17,17 +39,36 @@ class AssignmentApp:
             AssignmentStatus.SUBMITTED.value: "Сдано",
             AssignmentStatus.GRADED.value: "Оценено"
         }
+        self._filter = (None, None, None)
+        self._loading = False
+        self._load_thread = None
+        self._load_queue = None
+        self._load_cancel = None
+        self._staging = None
+        self._follow_interval = follow_interval
+        self._follower = None
+        self._follow_job = None
+        self._follow_logger = None
+        # Created only while the summary panel is shown.
+        self._stats = None
+        self._summary_job = None
         self._setup_ui()
+        self._course.subscribe(self._on_course_change)
 
     def _setup_ui(self):
         """Set up the GUI components."""
-        self._tree = ttk.Treeview(self._root, columns=("Name", "Theme", "Date", "Status", "Grade"), show="headings")
-        self._tree.heading("Name", text="ФИО")
-        self._tree.heading("Theme", text="Тема")
-        self._tree.heading("Date", text="Дата выдачи")
-        self._tree.heading("Status", text="Статус")
-        self._tree.heading("Grade", text="Оценка")
-        self._tree.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        columns = ("Name", "Theme", "Date", "Status", "Grade")
+        headings = ("ФИО", "Тема", "Дата выдачи", "Статус", "Оценка")
+        if self._virtual:
+            self._table = VirtualTable(self._root, columns, headings,
+                                       self._virtual_row_count, self._virtual_row)
+            self._table.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+            self._tree = self._table.tree
+        else:
+            self._tree = ttk.Treeview(self._root, columns=columns, show="headings")
+            for column, heading in zip(columns, headings):
+                self._tree.heading(column, text=heading)
+            self._tree.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
 
         input_frame = ttk.Frame(self._root)
         input_frame.pack(pady=5, fill=tk.X)
@@ -61,14 +102,51 @@ class AssignmentApp:
 
         ttk.Button(modify_frame, text="Изменить статус/оценку", command=self._modify_assignment).grid(row=0, column=4, padx=5)
 
+        filter_frame = ttk.Frame(self._root)
+        filter_frame.pack(pady=5, fill=tk.X)
+
+        ttk.Label(filter_frame, text="Фильтр ФИО:").grid(row=0, column=0, padx=5)
+        self._filter_name_entry = ttk.Entry(filter_frame)
+        self._filter_name_entry.grid(row=0, column=1, padx=5)
+
+        ttk.Label(filter_frame, text="Тема:").grid(row=0, column=2, padx=5)
+        self._filter_theme_entry = ttk.Entry(filter_frame)
+        self._filter_theme_entry.grid(row=0, column=3, padx=5)
+
+        ttk.Label(filter_frame, text="Статус:").grid(row=0, column=4, padx=5)
+        self._filter_status_var = tk.StringVar()
+        ttk.Combobox(filter_frame, textvariable=self._filter_status_var,
+                     values=list(self._status_translations.values())).grid(row=0, column=5, padx=5)
+
+        ttk.Button(filter_frame, text="Найти", command=self._apply_filter).grid(row=0, column=6, padx=5)
+        ttk.Button(filter_frame, text="Сбросить", command=self._reset_filter).grid(row=0, column=7, padx=5)
+
         ttk.Button(self._root, text="Удалить выбранное", command=self._delete_assignment).pack(pady=5)
         ttk.Button(self._root, text="Загрузить из файла", command=self._load_from_file).pack(pady=5)
         ttk.Button(self._root, text="Сохранить в файл", command=self._save_to_file).pack(pady=5)
+        self._follow_var = tk.BooleanVar()
+        ttk.Checkbutton(self._root, text="Следить за дописыванием файла", variable=self._follow_var,
+                        command=self._toggle_follow).pack(pady=5)
+
+        summary_frame = ttk.Frame(self._root)
+        summary_frame.pack(pady=5)
+        self._summary_shown = tk.BooleanVar()
+        ttk.Checkbutton(summary_frame, text="Статистика оценок", variable=self._summary_shown,
+                        command=self._toggle_summary).pack()
+        self._summary_var = tk.StringVar()
+        self._summary_label = ttk.Label(summary_frame, textvariable=self._summary_var)
+
+        self._progress_frame = ttk.Frame(self._root)
+        self._progress = ttk.Progressbar(self._progress_frame, maximum=100, length=300)
+        self._progress.pack(side=tk.LEFT, padx=5)
+        ttk.Button(self._progress_frame, text="Отмена", command=self._cancel_load).pack(side=tk.LEFT, padx=5)
 
         self._update_table()
 
     def _add_assignment(self):
         """Add a new assignment from input fields."""
+        if self._load_in_progress():
+            return
         try:
             name = self._name_entry.get().strip()
             theme = self._theme_entry.get().strip()
@@ -78,7 +156,6 @@ class AssignmentApp:
             date = datetime.strptime(date_str, '%Y.%m.%d')
             assignment = Assignment(name, theme, date)
             self._course.add_assignment(assignment)
-            self._update_table()
             self._name_entry.delete(0, tk.END)
             self._theme_entry.delete(0, tk.END)
             self._date_entry.delete(0, tk.END)
@@ -87,82 +164,444 @@ class AssignmentApp:
 
     def _delete_assignment(self):
         """Delete the selected assignment."""
+        if self._load_in_progress():
+            return
         selected = self._tree.selection()
         if selected:
-            index = int(self._tree.index(selected[0]))
-            self._course.remove_assignment(index)
-            self._update_table()
+            self._course.remove_by_id(int(selected[0]))
         else:
             messagebox.showwarning("Предупреждение", "Выберите задание для удаления")
 
     def _modify_assignment(self):
-        """Modify the status and/or grade of the selected assignment."""
+        """Modify the status and/or grade of all selected assignments in one batch."""
+        if self._load_in_progress():
+            return
         selected = self._tree.selection()
         if not selected:
             messagebox.showwarning("Предупреждение", "Выберите задание для изменения")
             return
 
-        index = int(self._tree.index(selected[0]))
-        assignment = self._course.get_assignments()[index]
+        record_ids = [int(iid) for iid in selected]
 
         try:
-            status_value = self._status_var.get()
-            if status_value:
-                for eng_status, rus_status in self._status_translations.items():
-                    if rus_status == status_value:
-                        for status in AssignmentStatus:
-                            if status.value == eng_status:
-                                assignment.update_status(status)
-                                break
-                        break
+            status = self._status_from_translation(self._status_var.get())
+            if status is not None:
+                self._course.bulk_update_status(record_ids, status)
 
             grade_str = self._grade_entry.get().strip()
             if grade_str:
                 grade = float(grade_str)
-                assignment.set_grade(grade)
+                self._course.bulk_set_grade(dict.fromkeys(record_ids, grade))
 
-            self._update_table()
             self._status_var.set("")
             self._grade_entry.delete(0, tk.END)
         except ValueError as e:
             messagebox.showerror("Ошибка", str(e))
 
+    def _load_in_progress(self) -> bool:
+        """Warn and return True while a background load is running."""
+        if self._load_thread is not None:
+            messagebox.showwarning("Предупреждение", "Дождитесь окончания загрузки")
+            return True
+        return False
+
     def _load_from_file(self):
-        """Load assignments from a file."""
-        file_path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt")])
-        if file_path:
+        """Load assignments from a file on a background thread.
+
+        Parsed rows appear in the table as they arrive; the course itself is
+        replaced only when the whole file has been read, so a cancelled or
+        failed load leaves the previous contents untouched.
+        """
+        if self._load_in_progress():
+            return
+        file_path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt"), ("Snapshots", "*.snap"),
+                                                          ("SQLite databases", "*.db")])
+        if not file_path:
+            return
+        self._stop_follow()
+        if file_path.endswith(".snap"):
+            self._load_snapshot(file_path)
+            return
+        if file_path.endswith(".db"):
+            self._open_database(file_path)
+            return
+        self._staging = self._staging_course()
+        self._load_queue = queue.Queue()
+        self._load_cancel = threading.Event()
+        self._load_thread = threading.Thread(
+            target=self._load_worker, args=(file_path, self._staging, self._load_queue, self._load_cancel),
+            daemon=True)
+        self._loading = True
+        if not self._virtual:
+            self._clear_table()
+        self._progress["value"] = 0
+        self._progress_frame.pack(pady=5)
+        self._load_thread.start()
+        self._root.after(50, self._poll_load, file_path)
+
+    def _load_snapshot(self, file_path: str):
+        """Load a binary snapshot; it is fast enough to read on the UI thread."""
+        staging = self._staging_course()
+        try:
+            Snapshot.load_from_file(file_path, staging)
+        except (FileNotFoundError, ValueError) as e:
+            messagebox.showerror("Ошибка", str(e))
+            return
+        self._swap_in(staging)
+        self._default_file = file_path
+        messagebox.showinfo("Успех", f"Загружено из {file_path}")
+
+    def _open_database(self, file_path: str):
+        """Switch the course to a SQLite database; edits are written straight to it."""
+        try:
+            store = SqliteStore(file_path)
+        except sqlite3.Error as e:
+            messagebox.showerror("Ошибка", str(e))
+            return
+        self._swap_in(Course(self._course.course_name, self._course.instructor, store))
+        self._default_file = file_path
+        messagebox.showinfo("Успех", f"Открыта база {file_path}")
+
+    def _staging_course(self) -> Course:
+        """An empty course to load a file into before swapping it in.
+
+        It uses the current store type, except that a course opened from a
+        database is loaded into memory columns rather than ``:memory:`` SQLite.
+        """
+        store = self._course.store
+        storage = ColumnStore() if isinstance(store, SqliteStore) else type(store)()
+        return Course(self._course.course_name, self._course.instructor, storage)
+
+    def _swap_in(self, staging: Course):
+        """Replace the course contents, closing a database that is no longer used."""
+        self._course.swap_contents(staging)
+        if isinstance(staging.store, SqliteStore):
+            staging.store.close()
+
+    @staticmethod
+    def _load_worker(file_path: str, staging: Course, results: queue.Queue, cancel: threading.Event):
+        """Parse a file into the staging course, reporting batches through a queue."""
+        try:
+            total = os.path.getsize(file_path) or 1
+            bytes_read = 0
+
+            def on_progress(position: int):
+                nonlocal bytes_read
+                bytes_read = position
+
+            batch = []
+            stats = LoadStats(f"Загрузка {os.path.basename(file_path)}")
+            with FileLogger("error.log", buffered=True) as logger:
+                for assignment in Distributor.iter_from_file(file_path, logger=logger, on_progress=on_progress,
+                                                             stats=stats):
+                    if cancel.is_set():
+                        results.put(("cancelled",))
+                        return
+                    batch.append((staging.add_assignment(assignment), assignment))
+                    if len(batch) >= 1000:
+                        results.put(("batch", batch, min(bytes_read * 100 / total, 100)))
+                        batch = []
+            results.put(("batch", batch, 100))
+            results.put(("done", stats))
+        except Exception as e:
+            # Whatever goes wrong, the UI thread must hear back or it waits forever.
+            results.put(("error", e))
+
+    def _poll_load(self, file_path: str):
+        """Drain a few messages from the loader queue, then reschedule."""
+        for _ in range(20):
             try:
-                self._course.get_assignments().clear()
-                Distributor.create_from_file(file_path, self._course)
-                self._default_file = file_path
-                self._update_table()
-                messagebox.showinfo("Успех", f"Загружено из {file_path}. Проверьте error.log для некорректных строк.")
-            except (FileNotFoundError, ValueError) as e:
+                message = self._load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] != "batch":
+                self._finish_load(message, file_path)
+                return
+            _, batch, percent = message
+            if not self._virtual:
+                for record_id, assignment in batch:
+                    if self._matches_filter(assignment):
+                        self._tree.insert("", tk.END, iid=str(record_id), values=self._row_values(assignment))
+            self._progress["value"] = percent
+        self._root.after(50, self._poll_load, file_path)
+
+    def _cancel_load(self):
+        """Ask the background loader to stop."""
+        if self._load_cancel is not None:
+            self._load_cancel.set()
+
+    def _finish_load(self, message: tuple, file_path: str):
+        """Swap in the loaded course on success, or restore the table otherwise.
+
+        On success the rows inserted while loading are kept as they are.
+        """
+        self._load_thread.join()
+        staging = self._staging
+        self._load_thread = self._load_queue = self._load_cancel = self._staging = None
+        self._progress_frame.pack_forget()
+        if message[0] == "done":
+            self._swap_in(staging)
+            self._default_file = file_path
+        self._loading = False
+        if message[0] != "done" or self._virtual:
+            # After a successful load the tree already holds every row
+            # _poll_load inserted; rebuilding it would freeze the UI again.
+            self._update_table()
+        if message[0] == "done":
+            messagebox.showinfo("Успех", f"Загружено из {file_path}. Проверьте error.log для некорректных строк.\n\n"
+                                         f"{message[1].summary()}\n{self._course.strings}")
+        elif message[0] == "error":
+            messagebox.showerror("Ошибка", str(message[1]))
+
+    def _toggle_follow(self):
+        """Start or stop following the current text file for appended lines.
+
+        The first check replaces the course with the whole file, so a
+        non-empty course asks for confirmation first; later checks add only
+        appended records, or reread the file if it was replaced. Saving to
+        another file stops following.
+        """
+        if not self._follow_var.get():
+            self._stop_follow()
+            return
+        if self._load_in_progress():
+            self._follow_var.set(False)
+            return
+        if self._default_file.endswith((".snap", ".db")):
+            messagebox.showwarning("Предупреждение", "Следить можно только за текстовым файлом")
+            self._follow_var.set(False)
+            return
+        if len(self._course) and not messagebox.askyesno(
+                "Подтверждение", f"Содержимое курса будет заменено данными из {self._default_file}; "
+                                 f"несохранённые изменения будут потеряны. Продолжить?"):
+            self._follow_var.set(False)
+            return
+        self._follow_logger = FileLogger("error.log")
+        self._follower = FileFollower(self._default_file, self._course, self._follow_logger,
+                                      storage_factory=lambda: self._staging_course().store)
+        try:
+            self._follower.poll()
+        except (FileNotFoundError, ValueError) as e:
+            self._stop_follow()
+            messagebox.showerror("Ошибка", str(e))
+            return
+        self._follow_job = self._root.after(self._follow_interval, self._poll_follow)
+
+    def _poll_follow(self):
+        """Apply lines appended to the followed file, then reschedule."""
+        self._follow_job = None
+        if self._load_thread is None:
+            try:
+                self._follower.poll()
+            except FileNotFoundError:
+                pass  # Rotated away; the new file has not been created yet.
+            except ValueError as e:
+                self._stop_follow()
                 messagebox.showerror("Ошибка", str(e))
+                return
+        self._follow_job = self._root.after(self._follow_interval, self._poll_follow)
+
+    def _stop_follow(self):
+        """Cancel the scheduled check and forget the followed file."""
+        if self._follow_job is not None:
+            self._root.after_cancel(self._follow_job)
+            self._follow_job = None
+        if self._follow_logger is not None:
+            self._follow_logger.close()
+            self._follow_logger = None
+        self._follower = None
+        self._follow_var.set(False)
 
     def _save_to_file(self):
         """Save assignments to a file."""
-        file_path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files", "*.txt")])
+        file_path = filedialog.asksaveasfilename(defaultextension=".txt",
+                                                 filetypes=[("Text files", "*.txt"), ("Snapshots", "*.snap")])
         if file_path:
             try:
-                Distributor.save_to_file(file_path, self._course)
+                if file_path.endswith(".snap"):
+                    Snapshot.save_to_file(file_path, self._course)
+                else:
+                    Distributor.save_to_file(file_path, self._course)
+                if self._follower is not None and file_path != self._follower.file_path:
+                    # The followed file is no longer the course's file.
+                    self._stop_follow()
                 self._default_file = file_path
                 messagebox.showinfo("Успех", f"Данные сохранены в {file_path}")
             except IOError as e:
                 messagebox.showerror("Ошибка", str(e))
 
+    def _status_from_translation(self, status_value: str):
+        """Map a translated status label back to AssignmentStatus, or None."""
+        for eng_status, rus_status in self._status_translations.items():
+            if rus_status == status_value:
+                return AssignmentStatus(eng_status)
+        return None
+
+    def _apply_filter(self):
+        """Rebuild the table with the filter from the entry fields."""
+        if not self._load_in_progress():
+            self._update_table()
+
+    def _reset_filter(self):
+        """Clear the filter fields and show all assignments."""
+        if self._load_in_progress():
+            return
+        self._filter_name_entry.delete(0, tk.END)
+        self._filter_theme_entry.delete(0, tk.END)
+        self._filter_status_var.set("")
+        self._update_table()
+
     def _update_table(self):
-        """Update the table with current assignments."""
-        for item in self._tree.get_children():
-            self._tree.delete(item)
-        for assignment in self._course.get_assignments():
-            self._tree.insert("", tk.END, values=(
-                assignment.student_name,
-                assignment.theme_name,
-                assignment.issue_date.strftime('%Y.%m.%d'),
-                self._status_translations.get(assignment.status.value, assignment.status.value),
-                assignment.grade if assignment.grade is not None else ""
-            ))
+        """Rebuild the table from the course using the current filter."""
+        self._filter = (self._filter_name_entry.get().strip() or None,
+                        self._filter_theme_entry.get().strip() or None,
+                        self._status_from_translation(self._filter_status_var.get()))
+        if self._virtual:
+            self._update_virtual_source()
+            self._table.set_source(self._virtual_row_count, self._virtual_row)
+            return
+        self._clear_table()
+        for record_id in self._course.query_ids(*self._filter):
+            self._tree.insert("", tk.END, iid=str(record_id),
+                              values=self._row_values(self._course.get_by_id(record_id)))
+
+    def _clear_table(self):
+        """Remove all rows from the table."""
+        children = self._tree.get_children()
+        if children:
+            self._tree.delete(*children)
+
+    def _update_virtual_source(self):
+        """Resolve the filter into a list of IDs; ``None`` means the whole course."""
+        if self._filter == (None, None, None):
+            self._visible_ids = None
+        else:
+            self._visible_ids = self._course.query_ids(*self._filter)
+
+    def _apply_virtual_change(self, kind: ChangeKind, record_id):
+        """Keep the filtered ID list in step with one course change."""
+        if kind is ChangeKind.CLEARED or kind is ChangeKind.RELOADED:
+            self._update_virtual_source()
+        elif kind is ChangeKind.ADDED:
+            # New records get the largest ID, so they belong at the end.
+            if self._matches_filter(self._course.get_by_id(record_id)):
+                self._visible_ids.append(record_id)
+        elif kind is ChangeKind.REMOVED:
+            self._set_visible(record_id, False)
+        elif kind is ChangeKind.UPDATED_MANY:
+            for changed_id in record_id:
+                self._set_visible(changed_id, self._matches_filter(self._course.get_by_id(changed_id)))
+        else:
+            self._set_visible(record_id, self._matches_filter(self._course.get_by_id(record_id)))
+
+    def _set_visible(self, record_id: int, visible: bool):
+        """Add or drop an ID in the sorted filtered list."""
+        ids = self._visible_ids
+        position = bisect.bisect_left(ids, record_id)
+        present = position < len(ids) and ids[position] == record_id
+        if visible and not present:
+            ids.insert(position, record_id)
+        elif present and not visible:
+            del ids[position]
+
+    def _virtual_row_count(self) -> int:
+        """Number of rows the virtual table can scroll through."""
+        return len(self._course) if self._visible_ids is None else len(self._visible_ids)
+
+    def _virtual_row(self, position: int) -> tuple:
+        """Format the row at a table position on demand."""
+        if self._visible_ids is None:
+            record_id = self._course.id_at(position)
+        else:
+            record_id = self._visible_ids[position]
+        return str(record_id), self._row_values(self._course.get_by_id(record_id))
+
+    def _on_course_change(self, kind: ChangeKind, record_id):
+        """Apply a single course change to the table instead of rebuilding it."""
+        if self._stats is not None and self._summary_job is None:
+            # After all listeners, so the statistics have seen the change too.
+            self._summary_job = self._root.after_idle(self._update_summary)
+        if self._loading:
+            return
+        if self._virtual:
+            if self._visible_ids is not None:
+                self._apply_virtual_change(kind, record_id)
+            self._table.refresh()
+            return
+        if kind is ChangeKind.CLEARED:
+            self._clear_table()
+            return
+        if kind is ChangeKind.RELOADED:
+            self._update_table()
+            return
+        if kind is ChangeKind.UPDATED_MANY:
+            for changed_id in record_id:
+                self._show_record(changed_id)
+            return
+        if kind is ChangeKind.REMOVED:
+            if self._tree.exists(str(record_id)):
+                self._tree.delete(str(record_id))
+            return
+        self._show_record(record_id)
+
+    def _show_record(self, record_id: int):
+        """Insert, refresh or hide one record's row according to the filter."""
+        iid = str(record_id)
+        shown = self._tree.exists(iid)
+        assignment = self._course.get_by_id(record_id)
+        if not self._matches_filter(assignment):
+            if shown:
+                self._tree.delete(iid)
+        elif shown:
+            self._tree.item(iid, values=self._row_values(assignment))
+        else:
+            self._tree.insert("", tk.END, iid=iid, values=self._row_values(assignment))
+
+    def _toggle_summary(self):
+        """Show or hide the grade statistics; they are only kept up to date while shown."""
+        if self._summary_shown.get():
+            self._stats = GradeStatistics(self._course)
+            self._summary_label.pack()
+            self._update_summary()
+            return
+        if self._summary_job is not None:
+            self._root.after_cancel(self._summary_job)
+            self._summary_job = None
+        self._stats.close()
+        self._stats = None
+        self._summary_label.pack_forget()
+
+    def _update_summary(self):
+        """Show course-wide grade statistics under the table."""
+        self._summary_job = None
+        if self._stats is None:
+            return
+        stats = self._stats.course
+        statuses = ", ".join(f"{self._status_translations[status.value]}: {stats.statuses[status]}"
+                             for status in AssignmentStatus)
+        if stats.count:
+            grades = (f"Оценок: {stats.count}, средняя: {stats.mean:.1f}, "
+                      f"мин: {stats.min}, макс: {stats.max}, ст. откл.: {stats.variance ** 0.5:.1f}")
+        else:
+            grades = "Оценок нет"
+        self._summary_var.set(f"{grades} | {statuses}")
+
+    def _matches_filter(self, assignment) -> bool:
+        """Check an assignment against the filter the table was built with."""
+        student, theme, status = self._filter
+        return ((student is None or assignment.student_name == student)
+                and (theme is None or assignment.theme_name == theme)
+                and (status is None or assignment.status == status))
+
+    def _row_values(self, assignment) -> tuple:
+        """Format an assignment as a table row."""
+        return (
+            assignment.student_name,
+            assignment.theme_name,
+            assignment.date_text,
+            self._status_translations.get(assignment.status.value, assignment.status.value),
+            assignment.grade if assignment.grade is not None else ""
+        )
 
     def run(self):
         """Run the application."""
@@ -0,0 +1,251 @@
+import asyncio
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from distributor import Distributor
+from file_logger import FileLogger
+from models import Assignment, Course
+
+
+_DEFAULT_PATTERN = "*.txt"
+_QUEUE_SIZE = 8
+_READERS = 4
+
+FileCallback = Callable[["FileReport", List[Assignment]], None]
+
+
+class FileReport:
+    """Outcome of ingesting one file: counters, invalid lines or a read failure.
+
+    ``errors`` holds ``(line_number, description, message)`` for each invalid
+    line, ``description`` being the stripped text of the line.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lines = 0
+        self.records = 0
+        self.bytes = 0
+        self.errors: List[Tuple[int, str, str]] = []
+        self.failure: Optional[str] = None
+        self.seconds = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.failure is None and not self.errors
+
+    def __str__(self) -> str:
+        if self.failure is not None:
+            return f"{self.path}: {self.failure}"
+        return f"{self.path}: записей {self.records}, ошибок {len(self.errors)}"
+
+
+class IngestReport:
+    """Per-file reports in merge order plus totals for the whole run."""
+
+    def __init__(self, files: List[FileReport], elapsed: float):
+        self.files = files
+        self.elapsed = elapsed
+
+    @property
+    def records(self) -> int:
+        return sum(report.records for report in self.files)
+
+    @property
+    def errors(self) -> int:
+        return sum(len(report.errors) for report in self.files)
+
+    @property
+    def bytes(self) -> int:
+        return sum(report.bytes for report in self.files)
+
+    @property
+    def failed(self) -> List[FileReport]:
+        """Files that could not be read or decoded at all."""
+        return [report for report in self.files if report.failure is not None]
+
+    def summary(self, show_errors: int = 3) -> str:
+        """Totals and a line per file that had problems, with its first invalid lines."""
+        throughput = self.bytes / self.elapsed / 2 ** 20 if self.elapsed else 0.0
+        lines = [f"Файлов: {len(self.files)}, записей: {self.records}, ошибок: {self.errors}, "
+                 f"не прочитано файлов: {len(self.failed)}",
+                 f"Время: {self.elapsed:.3f} с, {throughput:,.1f} МиБ/с"]
+        for report in self.files:
+            if report.ok:
+                continue
+            lines.append(str(report))
+            for line_number, _, message in report.errors[:show_errors]:
+                lines.append(f"  Строка {line_number}: {message}")
+            if len(report.errors) > show_errors:
+                lines.append(f"  ... и ещё {len(report.errors) - show_errors}")
+        return "\n".join(lines)
+
+
+def expand_sources(sources: Iterable[str], pattern: str = _DEFAULT_PATTERN) -> List[str]:
+    """Turn files, directories and glob patterns into a sorted list of unique paths.
+
+    Directories contribute the files matching ``pattern``; ``**`` in a glob
+    recurses. Plain paths are kept even if missing so that they are reported.
+    """
+    paths = set()
+    for source in sources:
+        if os.path.isdir(source):
+            matches = glob.glob(os.path.join(source, pattern))
+        elif glob.has_magic(source):
+            matches = glob.glob(source, recursive=True)
+        else:
+            matches = [source]
+        paths.update(os.path.normpath(path) for path in matches if not os.path.isdir(path))
+    return sorted(paths)
+
+
+def _read(path: str) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def _log_name(path: str) -> str:
+    """Per-file error log name that stays unique for files in different directories."""
+    return os.path.normpath(path).lstrip(os.sep).replace(os.sep, "_") + ".log"
+
+
+async def ingest_async(paths: List[str], on_file: FileCallback, workers: Optional[int] = None,
+                       readers: int = _READERS, queue_size: int = _QUEUE_SIZE,
+                       error_dir: Optional[str] = None) -> IngestReport:
+    """Read and parse many files concurrently and merge them in ``paths`` order.
+
+    Files are read in ``readers`` threads and parsed in a pool of ``workers``
+    processes (threads when ``workers`` is 0 or 1). The stages are linked by
+    bounded queues, and at most ``queue_size`` files are held in memory at
+    once, so fast readers wait for slow parsers and a slow ``on_file`` holds
+    back both. ``on_file(report, assignments)`` runs in the event loop
+    thread, once per file, in ``paths`` order, whatever order the files
+    finish in. Invalid lines go to the file's report and, with ``error_dir``,
+    to one log per file in that directory instead of a shared ``error.log``.
+    """
+    loop = asyncio.get_running_loop()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    parse_data = Distributor.parse_rows if executor is not None else Distributor.parse_bytes
+    parsers = max(workers, 1)
+    window = asyncio.Semaphore(queue_size)
+    to_read: asyncio.Queue = asyncio.Queue(queue_size)
+    to_parse: asyncio.Queue = asyncio.Queue(queue_size)
+    results = [loop.create_future() for _ in paths]
+
+    async def feed():
+        for index, path in enumerate(paths):
+            await window.acquire()
+            await to_read.put((index, path))
+        for _ in range(readers):
+            await to_read.put(None)
+
+    async def read():
+        while True:
+            item = await to_read.get()
+            if item is None:
+                return
+            index, path = item
+            report = FileReport(path)
+            start = time.perf_counter()
+            try:
+                data = await asyncio.to_thread(_read, path)
+            except FileNotFoundError:
+                report.failure = f"Файл {path} не найден"
+                data = None
+            except OSError as e:
+                report.failure = f"Ошибка чтения: {e}"
+                data = None
+            report.seconds = time.perf_counter() - start
+            await to_parse.put((index, report, data))
+
+    async def parse():
+        while True:
+            item = await to_parse.get()
+            if item is None:
+                return
+            index, report, data = item
+            assignments: List[Assignment] = []
+            if data is not None:
+                report.bytes = len(data)
+                start = time.perf_counter()
+                try:
+                    report.lines, parsed = await loop.run_in_executor(executor, parse_data, data)
+                except UnicodeDecodeError as e:
+                    report.failure = f"Файл не в кодировке UTF-8: {e}"
+                else:
+                    for result in parsed:
+                        if isinstance(result, Assignment):
+                            assignments.append(result)
+                        elif len(result) == 5:
+                            assignments.append(Assignment(*result))
+                        else:
+                            report.errors.append(result)
+                    report.records = len(assignments)
+                report.seconds += time.perf_counter() - start
+            results[index].set_result((report, assignments))
+
+    async def read_all():
+        await asyncio.gather(*(read() for _ in range(readers)))
+        for _ in range(parsers):
+            await to_parse.put(None)
+
+    def propagate(task: asyncio.Task) -> None:
+        # A failed stage would leave the merge waiting forever; hand it the error.
+        if not task.cancelled() and task.exception() is not None:
+            for future in results:
+                if not future.done():
+                    future.set_exception(task.exception())
+
+    started = time.perf_counter()
+    tasks = [asyncio.ensure_future(feed()), asyncio.ensure_future(read_all())]
+    tasks += [asyncio.ensure_future(parse()) for _ in range(parsers)]
+    for task in tasks:
+        task.add_done_callback(propagate)
+    reports = []
+    try:
+        for future in results:
+            report, assignments = await future
+            if error_dir is not None and report.errors:
+                _write_error_log(error_dir, report)
+            on_file(report, assignments)
+            reports.append(report)
+            window.release()
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return IngestReport(reports, time.perf_counter() - started)
+
+
+def _write_error_log(error_dir: str, report: FileReport) -> None:
+    os.makedirs(error_dir, exist_ok=True)
+    with FileLogger(os.path.join(error_dir, _log_name(report.path)), buffered=True) as logger:
+        for line_number, description, message in report.errors:
+            logger.log_error(f"Пропущена строка {line_number}: '{description}'. "
+                             f"Причина: {message}")
+
+
+def ingest(sources: Iterable[str], course: Optional[Course] = None, on_file: Optional[FileCallback] = None,
+           pattern: str = _DEFAULT_PATTERN, **options) -> IngestReport:
+    """Synchronous entry point for ``ingest_async``.
+
+    ``sources`` may mix files, directories and globs (see ``expand_sources``).
+    With ``course`` every file is appended to it in sorted path order;
+    ``on_file`` receives each file instead, e.g. to put it in its own course.
+    Other keyword arguments are passed to ``ingest_async``.
+    """
+    if on_file is None:
+        if course is None:
+            raise ValueError("Нужно указать курс или обработчик файлов")
+
+        def on_file(report: FileReport, assignments: List[Assignment]) -> None:
+            for assignment in assignments:
+                course.add_assignment(assignment)
+    return asyncio.run(ingest_async(expand_sources(sources, pattern), on_file, **options))
@@ -0,0 +1,107 @@
+import cProfile
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, TextIO
+
+
+class LoadStats:
+    """Counters and per-stage timings for one load or save.
+
+    Pass an instance as ``stats=`` to the ``Distributor`` readers and writers
+    to switch on instrumentation; without it they run their usual code paths.
+    Stage times are summed wall-clock seconds, e.g. ``read``, ``tokenize``,
+    ``date``, ``validate``, ``fallback``, ``log`` and ``add`` for loads and
+    ``format`` and ``write`` for saves.
+    """
+
+    def __init__(self, operation: str = ""):
+        """Start the clock for ``operation`` (a free-form label)."""
+        self.operation = operation
+        self.lines = 0
+        self.records = 0
+        self.errors = 0
+        self.bytes = 0
+        self.stages: Dict[str, float] = {}
+        self.elapsed = 0.0
+        self._started = self._lap_started = time.perf_counter()
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """Add time spent in a stage."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def lap(self, stage: Optional[str]) -> None:
+        """Add the time since the previous lap to ``stage`` and start the next lap.
+
+        ``None`` starts the next lap without counting the time, e.g. time
+        spent by the consumer of a generator.
+        """
+        now = time.perf_counter()
+        if stage is not None:
+            self.stages[stage] = self.stages.get(stage, 0.0) + now - self._lap_started
+        self._lap_started = now
+
+    def finish(self) -> None:
+        """Stop the clock; called by the instrumented operation when it ends."""
+        self.elapsed = time.perf_counter() - self._started
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Share of non-empty lines that could not be parsed."""
+        handled = self.records + self.errors
+        return self.errors / handled if handled else 0.0
+
+    def as_dict(self) -> dict:
+        """All counters and rates, e.g. for JSON output."""
+        return {
+            'operation': self.operation,
+            'lines': self.lines,
+            'records': self.records,
+            'errors': self.errors,
+            'bytes': self.bytes,
+            'seconds': self.elapsed,
+            'lines_per_second': self.lines_per_second,
+            'bytes_per_second': self.bytes_per_second,
+            'error_rate': self.error_rate,
+            'stages': dict(self.stages),
+        }
+
+    def summary(self) -> str:
+        """Human-readable report for the GUI and the command line."""
+        lines = [
+            f"{self.operation or 'Операция'}: {self.elapsed:.3f} с",
+            f"Строк: {self.lines}, записей: {self.records}, ошибок: {self.errors} "
+            f"({self.error_rate:.1%})",
+            f"Скорость: {self.lines_per_second:,.0f} строк/с, "
+            f"{self.bytes_per_second / 2 ** 20:,.1f} МиБ/с",
+        ]
+        for stage, seconds in sorted(self.stages.items(), key=lambda item: -item[1]):
+            share = seconds / self.elapsed if self.elapsed else 0.0
+            lines.append(f"  {stage}: {seconds:.3f} с ({share:.0%})")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profiled(stream: Optional[TextIO] = None, sort: str = "cumulative",
+             limit: int = 25) -> Iterator[cProfile.Profile]:
+    """Run the enclosed block under cProfile and print the top functions.
+
+    The report goes to ``stream`` (stderr by default) when the block exits;
+    the profiler is yielded so callers can also ``dump_stats`` it.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        pstats.Stats(profiler, stream=stream or sys.stderr).sort_stats(sort).print_stats(limit)
@@ -0,0 +1,52 @@
+import sys
+from typing import Dict
+
+
+class InternPool:
+    """Pool that maps equal strings to one shared object.
+
+    Student names and themes repeat thousands of times in real files; keeping
+    a single object per value saves memory and lets dict lookups in the
+    course indexes match by identity. Unlike ``sys.intern`` the pool counts
+    hits and the bytes it saved, and it can be cleared.
+    """
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def intern(self, value: str) -> str:
+        """Return the pooled object equal to ``value``, adding it if it is new."""
+        pooled = self._strings.get(value)
+        if pooled is None:
+            self._strings[value] = value
+            self.misses += 1
+            return value
+        if pooled is not value:
+            # A value that is already the pooled object is not counted again.
+            self.hits += 1
+            self.bytes_saved += sys.getsizeof(value)
+        return pooled
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def memory_usage(self) -> int:
+        """Approximate bytes of the pool's own table; the strings belong to their records."""
+        return sys.getsizeof(self._strings)
+
+    def clear(self) -> None:
+        """Forget all pooled strings and reset the statistics."""
+        self._strings.clear()
+        self.hits = self.misses = self.bytes_saved = 0
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __str__(self) -> str:
+        return (f"Строк в пуле: {len(self)}, попаданий: {self.hit_rate:.1%}, "
+                f"сэкономлено: {self.bytes_saved / 2 ** 20:.1f} МиБ")
@@ -0,0 +1,215 @@
+import os
+import struct
+import zlib
+from datetime import datetime
+from typing import BinaryIO, Dict, Optional
+
+from models import Assignment, ChangeKind, Course
+from snapshot import Snapshot
+from storage import ColumnStore
+
+
+# Journal file: header <4sHI (magic, version, CRC32 of the snapshot it extends),
+# then entries <II (payload length, CRC32 of payload) followed by the payload.
+# Payload starts with <BQ (operation, record key):
+#   ADD  <iBd ordinal, status code, grade (NaN = none), then <I name, <I theme
+#   SET  <Bd  status code, grade (NaN = none)
+#   DEL  nothing more
+MAGIC = b'ASJR'
+VERSION = 1
+_HEADER = struct.Struct('<4sHI')
+_ENTRY = struct.Struct('<II')
+_OP = struct.Struct('<BQ')
+_ADD = struct.Struct('<iBd')
+_SET = struct.Struct('<Bd')
+_LENGTH = struct.Struct('<I')
+_OP_ADD, _OP_SET, _OP_DEL = 1, 2, 3
+_NO_GRADE = float('nan')
+
+
+class Journal:
+    """Append-only change journal on top of a binary snapshot.
+
+    ``open`` loads the snapshot, replays the journal into a course and then
+    appends every add, status/grade update and removal as it happens. Once
+    the journal grows past ``compact_bytes`` it is folded into a new snapshot.
+    Entries carry a CRC, so a torn tail left by a crash is dropped on replay.
+    """
+
+    def __init__(self, snapshot_path: str, journal_path: Optional[str] = None,
+                 compact_bytes: int = 16 * 1024 * 1024, sync: bool = False):
+        """Set up paths; ``sync`` fsyncs the journal after every entry."""
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or snapshot_path + ".journal"
+        self.compact_bytes = compact_bytes
+        self.sync = sync
+        self._course: Optional[Course] = None
+        self._file: Optional[BinaryIO] = None
+        self._keys: Dict[int, int] = {}
+        self._next_key = 0
+
+    def open(self, course: Course) -> None:
+        """Load snapshot and journal into an empty course and start journaling it."""
+        if len(course):
+            raise ValueError("Журнал открывается только для пустого курса")
+        snapshot_crc = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'rb') as file:
+                data = file.read()
+            snapshot_crc = zlib.crc32(data)
+            Snapshot.load_from_bytes(data, course)
+        self._keys = {record_id: key for key, record_id in enumerate(course.ids())}
+        self._next_key = len(self._keys)
+        valid_end = self._replay(course, snapshot_crc)
+        self._course = course
+        if valid_end is None:
+            # No journal, or one left over from before the last compaction.
+            self._start_journal(snapshot_crc)
+        else:
+            self._file = open(self.journal_path, 'r+b')
+            self._file.truncate(valid_end)
+            self._file.seek(valid_end)
+        course.subscribe(self._on_change)
+
+    def close(self) -> None:
+        """Flush the journal and stop following the course."""
+        if self._course is not None:
+            self._course.unsubscribe(self._on_change)
+            self._course = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def flush(self) -> None:
+        """Push written entries to the OS (and to disk when ``sync`` is set)."""
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot and start an empty journal.
+
+        The snapshot is replaced first. If the process dies before the journal
+        is reset, the old journal no longer matches the snapshot CRC and is
+        ignored on the next open, since its changes are already in the snapshot.
+        """
+        course = self._course
+        temp_path = self.snapshot_path + ".tmp"
+        Snapshot.save_to_file(temp_path, course)
+        with open(temp_path, 'rb') as file:
+            snapshot_crc = zlib.crc32(file.read())
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        self._keys = {record_id: key for key, record_id in enumerate(course.ids())}
+        self._next_key = len(self._keys)
+        self._file.close()
+        self._start_journal(snapshot_crc)
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _start_journal(self, snapshot_crc: int) -> None:
+        """Atomically replace the journal with an empty one bound to a snapshot."""
+        temp_path = self.journal_path + ".tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, snapshot_crc))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.journal_path)
+        self._file = open(self.journal_path, 'r+b')
+        self._file.seek(0, os.SEEK_END)
+
+    def _replay(self, course: Course, snapshot_crc: int) -> Optional[int]:
+        """Apply journal entries to the course; return the end of the valid part."""
+        try:
+            with open(self.journal_path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, journal_crc = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Файл {self.journal_path} не является журналом курса")
+        if journal_crc != snapshot_crc:
+            return None
+        live = {key: record_id for record_id, key in self._keys.items()}
+        offset = _HEADER.size
+        while offset + _ENTRY.size <= len(data):
+            length, crc = _ENTRY.unpack_from(data, offset)
+            payload = data[offset + _ENTRY.size:offset + _ENTRY.size + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+            self._apply(course, payload, live)
+            offset += _ENTRY.size + length
+        self._keys = {record_id: key for key, record_id in live.items()}
+        return offset
+
+    def _apply(self, course: Course, payload: bytes, live: Dict[int, int]) -> None:
+        """Apply one journal entry during replay."""
+        op, key = _OP.unpack_from(payload, 0)
+        position = _OP.size
+        if op == _OP_ADD:
+            ordinal, code, grade = _ADD.unpack_from(payload, position)
+            position += _ADD.size
+            name, position = _read_string(payload, position)
+            theme, position = _read_string(payload, position)
+            live[key] = course.add_assignment(Assignment(
+                name, theme, datetime.fromordinal(ordinal), ColumnStore.status_from_code(code),
+                None if grade != grade else grade))
+            self._next_key = max(self._next_key, key + 1)
+        elif op == _OP_SET:
+            code, grade = _SET.unpack_from(payload, position)
+            record_id = live[key]
+            if grade == grade:
+                course.set_grade(record_id, grade)
+            course.update_status(record_id, ColumnStore.status_from_code(code))
+        elif op == _OP_DEL:
+            course.remove_by_id(live.pop(key))
+        else:
+            raise ValueError(f"Неизвестная операция журнала: {op}")
+
+    def _on_change(self, kind: ChangeKind, record_id) -> None:
+        """Course listener: append the change, compacting when the journal is large."""
+        if kind in (ChangeKind.CLEARED, ChangeKind.RELOADED):
+            self.compact()
+            return
+        if kind is ChangeKind.UPDATED_MANY:
+            payloads = [self._set_payload(changed_id) for changed_id in record_id]
+        elif kind is ChangeKind.ADDED:
+            key = self._keys[record_id] = self._next_key
+            self._next_key += 1
+            assignment = self._course.get_by_id(record_id)
+            name = assignment.student_name.encode('utf-8')
+            theme = assignment.theme_name.encode('utf-8')
+            payloads = [b''.join((
+                _OP.pack(_OP_ADD, key),
+                _ADD.pack(assignment.issue_ordinal, ColumnStore.status_code(assignment.status),
+                          _NO_GRADE if assignment.grade is None else assignment.grade),
+                _LENGTH.pack(len(name)), name, _LENGTH.pack(len(theme)), theme))]
+        elif kind is ChangeKind.UPDATED:
+            payloads = [self._set_payload(record_id)]
+        else:
+            payloads = [_OP.pack(_OP_DEL, self._keys.pop(record_id))]
+        self._file.write(b''.join(_ENTRY.pack(len(payload), zlib.crc32(payload)) + payload
+                                  for payload in payloads))
+        self.flush()
+        if self._file.tell() > self.compact_bytes:
+            self.compact()
+
+    def _set_payload(self, record_id: int) -> bytes:
+        """Journal payload with the current status and grade of a record."""
+        assignment = self._course.get_by_id(record_id)
+        return _OP.pack(_OP_SET, self._keys[record_id]) + _SET.pack(
+            ColumnStore.status_code(assignment.status),
+            _NO_GRADE if assignment.grade is None else assignment.grade)
+
+
+def _read_string(payload: bytes, position: int):
+    """Read a length-prefixed UTF-8 string from a journal payload."""
+    (length,) = _LENGTH.unpack_from(payload, position)
+    position += _LENGTH.size
+    return payload[position:position + length].decode('utf-8'), position + length
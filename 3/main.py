@@ -1,3 +1,4 @@
+import argparse
 import tkinter as tk
 from models import Course
 from gui import AssignmentApp
@@ -5,11 +6,20 @@ from gui import AssignmentApp
 
 def main():
     """Main function to start the application."""
+    parser = argparse.ArgumentParser(description="Управление заданиями курса")
+    parser.add_argument("--file", default="assignments.txt",
+                        help="файл заданий по умолчанию (assignments.txt)")
+    parser.add_argument("--virtual", action="store_true",
+                        help="виртуальная таблица: строки строятся только при показе (для больших курсов)")
+    parser.add_argument("--follow-interval", type=int, default=1000,
+                        help="период проверки отслеживаемого файла, мс (1000)")
+    args = parser.parse_args()
     course = Course("Программирование на Python", "Иванов И.И.")
     root = tk.Tk()
-    app = AssignmentApp(root, course, default_file="assignments.txt")
+    app = AssignmentApp(root, course, default_file=args.file, virtual=args.virtual,
+                        follow_interval=args.follow_interval)
     app.run()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
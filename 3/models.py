@@ -1,6 +1,14 @@
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from contextlib import nullcontext
+from collections.abc import Sequence
 from datetime import datetime
 from enum import Enum
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Union
+
+from interning import InternPool
 
 
 class AssignmentStatus(Enum):
@@ -10,31 +18,101 @@ class AssignmentStatus(Enum):
     GRADED = "Graded"
 
 
+class ChangeKind(Enum):
+    """Виды изменений курса, о которых уведомляются подписчики."""
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+    CLEARED = "cleared"
+    RELOADED = "reloaded"
+    UPDATED_MANY = "updated_many"
+
+
+# Пакетное изменение большего числа записей сбрасывает индексы вместо
+# переноса каждой записи между корзинами статусов.
+_REINDEX_LIMIT = 1024
+
+ChangeListener = Callable[[ChangeKind, Union[int, List[int], None]], None]
+
+
+@lru_cache(maxsize=65536)
+def date_from_ordinal(ordinal: int) -> datetime:
+    """Дата по порядковому номеру дня; один общий объект на каждый день."""
+    return datetime.fromordinal(ordinal)
+
+
+@lru_cache(maxsize=65536)
+def format_ordinal(ordinal: int) -> str:
+    """Дата по порядковому номеру дня в виде строки ГГГГ.ММ.ДД."""
+    return datetime.fromordinal(ordinal).strftime('%Y.%m.%d')
+
+
 class AssignmentBase:
-    """Базовый класс для хранения информации о задании."""
-    
-    def __init__(self, student_name: str, theme_name: str, issue_date: datetime):
+    """Базовый класс для хранения информации о задании.
+
+    Дата без времени суток хранится как порядковый номер дня, а объект
+    ``datetime`` и строка ``ГГГГ.ММ.ДД`` получаются из общих кэшей по
+    требованию. Дата со временем хранится как есть.
+    """
+    __slots__ = ('student_name', 'theme_name', '_issue', '_date_text')
+
+    def __init__(self, student_name: str, theme_name: str, issue_date: Union[datetime, int]):
         """Инициализация базового задания.
 
         Args:
             student_name: Имя студента.
             theme_name: Название темы задания.
-            issue_date: Дата выдачи задания.
+            issue_date: Дата выдачи задания (``datetime`` или порядковый номер дня).
         """
         self.student_name = student_name
         self.theme_name = theme_name
         self.issue_date = issue_date
 
+    @property
+    def issue_date(self) -> datetime:
+        """Дата выдачи задания."""
+        issue = self._issue
+        return date_from_ordinal(issue) if issue.__class__ is int else issue
+
+    @issue_date.setter
+    def issue_date(self, value: Union[datetime, int]) -> None:
+        if value.__class__ is datetime and value.tzinfo is None and not (
+                value.hour or value.minute or value.second or value.microsecond):
+            value = value.toordinal()
+        self._issue = value
+        self._date_text = None
+
+    @property
+    def issue_ordinal(self) -> int:
+        """Порядковый номер дня выдачи (время суток отбрасывается)."""
+        issue = self._issue
+        return issue if issue.__class__ is int else issue.toordinal()
+
+    @property
+    def date_text(self) -> str:
+        """Дата выдачи в формате ГГГГ.ММ.ДД (вычисляется один раз)."""
+        text = self._date_text
+        if text is None:
+            issue = self._issue
+            text = format_ordinal(issue) if issue.__class__ is int else issue.strftime('%Y.%m.%d')
+            self._date_text = text
+        return text
+
     def __str__(self) -> str:
         """Строковое представление задания."""
         return (f"Студент: {self.student_name}, Тема: {self.theme_name}, "
-                f"Дата выдачи: {self.issue_date.strftime('%Y.%m.%d')}")
+                f"Дата выдачи: {self.date_text}")
 
 
 class Assignment(AssignmentBase):
-    """Класс задания с дополнительными атрибутами статуса и оценки."""
-    
-    def __init__(self, student_name: str, theme_name: str, issue_date: datetime,
+    """Класс задания с дополнительными атрибутами статуса и оценки.
+
+    Строковое представление кэшируется и пересчитывается при изменении
+    любого из полей.
+    """
+    __slots__ = ('status', 'grade', '_display')
+
+    def __init__(self, student_name: str, theme_name: str, issue_date: Union[datetime, int],
                  status: AssignmentStatus = AssignmentStatus.PENDING,
                  grade: float | None = None):
         """Инициализация задания.
@@ -42,13 +120,14 @@ class Assignment(AssignmentBase):
         Args:
             student_name: Имя студента.
             theme_name: Название темы задания.
-            issue_date: Дата выдачи задания.
+            issue_date: Дата выдачи задания (``datetime`` или порядковый номер дня).
             status: Статус задания (по умолчанию PENDING).
             grade: Оценка за задание (по умолчанию None).
         """
         super().__init__(student_name, theme_name, issue_date)
         self.status = status
         self.grade = grade
+        self._display = None
 
     def update_status(self, new_status: AssignmentStatus) -> None:
         """Обновление статуса задания.
@@ -57,6 +136,7 @@ class Assignment(AssignmentBase):
             new_status: Новый статус задания.
         """
         self.status = new_status
+        self._display = None
 
     def set_grade(self, grade: float) -> None:
         """Установка оценки для задания.
@@ -71,35 +151,281 @@ class Assignment(AssignmentBase):
             raise ValueError("Оценка должна быть от 0 до 100")
         self.grade = grade
         self.status = AssignmentStatus.GRADED
+        self._display = None
 
     def __str__(self) -> str:
         """Строковое представление задания с учетом статуса и оценки."""
+        display = self._display
+        # Проверка защищает от прямого присваивания полей в обход методов.
+        if (display is not None and display[0] is self.status and display[1] == self.grade
+                and display[2] is self.student_name and display[3] is self.theme_name
+                and display[4] == self._issue):
+            return display[5]
         base_str = super().__str__()
         grade_str = f", Оценка: {self.grade}" if self.grade is not None else ""
-        return f"{base_str}, Статус: {self.status.value}{grade_str}"
+        text = f"{base_str}, Статус: {self.status.value}{grade_str}"
+        self._display = (self.status, self.grade, self.student_name, self.theme_name, self._issue, text)
+        return text
+
+
+class RecordStore:
+    """Хранилище заданий по умолчанию: словарь «идентификатор -> задание».
+
+    Идентификаторы выдаются по возрастанию и не переиспользуются, поэтому
+    порядок идентификаторов совпадает с порядком добавления. Удаление и
+    поиск по идентификатору выполняются за O(1).
+    """
+
+    def __init__(self):
+        """Инициализация пустого хранилища."""
+        self._records: Dict[int, Assignment] = {}
+        self._next_id = 0
+
+    def add(self, assignment: Assignment) -> int:
+        """Добавление задания.
+
+        Args:
+            assignment: Объект задания.
+
+        Returns:
+            Идентификатор записи.
+        """
+        record_id = self._next_id
+        self._next_id += 1
+        self._records[record_id] = assignment
+        return record_id
+
+    def remove(self, record_id: int) -> Assignment:
+        """Удаление задания по идентификатору.
+
+        Args:
+            record_id: Идентификатор записи.
+
+        Returns:
+            Удалённое задание.
+
+        Raises:
+            KeyError: Если записи нет.
+        """
+        return self._records.pop(record_id)
+
+    def get(self, record_id: int) -> Assignment:
+        """Получение задания по идентификатору.
+
+        Raises:
+            KeyError: Если записи нет.
+        """
+        return self._records[record_id]
+
+    def ids(self) -> Iterator[int]:
+        """Идентификаторы записей в порядке добавления."""
+        return iter(self._records)
+
+    def clear(self) -> None:
+        """Удаление всех заданий; новые идентификаторы продолжают нумерацию."""
+        self._records.clear()
+
+    def __contains__(self, record_id: int) -> bool:
+        return record_id in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class AssignmentList(Sequence):
+    """Представление заданий курса в виде последовательности по позициям."""
+    __slots__ = ('_course',)
+
+    def __init__(self, course: "Course"):
+        self._course = course
+
+    def __len__(self) -> int:
+        return len(self._course)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        return self._course.get_by_id(self._course.id_at(position))
+
+    def __iter__(self) -> Iterator[Assignment]:
+        store = self._course.store
+        for record_id in store.ids():
+            yield store.get(record_id)
+
+    def clear(self) -> None:
+        """Удаление всех заданий курса."""
+        self._course.clear()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, AssignmentList)):
+            return list(self) == list(other)
+        return NotImplemented
 
 
 class Course:
-    """Класс для управления курсом и связанными заданиями."""
-    
-    def __init__(self, course_name: str, instructor: str):
+    """Класс для управления курсом и связанными заданиями.
+
+    Каждое задание получает стабильный идентификатор записи. Хранилище
+    адресуется по идентификаторам, а позиционный доступ обеспечивает массив
+    идентификаторов с надгробиями, который уплотняется по мере надобности,
+    либо само хранилище, если у него есть ``id_at`` (как у SQLite).
+    """
+
+    def __init__(self, course_name: str, instructor: str, storage=None):
         """Инициализация курса.
 
         Args:
             course_name: Название курса.
             instructor: Имя преподавателя.
+            storage: Хранилище заданий (по умолчанию ``RecordStore``; для
+                больших курсов - ``storage.ColumnStore`` или
+                ``sqlite_store.SqliteStore``).
         """
         self.course_name = course_name
         self.instructor = instructor
-        self.assignments: List[Assignment] = []
+        self.store = storage if storage is not None else RecordStore()
+        self._order = self._new_order()
+        # Отсортированные позиции надгробий в массиве порядка.
+        self._holes = array('q')
+        self._by_student: Dict[str, array] = {}
+        self._by_theme: Dict[str, array] = {}
+        self._by_status: Dict[AssignmentStatus, array] = {}
+        self._listeners: List[ChangeListener] = []
+        self._before_listeners: List[ChangeListener] = []
+        # Пул строк курса: живёт и очищается вместе с его заданиями.
+        self.strings = InternPool()
+        # Индексы строятся при первом запросе и дальше поддерживаются;
+        # хранилище со своим ``query_ids`` (например, SQLite) в них не нуждается.
+        self._indexed = False
+
+    def subscribe(self, listener: ChangeListener, before: bool = False) -> None:
+        """Подписка на изменения курса.
+
+        Подписчик вызывается как ``listener(kind, record_id)``; для
+        ``ChangeKind.CLEARED`` и ``ChangeKind.RELOADED`` (содержимое заменено
+        целиком) идентификатор равен ``None``, а для ``ChangeKind.UPDATED_MANY``
+        (пакетное изменение) передаётся список идентификаторов.
+
+        Подписчик с ``before=True`` вызывается до изменения, пока записи ещё
+        хранят старые значения, и только для ``UPDATED``, ``UPDATED_MANY`` и
+        ``REMOVED``; за ним всегда следует обычное уведомление.
+
+        Args:
+            listener: Функция-подписчик.
+            before: Уведомлять до изменения, а не после.
+        """
+        (self._before_listeners if before else self._listeners).append(listener)
 
-    def add_assignment(self, assignment: Assignment) -> None:
+    def unsubscribe(self, listener: ChangeListener, before: bool = False) -> None:
+        """Отмена подписки на изменения курса.
+
+        Args:
+            listener: Ранее подписанная функция.
+            before: Подписка была сделана с ``before=True``.
+        """
+        (self._before_listeners if before else self._listeners).remove(listener)
+
+    def _notify(self, kind: ChangeKind, record_id: Union[int, List[int], None] = None) -> None:
+        """Рассылка уведомления об изменении подписчикам."""
+        for listener in self._listeners:
+            listener(kind, record_id)
+
+    def _notify_before(self, kind: ChangeKind, record_id: Union[int, List[int]]) -> None:
+        """Рассылка уведомления о предстоящем изменении."""
+        for listener in self._before_listeners:
+            listener(kind, record_id)
+
+    def _new_order(self) -> Optional[array]:
+        """Массив порядка по хранилищу; ``None``, если хранилище само даёт ``id_at``."""
+        if hasattr(self.store, 'id_at'):
+            return None
+        return array('q', self.store.ids())
+
+    def _store_queries(self) -> bool:
+        """Выполняет ли хранилище поиск по своим индексам."""
+        return hasattr(self.store, 'query_ids')
+
+    @property
+    def assignments(self) -> AssignmentList:
+        """Задания курса в виде последовательности."""
+        return AssignmentList(self)
+
+    def _ensure_indexes(self) -> None:
+        """Построение индексов, если они ещё не построены."""
+        if not self._indexed:
+            for record_id in self.store.ids():
+                self._index(record_id, self.store.get(record_id))
+            self._indexed = True
+
+    def _index(self, record_id: int, assignment: Assignment) -> None:
+        """Добавление записи в индексы."""
+        self._insert(self._by_student, assignment.student_name, record_id)
+        self._insert(self._by_theme, assignment.theme_name, record_id)
+        self._insert(self._by_status, assignment.status, record_id)
+
+    @staticmethod
+    def _insert(index: Dict[Hashable, array], key: Hashable, record_id: int) -> None:
+        """Добавление записи в корзину индекса.
+
+        Корзины - отсортированные массивы идентификаторов; новые записи
+        получают наибольший идентификатор и просто дописываются в конец.
+        """
+        bucket = index.get(key)
+        if bucket is None:
+            index[key] = array('q', (record_id,))
+        elif not bucket or bucket[-1] < record_id:
+            bucket.append(record_id)
+        else:
+            bucket.insert(bisect_left(bucket, record_id), record_id)
+
+    @staticmethod
+    def _discard(index: Dict[Hashable, array], key: Hashable, record_id: int) -> None:
+        """Удаление записи из корзины индекса; пустые корзины удаляются."""
+        bucket = index.get(key)
+        if bucket is not None:
+            position = bisect_left(bucket, record_id)
+            if position < len(bucket) and bucket[position] == record_id:
+                del bucket[position]
+            if not bucket:
+                del index[key]
+
+    @staticmethod
+    def _has(bucket: array, record_id: int) -> bool:
+        """Есть ли идентификатор в корзине индекса."""
+        position = bisect_left(bucket, record_id)
+        return position < len(bucket) and bucket[position] == record_id
+
+    def _drop_indexes(self) -> None:
+        """Сброс индексов; они будут построены заново при следующем запросе."""
+        self._by_student.clear()
+        self._by_theme.clear()
+        self._by_status.clear()
+        self._indexed = False
+
+    def add_assignment(self, assignment: Assignment) -> int:
         """Добавление задания в курс.
 
+        Если хранилище держит сами объекты заданий (``RecordStore``), ФИО и
+        тема заменяются общими объектами из пула строк курса (``strings``),
+        так что повторяющиеся значения хранятся один раз.
+
         Args:
             assignment: Объект задания.
+
+        Returns:
+            Идентификатор записи.
         """
-        self.assignments.append(assignment)
+        if isinstance(assignment, AssignmentBase) and isinstance(self.store, RecordStore):
+            assignment.student_name = self.strings.intern(assignment.student_name)
+            assignment.theme_name = self.strings.intern(assignment.theme_name)
+        record_id = self.store.add(assignment)
+        if self._order is not None:
+            self._order.append(record_id)
+        if self._indexed:
+            self._index(record_id, assignment)
+        if self._listeners:
+            self._notify(ChangeKind.ADDED, record_id)
+        return record_id
 
     def remove_assignment(self, index: int) -> None:
         """Удаление задания по индексу.
@@ -110,20 +436,306 @@ class Course:
         Raises:
             IndexError: Если индекс вне диапазона.
         """
-        if 0 <= index < len(self.assignments):
-            self.assignments.pop(index)
-        else:
+        self.remove_by_id(self.id_at(index))
+
+    def remove_by_id(self, record_id: int) -> None:
+        """Удаление задания по идентификатору без перестроения массива порядка.
+
+        Args:
+            record_id: Идентификатор записи.
+
+        Raises:
+            KeyError: Если записи нет.
+        """
+        if self._before_listeners:
+            self.get_by_id(record_id)
+            self._notify_before(ChangeKind.REMOVED, record_id)
+        if self._indexed:
+            assignment = self.store.get(record_id)
+            self._discard(self._by_student, assignment.student_name, record_id)
+            self._discard(self._by_theme, assignment.theme_name, record_id)
+            self._discard(self._by_status, assignment.status, record_id)
+        self.store.remove(record_id)
+        if self._order is not None:
+            # Идентификаторы в массиве порядка возрастают, так что позиция
+            # удалённой записи находится двоичным поиском.
+            insort(self._holes, bisect_left(self._order, record_id))
+            if len(self._holes) > 1024 and len(self._holes) * 2 > len(self._order):
+                self._compact()
+        self._notify(ChangeKind.REMOVED, record_id)
+
+    def get_by_id(self, record_id: int) -> Assignment:
+        """Получение задания по идентификатору.
+
+        Raises:
+            KeyError: Если записи нет.
+        """
+        return self.store.get(record_id)
+
+    def id_at(self, index: int) -> int:
+        """Идентификатор записи, стоящей на заданной позиции.
+
+        Raises:
+            IndexError: Если индекс вне диапазона.
+        """
+        if not 0 <= index < len(self.store):
             raise IndexError("Недопустимый индекс задания")
+        if self._order is None:
+            return self.store.id_at(index)
+        holes = self._holes
+        if not holes:
+            return self._order[index]
+        # Наименьшая позиция, до которой включительно index + 1 живых записей.
+        low, high = index, index + len(holes)
+        while low < high:
+            middle = (low + high) // 2
+            if middle + 1 - bisect_right(holes, middle) > index:
+                high = middle
+            else:
+                low = middle + 1
+        return self._order[low]
+
+    def ids(self) -> Iterator[int]:
+        """Идентификаторы записей в порядке добавления."""
+        return self.store.ids()
+
+    def _compact(self) -> None:
+        """Удаление надгробий из массива порядка и из хранилища, если оно это умеет."""
+        compact = getattr(self.store, 'compact', None)
+        if compact is not None:
+            compact()
+        self._order = self._new_order()
+        self._holes = array('q')
+
+    def update_status(self, record_id: int, new_status: AssignmentStatus) -> None:
+        """Обновление статуса задания с поддержкой индексов.
+
+        Изменения, сделанные напрямую через ``Assignment.update_status``,
+        в индексах не отражаются.
+
+        Args:
+            record_id: Идентификатор записи.
+            new_status: Новый статус задания.
+
+        Raises:
+            KeyError: Если записи нет.
+        """
+        assignment = self.store.get(record_id)
+        if self._before_listeners:
+            self._notify_before(ChangeKind.UPDATED, record_id)
+        old_status = assignment.status
+        assignment.update_status(new_status)
+        self._reindex_status(record_id, old_status, assignment.status)
+        self._notify(ChangeKind.UPDATED, record_id)
+
+    def set_grade(self, record_id: int, grade: float) -> None:
+        """Установка оценки заданию с поддержкой индексов.
+
+        Args:
+            record_id: Идентификатор записи.
+            grade: Оценка (от 0 до 100).
+
+        Raises:
+            KeyError: Если записи нет.
+            ValueError: Если оценка вне диапазона [0, 100].
+        """
+        assignment = self.store.get(record_id)
+        if self._before_listeners:
+            if not 0 <= grade <= 100:
+                raise ValueError("Оценка должна быть от 0 до 100")
+            self._notify_before(ChangeKind.UPDATED, record_id)
+        old_status = assignment.status
+        assignment.set_grade(grade)
+        self._reindex_status(record_id, old_status, assignment.status)
+        self._notify(ChangeKind.UPDATED, record_id)
+
+    def bulk_update_status(self, selector: Union[Callable[[Assignment], bool], Iterable[int]],
+                           new_status: AssignmentStatus) -> List[int]:
+        """Пакетное обновление статуса заданий.
+
+        Подписчики получают одно уведомление ``ChangeKind.UPDATED_MANY``.
+
+        Args:
+            selector: Функция-условие над заданием или идентификаторы записей.
+            new_status: Новый статус заданий.
+
+        Returns:
+            Идентификаторы изменённых записей.
 
-    def get_assignments(self) -> List[Assignment]:
+        Raises:
+            KeyError: Если какой-либо записи нет (ничего не изменяется).
+        """
+        record_ids = self._select(selector)
+        if self._before_listeners:
+            self._notify_before(ChangeKind.UPDATED_MANY, record_ids)
+        if len(record_ids) > _REINDEX_LIMIT:
+            self._drop_indexes()
+        with self._store_transaction():
+            for record_id in record_ids:
+                assignment = self.store.get(record_id)
+                old_status = assignment.status
+                assignment.update_status(new_status)
+                self._reindex_status(record_id, old_status, new_status)
+        self._notify(ChangeKind.UPDATED_MANY, record_ids)
+        return record_ids
+
+    def bulk_set_grade(self, grades: Mapping[int, float]) -> List[int]:
+        """Пакетная установка оценок.
+
+        Все оценки и идентификаторы проверяются до первого изменения;
+        подписчики получают одно уведомление ``ChangeKind.UPDATED_MANY``.
+
+        Args:
+            grades: Оценки (от 0 до 100) по идентификаторам записей.
+
+        Returns:
+            Идентификаторы изменённых записей.
+
+        Raises:
+            KeyError: Если какой-либо записи нет (ничего не изменяется).
+            ValueError: Если какая-либо оценка вне диапазона [0, 100]
+                (ничего не изменяется).
+        """
+        invalid = [record_id for record_id, grade in grades.items() if not 0 <= grade <= 100]
+        if invalid:
+            raise ValueError(f"Оценка должна быть от 0 до 100 (записи: {invalid})")
+        record_ids = self._select(grades)
+        if self._before_listeners:
+            self._notify_before(ChangeKind.UPDATED_MANY, record_ids)
+        if len(record_ids) > _REINDEX_LIMIT:
+            self._drop_indexes()
+        with self._store_transaction():
+            for record_id in record_ids:
+                assignment = self.store.get(record_id)
+                old_status = assignment.status
+                assignment.set_grade(grades[record_id])
+                self._reindex_status(record_id, old_status, assignment.status)
+        self._notify(ChangeKind.UPDATED_MANY, record_ids)
+        return record_ids
+
+    def _select(self, selector: Union[Callable[[Assignment], bool], Iterable[int]]) -> List[int]:
+        """Идентификаторы записей по условию или проверенный список идентификаторов.
+
+        Повторы в списке отбрасываются с сохранением порядка, чтобы подписчики
+        не обработали одну запись дважды.
+        """
+        if callable(selector):
+            return [record_id for record_id in self.store.ids() if selector(self.store.get(record_id))]
+        record_ids = list(dict.fromkeys(selector))
+        for record_id in record_ids:
+            if record_id not in self.store:
+                raise KeyError(record_id)
+        return record_ids
+
+    def _reindex_status(self, record_id: int, old_status: AssignmentStatus,
+                        new_status: AssignmentStatus) -> None:
+        """Перенос записи в индексе статусов."""
+        if self._indexed and old_status is not new_status:
+            self._discard(self._by_status, old_status, record_id)
+            self._insert(self._by_status, new_status, record_id)
+
+    def _store_transaction(self):
+        """Транзакция хранилища для пакетных изменений, если оно их поддерживает."""
+        transaction = getattr(self.store, 'transaction', None)
+        return transaction() if transaction is not None else nullcontext()
+
+    def clear(self) -> None:
+        """Удаление всех заданий курса."""
+        self.store.clear()
+        self._order = self._new_order()
+        self._holes = array('q')
+        self.strings.clear()
+        self._drop_indexes()
+        self._notify(ChangeKind.CLEARED)
+
+    def swap_contents(self, other: "Course") -> None:
+        """Обмен заданиями с другим курсом за O(1).
+
+        Позволяет подготовить данные в отдельном курсе (например, в фоновом
+        потоке) и подставить их целиком. Оба курса уведомляют подписчиков
+        событием ``ChangeKind.RELOADED``.
+
+        Args:
+            other: Курс, с которым выполняется обмен.
+        """
+        for name in ('store', 'strings', '_order', '_holes', '_indexed', '_by_student', '_by_theme', '_by_status'):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            setattr(self, name, theirs)
+            setattr(other, name, mine)
+        self._notify(ChangeKind.RELOADED)
+        other._notify(ChangeKind.RELOADED)
+
+    def query(self, student: Optional[str] = None, theme: Optional[str] = None,
+              status: Optional[AssignmentStatus] = None) -> List[Assignment]:
+        """Поиск заданий по индексам.
+
+        Заданные условия объединяются по «И»; без условий возвращаются все
+        задания. Время работы пропорционально размеру наименьшей корзины.
+
+        Args:
+            student: Имя студента.
+            theme: Название темы.
+            status: Статус задания.
+
+        Returns:
+            Задания в порядке их следования в курсе.
+        """
+        return [self.store.get(record_id) for record_id in self.query_ids(student, theme, status)]
+
+    def query_ids(self, student: Optional[str] = None, theme: Optional[str] = None,
+                  status: Optional[AssignmentStatus] = None) -> List[int]:
+        """Поиск идентификаторов записей по индексам (см. ``query``).
+
+        Returns:
+            Идентификаторы в порядке следования заданий в курсе.
+        """
+        if self._store_queries():
+            return self.store.query_ids(student, theme, status)
+        self._ensure_indexes()
+        buckets = []
+        for record_index, key in ((self._by_student, student), (self._by_theme, theme),
+                                  (self._by_status, status)):
+            if key is not None:
+                buckets.append(record_index.get(key, ()))
+        if not buckets:
+            return list(self.store.ids())
+        buckets.sort(key=len)
+        smallest, others = buckets[0], buckets[1:]
+        # Корзины отсортированы, поэтому результат уже идёт в порядке курса.
+        return [r for r in smallest if all(self._has(bucket, r) for bucket in others)]
+
+    def memory_usage(self) -> int:
+        """Приблизительный объём памяти курса в байтах.
+
+        Учитываются массив порядка, индексы (если построены) и хранилище,
+        если оно умеет оценивать себя (``memory_usage``, как у ``ColumnStore``);
+        иначе хранилище не учитывается.
+
+        Returns:
+            Оценка в байтах.
+        """
+        usage = sys.getsizeof(self._holes)
+        if self._order is not None:
+            usage += sys.getsizeof(self._order)
+        for record_index in (self._by_student, self._by_theme, self._by_status):
+            usage += sys.getsizeof(record_index) + sum(map(sys.getsizeof, record_index.values()))
+        usage += self.strings.memory_usage()
+        if hasattr(self.store, 'memory_usage'):
+            usage += self.store.memory_usage()
+        return usage
+
+    def get_assignments(self) -> AssignmentList:
         """Получение списка всех заданий.
 
         Returns:
-            Список заданий курса.
+            Последовательность заданий курса.
         """
         return self.assignments
 
+    def __len__(self) -> int:
+        return len(self.store)
+
     def __str__(self) -> str:
         """Строковое представление курса."""
         return (f"Курс: {self.course_name}, Преподаватель: {self.instructor}, "
-                f"Количество заданий: {len(self.assignments)}")
\ No newline at end of file
+                f"Количество заданий: {len(self.store)}")
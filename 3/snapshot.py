@@ -0,0 +1,167 @@
+import math
+import os
+import struct
+import sys
+from array import array
+from datetime import date, datetime
+from typing import List
+
+from models import Assignment, AssignmentStatus, Course
+from storage import ColumnStore, StringTable
+
+
+# File layout (all integers little-endian):
+#   header   <4sHHQI  magic, version, flags, record count, string count
+#   strings  <Q       byte length of the UTF-8 blob
+#            u32[string count] byte length of each string, then the blob
+#   records  stored column by column, each column fixed-width:
+#            u32 name code, u32 theme code, i32 date ordinal,
+#            u8 status code, f64 grade (NaN = no grade)
+MAGIC = b'ASNP'
+VERSION = 1
+_HEADER = struct.Struct('<4sHHQI')
+_BLOB_SIZE = struct.Struct('<Q')
+_COLUMN_TYPES = ('I', 'I', 'i', 'B', 'd')
+_MAX_ORDINAL = date.max.toordinal()
+_STATUS_COUNT = len(AssignmentStatus)
+
+
+class Snapshot:
+    """Versioned binary snapshot of a course, next to the text format."""
+
+    @staticmethod
+    def save_to_file(file_path: str, course: Course) -> None:
+        """Save all assignments from the course as a binary snapshot.
+
+        The snapshot is written into a temporary file next to the target,
+        which then replaces it, so a failed save leaves the old one intact.
+        """
+        strings, columns = Snapshot._columns(course)
+        encoded = [value.encode('utf-8') for value in strings]
+        lengths = array('I', (len(value) for value in encoded))
+        blob = b''.join(encoded)
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            try:
+                with open(temp_path, 'wb') as file:
+                    file.write(_HEADER.pack(MAGIC, VERSION, 0, len(columns[0]), len(strings)))
+                    file.write(_BLOB_SIZE.pack(len(blob)))
+                    file.write(Snapshot._to_little_endian(lengths))
+                    file.write(blob)
+                    for column in columns:
+                        file.write(Snapshot._to_little_endian(column))
+                os.replace(temp_path, file_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+        except IOError as e:
+            raise IOError(f"Ошибка записи в файл {file_path}: {e}") from e
+
+    @staticmethod
+    def load_from_file(file_path: str, course: Course) -> int:
+        """Read a binary snapshot into the course and return the number of records.
+
+        An empty course backed by ``ColumnStore`` takes the columns as they are;
+        otherwise every record is added through ``Course.add_assignment``.
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл {file_path} не найден")
+        return Snapshot.load_from_bytes(data, course)
+
+    @staticmethod
+    def load_from_bytes(data: bytes, course: Course) -> int:
+        """Read snapshot bytes already in memory into the course (see ``load_from_file``)."""
+        strings, columns = Snapshot._parse(memoryview(data))
+        count = len(columns[0])
+        if isinstance(course.store, ColumnStore) and not len(course):
+            store = ColumnStore.from_columns(strings, *columns)
+            course.swap_contents(Course(course.course_name, course.instructor, store))
+            return count
+        names, themes, dates, statuses, grades = columns
+        for row in range(count):
+            grade = grades[row]
+            course.add_assignment(Assignment(
+                strings[names[row]], strings[themes[row]], datetime.fromordinal(dates[row]),
+                ColumnStore.status_from_code(statuses[row]), None if math.isnan(grade) else grade))
+        return count
+
+    @staticmethod
+    def _columns(course: Course):
+        """Collect the course into a string table and five arrays."""
+        store = course.store
+        if isinstance(store, ColumnStore) and not store.dead_rows:
+            return store.strings.strings(), (store.names, store.themes, store.dates, store.statuses, store.grades)
+        table = StringTable()
+        columns = tuple(array(typecode) for typecode in _COLUMN_TYPES)
+        names, themes, dates, statuses, grades = columns
+        for assignment in course.get_assignments():
+            names.append(table.encode(assignment.student_name))
+            themes.append(table.encode(assignment.theme_name))
+            dates.append(assignment.issue_ordinal)
+            statuses.append(ColumnStore.status_code(assignment.status))
+            grades.append(math.nan if assignment.grade is None else assignment.grade)
+        return table.strings(), columns
+
+    @staticmethod
+    def _parse(data: memoryview):
+        """Split snapshot bytes into the string table and column arrays."""
+        try:
+            magic, version, _, count, string_count = _HEADER.unpack_from(data, 0)
+        except struct.error as e:
+            raise ValueError("Файл не является снимком курса") from e
+        if magic != MAGIC:
+            raise ValueError("Файл не является снимком курса")
+        if version != VERSION:
+            raise ValueError(f"Неподдерживаемая версия снимка: {version}")
+        offset = _HEADER.size
+        try:
+            (blob_size,) = _BLOB_SIZE.unpack_from(data, offset)
+        except struct.error as e:
+            raise ValueError("Снимок повреждён: файл обрезан") from e
+        offset += _BLOB_SIZE.size
+        lengths, offset = Snapshot._read_array(data, offset, 'I', string_count)
+        blob = data[offset:offset + blob_size]
+        if len(blob) != blob_size:
+            raise ValueError("Снимок повреждён: файл обрезан")
+        offset += blob_size
+        strings: List[str] = []
+        position = 0
+        for length in lengths:
+            strings.append(str(blob[position:position + length], 'utf-8'))
+            position += length
+        columns = []
+        for typecode in _COLUMN_TYPES:
+            column, offset = Snapshot._read_array(data, offset, typecode, count)
+            columns.append(column)
+        if count and max(max(columns[0]), max(columns[1])) >= len(strings):
+            raise ValueError("Снимок повреждён: неверный код строки")
+        if count and (min(columns[2]) < 1 or max(columns[2]) > _MAX_ORDINAL):
+            raise ValueError("Снимок повреждён: неверная дата")
+        if count and max(columns[3]) >= _STATUS_COUNT:
+            raise ValueError("Снимок повреждён: неверный код статуса")
+        return strings, columns
+
+    @staticmethod
+    def _read_array(data: memoryview, offset: int, typecode: str, count: int):
+        """Read ``count`` little-endian items starting at ``offset``."""
+        column = array(typecode)
+        end = offset + count * column.itemsize
+        if end > len(data):
+            raise ValueError("Снимок повреждён: файл обрезан")
+        column.frombytes(data[offset:end])
+        if sys.byteorder == 'big':
+            column.byteswap()
+        return column, end
+
+    @staticmethod
+    def _to_little_endian(column: array) -> bytes:
+        """Serialize an array in little-endian byte order."""
+        if sys.byteorder == 'big':
+            column = array(column.typecode, column)
+            column.byteswap()
+        return column.tobytes()
+
@@ -0,0 +1,319 @@
+import bisect
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from distributor import Distributor
+from models import Assignment, AssignmentStatus, date_from_ordinal, format_ordinal
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assignments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student TEXT NOT NULL,
+    theme TEXT NOT NULL,
+    issue_date INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    grade REAL
+);
+CREATE INDEX IF NOT EXISTS assignments_student ON assignments (student);
+CREATE INDEX IF NOT EXISTS assignments_theme ON assignments (theme);
+CREATE INDEX IF NOT EXISTS assignments_status ON assignments (status);
+CREATE INDEX IF NOT EXISTS assignments_issue_date ON assignments (issue_date);
+"""
+_INSERT = "INSERT INTO assignments (student, theme, issue_date, status, grade) VALUES (?, ?, ?, ?, ?)"
+_SELECT = "SELECT student, theme, issue_date, status, grade FROM assignments WHERE id = ?"
+_IMPORT_BATCH = 10000
+# Идентификаторы для позиционного доступа читаются страницами такого размера;
+# для каждой страницы запоминается её первый идентификатор.
+_ID_PAGE = 256
+
+
+class SqliteAssignmentView:
+    """Задание, прочитанное из базы SQLite.
+
+    Поля читаются один раз при получении записи, а изменения статуса и
+    оценки сразу записываются в базу.
+    """
+    __slots__ = ('_store', '_id', 'student_name', 'theme_name', '_ordinal', 'status', 'grade')
+
+    def __init__(self, store: "SqliteStore", record_id: int, row: tuple):
+        """Инициализация представления.
+
+        Args:
+            store: Хранилище SQLite.
+            record_id: Идентификатор записи.
+            row: Строка таблицы (ФИО, тема, дата, статус, оценка).
+        """
+        self._store = store
+        self._id = record_id
+        self.student_name, self.theme_name = row[0], row[1]
+        self._ordinal = row[2]
+        self.status = AssignmentStatus(row[3])
+        self.grade = row[4]
+
+    @property
+    def issue_date(self) -> datetime:
+        return date_from_ordinal(self._ordinal)
+
+    @property
+    def issue_ordinal(self) -> int:
+        return self._ordinal
+
+    @property
+    def date_text(self) -> str:
+        return format_ordinal(self._ordinal)
+
+    def update_status(self, new_status: AssignmentStatus) -> None:
+        """Обновление статуса задания.
+
+        Args:
+            new_status: Новый статус задания.
+        """
+        self._store.execute("UPDATE assignments SET status = ? WHERE id = ?", (new_status.value, self._id))
+        self.status = new_status
+
+    def set_grade(self, grade: float) -> None:
+        """Установка оценки для задания.
+
+        Args:
+            grade: Оценка (от 0 до 100).
+
+        Raises:
+            ValueError: Если оценка вне диапазона [0, 100].
+        """
+        if not 0 <= grade <= 100:
+            raise ValueError("Оценка должна быть от 0 до 100")
+        self._store.execute("UPDATE assignments SET grade = ?, status = ? WHERE id = ?",
+                            (grade, AssignmentStatus.GRADED.value, self._id))
+        self.grade = grade
+        self.status = AssignmentStatus.GRADED
+
+    def to_assignment(self) -> Assignment:
+        """Создание независимого объекта ``Assignment`` с теми же данными."""
+        return Assignment(self.student_name, self.theme_name, self.issue_date, self.status, self.grade)
+
+    def __str__(self) -> str:
+        """Строковое представление задания с учетом статуса и оценки."""
+        grade_str = f", Оценка: {self.grade}" if self.grade is not None else ""
+        return (f"Студент: {self.student_name}, Тема: {self.theme_name}, "
+                f"Дата выдачи: {self.date_text}, "
+                f"Статус: {self.status.value}{grade_str}")
+
+
+class SqliteStore:
+    """Хранилище заданий курса в базе SQLite.
+
+    Записи лежат в таблице ``assignments`` с индексами по ФИО, теме, статусу
+    и дате выдачи, поэтому курс открывается без разбора текстового файла, а
+    ``Course.query_ids`` выполняется запросом к базе вместо индексов в памяти.
+    Идентификатор записи равен ``id`` строки таблицы. Время суток в дате не
+    сохраняется. Каждое изменение фиксируется сразу; массовый импорт
+    выполняется одной транзакцией.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Открытие (или создание) базы.
+
+        Args:
+            path: Путь к файлу базы (по умолчанию база в памяти).
+        """
+        self.path = path
+        # Курс может заполняться в фоновом потоке (загрузка в GUI), а
+        # использоваться в основном; одновременного доступа при этом нет.
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._count = self._connection.execute("SELECT COUNT(*) FROM assignments").fetchone()[0]
+        # _anchors[k] — идентификатор на позиции k * _ID_PAGE (известные страницы).
+        self._anchors: List[int] = []
+        self._page_index = 0
+        self._page: List[int] = []
+
+    def execute(self, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
+        """Выполнение SQL-запроса к базе хранилища."""
+        return self._connection.execute(sql, parameters)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Выполнение изменений одной транзакцией; при ошибке она откатывается."""
+        self._connection.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def add(self, assignment: Assignment) -> int:
+        """Добавление задания.
+
+        Args:
+            assignment: Объект задания.
+
+        Returns:
+            Идентификатор записи.
+        """
+        cursor = self._connection.execute(_INSERT, self._row(assignment))
+        self._count += 1
+        return cursor.lastrowid
+
+    def import_records(self, assignments: Iterable[Assignment]) -> int:
+        """Массовое добавление заданий одной транзакцией.
+
+        Записи пишутся напрямую в базу, минуя курс, поэтому импорт нужно
+        выполнять до создания ``Course`` поверх хранилища. При ошибке
+        транзакция откатывается целиком.
+
+        Args:
+            assignments: Задания для добавления.
+
+        Returns:
+            Количество добавленных заданий.
+        """
+        rows = map(self._row, assignments)
+        added = 0
+        with self.transaction():
+            while True:
+                batch = list(islice(rows, _IMPORT_BATCH))
+                if not batch:
+                    break
+                self._connection.executemany(_INSERT, batch)
+                added += len(batch)
+        self._count += added
+        return added
+
+    def import_file(self, file_path: str, logger=None) -> int:
+        """Импорт заданий из текстового файла одной транзакцией.
+
+        Args:
+            file_path: Путь к файлу в текстовом формате.
+            logger: ``FileLogger`` для ошибок разбора строк (необязательно).
+
+        Returns:
+            Количество добавленных заданий.
+
+        Raises:
+            FileNotFoundError: Если файл не найден.
+        """
+        return self.import_records(Distributor.iter_from_file(file_path, logger=logger))
+
+    def remove(self, record_id: int) -> Assignment:
+        """Удаление задания по идентификатору.
+
+        Args:
+            record_id: Идентификатор записи.
+
+        Returns:
+            Удалённое задание в виде ``Assignment``.
+
+        Raises:
+            KeyError: Если записи нет.
+        """
+        assignment = self.get(record_id).to_assignment()
+        self._connection.execute("DELETE FROM assignments WHERE id = ?", (record_id,))
+        self._count -= 1
+        # Позиции записей после удалённой сдвинулись.
+        del self._anchors[bisect.bisect_left(self._anchors, record_id):]
+        self._page = []
+        return assignment
+
+    def get(self, record_id: int) -> SqliteAssignmentView:
+        """Получение записи по идентификатору.
+
+        Raises:
+            KeyError: Если записи нет.
+        """
+        row = self._connection.execute(_SELECT, (record_id,)).fetchone()
+        if row is None:
+            raise KeyError(record_id)
+        return SqliteAssignmentView(self, record_id, row)
+
+    def ids(self) -> Iterator[int]:
+        """Идентификаторы записей в порядке добавления."""
+        for (record_id,) in self._connection.execute("SELECT id FROM assignments ORDER BY id"):
+            yield record_id
+
+    def id_at(self, position: int) -> int:
+        """Идентификатор записи на заданной позиции в порядке добавления.
+
+        Позволяет ``Course`` не держать в памяти массив всех идентификаторов;
+        соседние позиции читаются из базы одной страницей, начиная с её
+        первого идентификатора (``WHERE id >= ?``), а не через ``OFFSET``,
+        поэтому время чтения не растёт с номером позиции. Новые записи
+        получают наибольший ``id`` и не сдвигают позиции, а удаление
+        сбрасывает известные страницы только после удалённой записи.
+
+        Raises:
+            IndexError: Если позиция вне диапазона.
+        """
+        if not 0 <= position < self._count:
+            raise IndexError("Недопустимый индекс задания")
+        page_index, offset = divmod(position, _ID_PAGE)
+        if page_index != self._page_index or offset >= len(self._page):
+            self._find_anchors(page_index)
+            self._page_index = page_index
+            self._page = [record_id for (record_id,) in self._connection.execute(
+                "SELECT id FROM assignments WHERE id >= ? ORDER BY id LIMIT ?",
+                (self._anchors[page_index], _ID_PAGE))]
+        return self._page[offset]
+
+    def _find_anchors(self, page_index: int) -> None:
+        """Дочитывание первых идентификаторов страниц до ``page_index`` включительно."""
+        anchors = self._anchors
+        if page_index < len(anchors):
+            return
+        if anchors:
+            cursor = self._connection.execute(
+                "SELECT id FROM assignments WHERE id > ? ORDER BY id LIMIT ?",
+                (anchors[-1], (page_index - len(anchors) + 1) * _ID_PAGE))
+            start = _ID_PAGE - 1
+        else:
+            cursor = self._connection.execute(
+                "SELECT id FROM assignments ORDER BY id LIMIT ?", ((page_index + 1) * _ID_PAGE,))
+            start = 0
+        anchors.extend(record_id for (record_id,) in islice(cursor, start, None, _ID_PAGE))
+
+    def query_ids(self, student: Optional[str] = None, theme: Optional[str] = None,
+                  status: Optional[AssignmentStatus] = None) -> List[int]:
+        """Поиск идентификаторов записей по индексам базы.
+
+        Условия объединяются по «И»; без условий возвращаются все записи.
+
+        Returns:
+            Идентификаторы в порядке добавления.
+        """
+        conditions, parameters = [], []
+        for column, value in (("student", student), ("theme", theme),
+                              ("status", status.value if status is not None else None)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self._connection.execute(f"SELECT id FROM assignments{where} ORDER BY id", parameters)
+        return [record_id for (record_id,) in cursor]
+
+    def clear(self) -> None:
+        """Удаление всех заданий; новые идентификаторы продолжают нумерацию."""
+        self._connection.execute("DELETE FROM assignments")
+        self._count = 0
+        self._anchors = []
+        self._page = []
+
+    def close(self) -> None:
+        """Закрытие соединения с базой."""
+        self._connection.close()
+
+    @staticmethod
+    def _row(assignment: Assignment) -> tuple:
+        """Строка таблицы для задания."""
+        return (assignment.student_name, assignment.theme_name, assignment.issue_ordinal,
+                assignment.status.value, assignment.grade)
+
+    def __contains__(self, record_id: int) -> bool:
+        return self._connection.execute(
+            "SELECT 1 FROM assignments WHERE id = ?", (record_id,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._count
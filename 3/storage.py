@@ -0,0 +1,364 @@
+import math
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from models import Assignment, AssignmentStatus, date_from_ordinal, format_ordinal
+
+
+_STATUSES = list(AssignmentStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_NO_GRADE = math.nan
+_DELETED = 255
+
+
+class StringTable:
+    """Таблица уникальных строк: каждая строка хранится один раз и кодируется числом."""
+
+    def __init__(self, strings: Optional[List[str]] = None):
+        """Инициализация таблицы.
+
+        Args:
+            strings: Уникальные строки в порядке их кодов (по умолчанию пусто).
+        """
+        self._strings: List[str] = list(strings) if strings else []
+        self._codes: Dict[str, int] = {value: code for code, value in enumerate(self._strings)}
+
+    def encode(self, value: str) -> int:
+        """Получение кода строки с добавлением её в таблицу при необходимости.
+
+        Args:
+            value: Строка.
+
+        Returns:
+            Код строки.
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(value)
+            self._codes[value] = code
+        return code
+
+    def decode(self, code: int) -> str:
+        """Получение строки по коду.
+
+        Args:
+            code: Код строки.
+
+        Returns:
+            Строка.
+        """
+        return self._strings[code]
+
+    def strings(self) -> List[str]:
+        """Все строки таблицы в порядке их кодов."""
+        return self._strings
+
+    def memory_usage(self) -> int:
+        """Приблизительный объём памяти таблицы в байтах, включая сами строки."""
+        return (sys.getsizeof(self._strings) + sys.getsizeof(self._codes)
+                + sum(map(sys.getsizeof, self._strings)))
+
+    def clear(self) -> None:
+        """Очистка таблицы."""
+        self._strings.clear()
+        self._codes.clear()
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class AssignmentView:
+    """Лёгкое представление строки колоночного хранилища.
+
+    Ведёт себя как ``Assignment``: читает поля из колонок и записывает
+    изменения статуса и оценки обратно, увеличивая версию хранилища.
+    """
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store: "ColumnStore", row: int):
+        """Инициализация представления.
+
+        Args:
+            store: Колоночное хранилище.
+            row: Номер строки.
+        """
+        self._store = store
+        self._row = row
+
+    @property
+    def student_name(self) -> str:
+        return self._store.strings.decode(self._store.names[self._row])
+
+    @property
+    def theme_name(self) -> str:
+        return self._store.strings.decode(self._store.themes[self._row])
+
+    @property
+    def issue_date(self) -> datetime:
+        return date_from_ordinal(self._store.dates[self._row])
+
+    @property
+    def issue_ordinal(self) -> int:
+        return self._store.dates[self._row]
+
+    @property
+    def date_text(self) -> str:
+        return format_ordinal(self._store.dates[self._row])
+
+    @property
+    def status(self) -> AssignmentStatus:
+        return _STATUSES[self._store.statuses[self._row]]
+
+    @property
+    def grade(self) -> float | None:
+        grade = self._store.grades[self._row]
+        return None if grade != grade else grade
+
+    def update_status(self, new_status: AssignmentStatus) -> None:
+        """Обновление статуса задания.
+
+        Args:
+            new_status: Новый статус задания.
+        """
+        self._store.statuses[self._row] = _STATUS_CODES[new_status]
+        self._store.version += 1
+
+    def set_grade(self, grade: float) -> None:
+        """Установка оценки для задания.
+
+        Args:
+            grade: Оценка (от 0 до 100).
+
+        Raises:
+            ValueError: Если оценка вне диапазона [0, 100].
+        """
+        if not 0 <= grade <= 100:
+            raise ValueError("Оценка должна быть от 0 до 100")
+        self._store.grades[self._row] = grade
+        self._store.statuses[self._row] = _STATUS_CODES[AssignmentStatus.GRADED]
+        self._store.version += 1
+
+    def to_assignment(self) -> Assignment:
+        """Создание независимого объекта ``Assignment`` с теми же данными."""
+        return Assignment(self.student_name, self.theme_name, self.issue_date, self.status, self.grade)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AssignmentView):
+            return self._store is other._store and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._row))
+
+    def __str__(self) -> str:
+        """Строковое представление задания с учетом статуса и оценки."""
+        grade = self.grade
+        grade_str = f", Оценка: {grade}" if grade is not None else ""
+        return (f"Студент: {self.student_name}, Тема: {self.theme_name}, "
+                f"Дата выдачи: {self.date_text}, "
+                f"Статус: {self.status.value}{grade_str}")
+
+
+class ColumnStore:
+    """Колоночное хранилище заданий курса.
+
+    Даты хранятся как порядковые номера дней, статус - как код ``uint8``,
+    оценка - как ``float64`` с NaN вместо отсутствующей, а ФИО и темы -
+    как коды в общей таблице строк. Идентификатор записи равен смещению
+    строки плюс база, поэтому поиск по нему не требует словаря; удалённые
+    строки помечаются надгробием. После ``compact`` идентификаторы строк
+    хранятся отдельным отсортированным массивом и ищутся двоичным поиском.
+    ``version`` увеличивается при каждом изменении данных, в том числе через
+    представления записей. Время суток в дате не сохраняется.
+    """
+
+    def __init__(self):
+        """Инициализация пустого хранилища."""
+        self.strings = StringTable()
+        self.names = array('I')
+        self.themes = array('I')
+        self.dates = array('i')
+        self.statuses = array('B')
+        self.grades = array('d')
+        self._base = 0
+        self._dead = 0
+        # Идентификаторы строк после уплотнения (иначе ``None``) и следующий
+        # идентификатор для уплотнённого хранилища.
+        self._row_ids: Optional[array] = None
+        self._next_id = 0
+        self.version = 0
+
+    @classmethod
+    def from_columns(cls, strings: List[str], names: array, themes: array, dates: array,
+                     statuses: array, grades: array) -> "ColumnStore":
+        """Создание хранилища из готовых колонок без копирования по записям.
+
+        Args:
+            strings: Таблица строк, на которую ссылаются коды ``names`` и ``themes``.
+            names: Коды ФИО (``array('I')``).
+            themes: Коды тем (``array('I')``).
+            dates: Порядковые номера дней (``array('i')``).
+            statuses: Коды статусов (``array('B')``).
+            grades: Оценки с NaN вместо отсутствующих (``array('d')``).
+
+        Returns:
+            Новое хранилище.
+
+        Raises:
+            ValueError: Если колонки разной длины или содержат неизвестный статус.
+        """
+        if not len(names) == len(themes) == len(dates) == len(statuses) == len(grades):
+            raise ValueError("Колонки должны быть одинаковой длины")
+        if statuses and max(statuses) >= len(_STATUSES):
+            raise ValueError("Недопустимый код статуса")
+        store = cls()
+        store.strings = StringTable(strings)
+        store.names, store.themes, store.dates = names, themes, dates
+        store.statuses, store.grades = statuses, grades
+        return store
+
+    @staticmethod
+    def status_code(status: AssignmentStatus) -> int:
+        """Код статуса, используемый в колонке ``statuses``."""
+        return _STATUS_CODES[status]
+
+    @staticmethod
+    def status_from_code(code: int) -> AssignmentStatus:
+        """Статус по коду из колонки ``statuses``."""
+        return _STATUSES[code]
+
+    @property
+    def dead_rows(self) -> int:
+        """Количество строк-надгробий."""
+        return self._dead
+
+    def memory_usage(self) -> int:
+        """Приблизительный объём памяти хранилища в байтах.
+
+        Returns:
+            Размер колонок и таблицы строк.
+        """
+        columns = (self.names, self.themes, self.dates, self.statuses, self.grades)
+        usage = sum(map(sys.getsizeof, columns)) + self.strings.memory_usage()
+        if self._row_ids is not None:
+            usage += sys.getsizeof(self._row_ids)
+        return usage
+
+    def add(self, assignment: Assignment) -> int:
+        """Добавление задания.
+
+        Args:
+            assignment: Объект задания.
+
+        Returns:
+            Идентификатор записи.
+        """
+        self.names.append(self.strings.encode(assignment.student_name))
+        self.themes.append(self.strings.encode(assignment.theme_name))
+        self.dates.append(assignment.issue_ordinal)
+        self.statuses.append(_STATUS_CODES[assignment.status])
+        self.grades.append(_NO_GRADE if assignment.grade is None else assignment.grade)
+        self.version += 1
+        if self._row_ids is None:
+            return self._base + len(self.statuses) - 1
+        record_id = self._next_id
+        self._next_id += 1
+        self._row_ids.append(record_id)
+        return record_id
+
+    def remove(self, record_id: int) -> Assignment:
+        """Удаление задания по идентификатору (строка помечается надгробием).
+
+        Args:
+            record_id: Идентификатор записи.
+
+        Returns:
+            Удалённое задание в виде ``Assignment``.
+
+        Raises:
+            KeyError: Если записи нет.
+        """
+        assignment = self.get(record_id).to_assignment()
+        self.statuses[self._row(record_id)] = _DELETED
+        self._dead += 1
+        self.version += 1
+        return assignment
+
+    def get(self, record_id: int) -> AssignmentView:
+        """Получение представления записи по идентификатору.
+
+        Raises:
+            KeyError: Если записи нет.
+        """
+        row = self._row(record_id)
+        if row < 0:
+            raise KeyError(record_id)
+        return AssignmentView(self, row)
+
+    def _row(self, record_id: int) -> int:
+        """Номер строки живой записи или -1, если записи нет."""
+        row_ids = self._row_ids
+        if row_ids is None:
+            row = record_id - self._base
+            if not 0 <= row < len(self.statuses):
+                return -1
+        else:
+            row = bisect_left(row_ids, record_id)
+            if row == len(row_ids) or row_ids[row] != record_id:
+                return -1
+        return row if self.statuses[row] != _DELETED else -1
+
+    def ids(self) -> Iterable[int]:
+        """Идентификаторы записей в порядке добавления."""
+        if not self._dead:
+            if self._row_ids is not None:
+                return iter(self._row_ids)
+            return range(self._base, self._base + len(self.statuses))
+        return self._live_ids()
+
+    def _live_ids(self) -> Iterator[int]:
+        """Идентификаторы записей, пропуская надгробия."""
+        row_ids = self._row_ids
+        base = self._base
+        for row, code in enumerate(self.statuses):
+            if code != _DELETED:
+                yield base + row if row_ids is None else row_ids[row]
+
+    def compact(self) -> None:
+        """Удаление строк-надгробий из колонок.
+
+        Идентификаторы записей сохраняются; полученные ранее представления
+        (``AssignmentView``) после уплотнения использовать нельзя.
+        """
+        if not self._dead:
+            return
+        keep = [row for row, code in enumerate(self.statuses) if code != _DELETED]
+        if self._row_ids is None:
+            self._next_id = self._base + len(self.statuses)
+            self._row_ids = array('q', (self._base + row for row in keep))
+        else:
+            self._row_ids = array('q', (self._row_ids[row] for row in keep))
+        for name in ('names', 'themes', 'dates', 'statuses', 'grades'):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, (column[row] for row in keep)))
+        self._dead = 0
+
+    def clear(self) -> None:
+        """Удаление всех заданий; новые идентификаторы продолжают нумерацию."""
+        self._base = self._base + len(self.statuses) if self._row_ids is None else self._next_id
+        self._row_ids = None
+        self._dead = 0
+        self.version += 1
+        self.strings.clear()
+        for column in (self.names, self.themes, self.dates, self.statuses, self.grades):
+            del column[:]
+
+    def __contains__(self, record_id: int) -> bool:
+        return self._row(record_id) >= 0
+
+    def __len__(self) -> int:
+        return len(self.statuses) - self._dead
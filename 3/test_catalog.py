@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+from catalog import Catalog
+from datagen import write_file
+from distributor import Distributor
+from models import Assignment, AssignmentStatus
+
+
+def make_assignment(student, theme="ООП", status=AssignmentStatus.PENDING, grade=None):
+    return Assignment(student, theme, 739000, status, grade)
+
+
+class TestCatalog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.catalog = Catalog(self.directory.name)
+        self.addCleanup(self.catalog.close)
+
+    def test_headers_without_loading(self):
+        first = self.catalog.add_course("Python", "Иванов И.И.",
+                                        [make_assignment("Петров"), make_assignment("Петров"),
+                                         make_assignment("Сидоров")])
+        second = self.catalog.add_course("Базы данных", "Смирнов С.С.")
+        self.assertEqual([header.course_id for header in self.catalog.headers()], [first, second])
+        header = self.catalog.header(first)
+        self.assertEqual((header.course_name, header.assignments, header.students), ("Python", 3, 2))
+        self.assertEqual(self.catalog.loaded_ids, [])
+        self.assertEqual(len(self.catalog), 2)
+        with self.assertRaises(KeyError):
+            self.catalog.header(999)
+
+    def test_lazy_load_and_lru_eviction(self):
+        ids = [self.catalog.add_course(f"Группа {index}", "", [make_assignment(f"Студент {index}")] * 50)
+               for index in range(4)]
+        self.catalog.memory_budget = self.catalog.course(ids[0]).memory_usage() * 2
+        self.catalog.course(ids[1])
+        self.catalog.course(ids[0])
+        self.assertEqual(self.catalog.loaded_ids, [ids[1], ids[0]])
+        self.catalog.course(ids[2])
+        self.assertEqual(self.catalog.loaded_ids, [ids[0], ids[2]])
+        self.assertLessEqual(self.catalog.memory_used, self.catalog.memory_budget)
+
+    def test_changes_survive_eviction_and_reopen(self):
+        course_id = self.catalog.add_course("Python", "", [make_assignment("Петров")])
+        other = self.catalog.add_course("ООП", "", [make_assignment("Сидоров")])
+        course = self.catalog.course(course_id)
+        course.add_assignment(make_assignment("Кузнецов"))
+        self.catalog.memory_budget = 0
+        self.catalog.course(other)
+        self.assertEqual(self.catalog.loaded_ids, [other])
+        self.assertEqual(self.catalog.header(course_id).assignments, 2)
+        self.catalog.course(other).set_grade(self.catalog.course(other).id_at(0), 90.0)
+        self.catalog.close()
+        self.catalog = Catalog(self.directory.name)
+        self.addCleanup(self.catalog.close)
+        self.assertEqual(self.catalog.course(other).get_assignments()[0].grade, 90.0)
+        self.assertEqual([header.course_id for header, _ in self.catalog.student_courses("Кузнецов")],
+                         [course_id])
+
+    def test_view_writes_are_saved(self):
+        course_id = self.catalog.add_course("Python", "", [make_assignment("Петров")])
+        other = self.catalog.add_course("ООП", "", [make_assignment("Сидоров")])
+        self.catalog.course(course_id).get_assignments()[0].set_grade(77.0)
+        self.catalog.memory_budget = 0
+        course = self.catalog.course(other)
+        self.assertEqual(self.catalog.loaded_ids, [other])
+        self.assertEqual(len(course.strings), 0)
+        self.catalog.course(other).get_assignments()[0].update_status(AssignmentStatus.SUBMITTED)
+        self.catalog.close()
+        self.catalog = Catalog(self.directory.name)
+        self.addCleanup(self.catalog.close)
+        self.assertEqual(self.catalog.course(course_id).get_assignments()[0].grade, 77.0)
+        self.assertEqual(self.catalog.course(other).get_assignments()[0].status, AssignmentStatus.SUBMITTED)
+
+    def test_student_queries_load_only_their_courses(self):
+        ids = [self.catalog.add_course("A", "", [make_assignment("Петров"), make_assignment("Сидоров")]),
+               self.catalog.add_course("B", "", [make_assignment("Сидоров")]),
+               self.catalog.add_course("C", "", [make_assignment("Петров", "Тесты")])]
+        self.assertEqual([(header.course_id, count) for header, count in self.catalog.student_courses("Петров")],
+                         [(ids[0], 1), (ids[2], 1)])
+        found = [(course_id, assignment.theme_name)
+                 for course_id, assignment in self.catalog.student_assignments("Петров")]
+        self.assertEqual(found, [(ids[0], "ООП"), (ids[2], "Тесты")])
+        self.assertEqual(sorted(self.catalog.loaded_ids), [ids[0], ids[2]])
+
+    def test_remove_course(self):
+        course_id = self.catalog.add_course("Python", "", [make_assignment("Петров")])
+        self.catalog.course(course_id)
+        self.catalog.remove_course(course_id)
+        self.assertNotIn(course_id, self.catalog)
+        self.assertEqual(self.catalog.student_courses("Петров"), [])
+        self.assertEqual(self.catalog.loaded_ids, [])
+
+    def test_ingest_adds_a_course_per_file(self):
+        sources = os.path.join(self.directory.name, "groups")
+        os.mkdir(sources)
+        for name in ("b", "a"):
+            write_file(os.path.join(sources, f"{name}.txt"), 30, seed=ord(name))
+        report = self.catalog.ingest([sources], instructor="Иванов И.И.", workers=1)
+        self.assertEqual([header.course_name for header in self.catalog.headers()], ["a", "b"])
+        self.assertEqual(sum(header.assignments for header in self.catalog.headers()), report.records)
+        course = self.catalog.course(self.catalog.headers()[0].course_id)
+        with open(os.path.join(sources, "a.txt"), encoding='utf-8') as file:
+            expected = [Distributor.format_record(Distributor.parse_record(line.strip())) for line in file]
+        self.assertEqual([Distributor.format_record(assignment) for assignment in course.get_assignments()],
+                         expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import cli
+from sqlite_store import SqliteStore
+
+
+LINES = [
+    '"Иванов Иван" "ООП" 2025.01.15 Pending ""',
+    '"Петров Петр" "ООП" 2025.02.20 Graded 80.0',
+    'invalid line',
+    '"Иванов Иван" "Тесты" 2025.03.10 Graded 90.0',
+]
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.source = self.path("input.txt")
+        with open(self.source, 'w', encoding='utf-8') as file:
+            file.write("\n".join(LINES) + "\n")
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def run_cli(self, *argv):
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            code = cli.main(list(argv))
+        return code, out.getvalue(), err.getvalue()
+
+    def test_validate_reports_invalid_lines(self):
+        code, out, err = self.run_cli("validate", self.source)
+        self.assertEqual(code, cli.EXIT_INVALID_LINES)
+        self.assertIn("Записей: 3, ошибок: 1", out)
+        self.assertIn("Строка 3:", err)
+
+    def test_missing_file_is_a_failure(self):
+        code, _, err = self.run_cli("validate", self.path("missing.txt"))
+        self.assertEqual(code, cli.EXIT_FAILURE)
+        self.assertIn("Ошибка:", err)
+
+    def test_convert_round_trip_through_database_and_snapshot(self):
+        database, snapshot, text = self.path("out.db"), self.path("out.snap"), self.path("out.txt")
+        self.assertEqual(self.run_cli("import", self.source, database)[0], cli.EXIT_INVALID_LINES)
+        store = SqliteStore(database)
+        self.assertEqual(len(store), 3)
+        store.close()
+        self.assertEqual(self.run_cli("convert", database, snapshot)[0], cli.EXIT_OK)
+        self.assertEqual(self.run_cli("convert", snapshot, text)[0], cli.EXIT_OK)
+        with open(text, encoding='utf-8') as file:
+            self.assertEqual(file.read().splitlines(), [LINES[0], LINES[1], LINES[3]])
+
+    def test_text_round_trip_validates(self):
+        first, second = self.path("first.txt"), self.path("second.txt")
+        self.assertEqual(self.run_cli("convert", self.source, first)[0], cli.EXIT_INVALID_LINES)
+        self.assertEqual(self.run_cli("convert", first, second)[0], cli.EXIT_OK)
+        code, out, _ = self.run_cli("validate", second)
+        self.assertEqual(code, cli.EXIT_OK)
+        self.assertIn("Записей: 3, ошибок: 0", out)
+        with open(second, encoding='utf-8') as file:
+            self.assertEqual(file.read().splitlines(), [LINES[0], LINES[1], LINES[3]])
+
+    def test_query_filters_text_and_database(self):
+        database = self.path("out.db")
+        self.run_cli("import", self.source, database)
+        for source in (self.source, database):
+            with self.subTest(source=source):
+                _, out, _ = self.run_cli("query", source, "--student", "Иванов Иван", "--status", "Graded")
+                self.assertEqual(out.splitlines(), [LINES[3]])
+
+    def test_legacy_input(self):
+        legacy = self.path("legacy.txt")
+        with open(legacy, 'w', encoding='utf-8') as file:
+            file.write('"Иванов Иван"  "ООП" 2025.01.15\n')
+        code, out, _ = self.run_cli("convert", legacy, "-", "--legacy")
+        self.assertEqual(code, cli.EXIT_OK)
+        self.assertEqual(out.splitlines(), [LINES[0]])
+
+    def test_ingest_merges_files_and_reports_each(self):
+        second = self.path("second.txt")
+        with open(second, 'w', encoding='utf-8') as file:
+            file.write(LINES[0] + "\n")
+        target = self.path("merged.txt")
+        code, _, err = self.run_cli("ingest", self.directory.name, "--into", target, "--workers", "1")
+        self.assertEqual(code, cli.EXIT_INVALID_LINES)
+        self.assertIn("input.txt: записей 3, ошибок 1", err)
+        with open(target, encoding='utf-8') as file:
+            self.assertEqual(len(file.readlines()), 4)
+
+    def test_follow_prints_appended_records(self):
+        def sleep(seconds):
+            if sleep.calls:
+                raise KeyboardInterrupt
+            sleep.calls += 1
+            with open(self.source, 'a', encoding='utf-8') as file:
+                file.write(LINES[0] + "\n" + LINES[1][:10])
+        sleep.calls = 0
+        with mock.patch.object(cli.time, "sleep", sleep):
+            code, out, err = self.run_cli("follow", self.source, "--new-only")
+        self.assertEqual(code, cli.EXIT_OK)
+        self.assertEqual(out.splitlines(), [LINES[0]])
+
+    def test_stats_json(self):
+        code, out, _ = self.run_cli("stats", self.source, "--by", "student", "--json")
+        self.assertEqual(code, cli.EXIT_INVALID_LINES)
+        report = json.loads(out)
+        self.assertEqual(report["Всего"]["size"], 3)
+        self.assertEqual(report["Всего"]["mean"], 85.0)
+        self.assertEqual(report["Иванов Иван"]["count"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from datagen import generate_lines
+from distributor import Distributor
+
+
+class TestGenerateLines(unittest.TestCase):
+    def test_deterministic(self):
+        self.assertEqual(list(generate_lines(50, seed=3)), list(generate_lines(50, seed=3)))
+        self.assertNotEqual(list(generate_lines(50, seed=3)), list(generate_lines(50, seed=4)))
+
+    def test_valid_lines_parse(self):
+        for line in generate_lines(200):
+            Distributor.parse_record(line)
+
+    def test_malformed_fraction(self):
+        failed = 0
+        for line in generate_lines(2000, malformed=0.25):
+            try:
+                Distributor.parse_record(line)
+            except ValueError:
+                failed += 1
+        self.assertGreater(failed, 400)
+        self.assertLess(failed, 600)
+
+    def test_three_field_format(self):
+        line = next(generate_lines(1, fields=3))
+        self.assertEqual(len(line.split('"')), 5)
+        with self.assertRaises(ValueError):
+            next(generate_lines(1, fields=4))
+
+
+if __name__ == '__main__':
+    unittest.main()
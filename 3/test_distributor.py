@@ -0,0 +1,159 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from distributor import Distributor
+from file_logger import FileLogger
+from models import AssignmentStatus, Course
+
+
+SAMPLE_LINES = [
+    '"Иванов Иван" "Введение в Python" 2025.01.15 Pending ""',
+    '"Петров Петр" "Работа с файлами" 2025.02.20 Submitted 85.0',
+    '"Сидоров Сидор" "ООП" 2025.03.10 Graded 90',
+    '"Сидоров Сидор" "ООП" 2025.03.10 Graded .5',
+    '"Сюрюнмаа" "Проверка" 2025.05.23 Graded "100.0"',
+    '"Смирнов Сергей" "Тесты" 2025.13.01 Pending ""',
+    '"Смирнов Сергей" "Тесты" invalid_date Pending ""',
+    '"" "" 2025.04.01 Invalid 100',
+    '"А""Б" 2025.04.01 Pending ""',
+    '"А" "Б" 2025.04.01Pending ""',
+    'invalid line',
+]
+
+
+class TestParseRecord(unittest.TestCase):
+    def _parse_outcome(self, parser, line):
+        try:
+            a = parser(line)
+        except ValueError as e:
+            return ('error', str(e))
+        return (a.student_name, a.theme_name, a.issue_date, a.status, a.grade)
+
+    def test_fast_path_matches_token_parser(self):
+        for line in SAMPLE_LINES:
+            with self.subTest(line=line):
+                self.assertEqual(self._parse_outcome(Distributor.parse_record, line),
+                                 self._parse_outcome(Distributor._parse_tokens, line))
+
+    def test_parse_record_values(self):
+        a = Distributor.parse_record(SAMPLE_LINES[1])
+        self.assertEqual(a.issue_date, datetime(2025, 2, 20))
+        self.assertEqual(a.status, AssignmentStatus.SUBMITTED)
+        self.assertEqual(a.grade, 85.0)
+
+
+class TestCreateFromString(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.logger = FileLogger(os.path.join(self.tmp.name, "error.log"))
+        self.course = Course("Программирование на Python", "Иванов И.И.")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_valid_line_added(self):
+        Distributor.create_from_string(SAMPLE_LINES[0], self.course, self.logger)
+        self.assertEqual(len(self.course.get_assignments()), 1)
+
+    def test_invalid_line_logged(self):
+        with self.assertRaises(ValueError):
+            Distributor.create_from_string(SAMPLE_LINES[-1], self.course, self.logger)
+        with open(self.logger.log_file, encoding='utf-8') as file:
+            self.assertIn("Ожидалось 5 значений", file.read())
+
+
+class TestIterFromFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "input.txt")
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write("\n".join(SAMPLE_LINES[:3] + ["", "invalid line"]) + "\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_without_course(self):
+        assignments = list(Distributor.iter_from_file(self.path))
+        self.assertEqual([a.student_name for a in assignments],
+                         ["Иванов Иван", "Петров Петр", "Сидоров Сидор"])
+
+    def test_attaches_to_course_and_yields_errors(self):
+        course = Course("Программирование на Python", "Иванов И.И.")
+        items = list(Distributor.iter_from_file(self.path, course, yield_errors=True))
+        self.assertEqual(len(course.get_assignments()), 3)
+        line_number, error = items[-1]
+        self.assertEqual(line_number, 5)
+        self.assertIsInstance(error, ValueError)
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            next(Distributor.iter_from_file(os.path.join(self.tmp.name, "missing.txt")))
+
+
+class TestCreateFromFileParallel(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        with open("input.txt", 'w', encoding='utf-8') as file:
+            for i in range(200):
+                file.write(SAMPLE_LINES[i % len(SAMPLE_LINES)] + "\n")
+                if i % 7 == 0:
+                    file.write("\n")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def _load(self, workers):
+        course = Course("Программирование на Python", "Иванов И.И.")
+        if os.path.exists("error.log"):
+            os.remove("error.log")
+        Distributor.create_from_file("input.txt", course, workers=workers)
+        with open("error.log", encoding='utf-8') as file:
+            log = [line.split("] ", 1)[1] for line in file]
+        return [str(a) for a in course.get_assignments()], log
+
+    def test_matches_sequential(self):
+        self.assertEqual(self._load(None), self._load(3))
+
+
+class TestSaveToFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "output.txt")
+        self.course = Course("Программирование на Python", "Иванов И.И.")
+        for line in SAMPLE_LINES:
+            try:
+                self.course.add_assignment(Distributor.parse_record(line))
+            except ValueError:
+                pass
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_writes_all_records(self):
+        Distributor.save_to_file(self.path, self.course, fsync=True)
+        with open(self.path, encoding='utf-8') as file:
+            content = file.read()
+        self.assertEqual(content, ''.join(map(Distributor.format_record, self.course.get_assignments())))
+        self.assertEqual(os.listdir(self.tmp.name), ["output.txt"])
+
+    def test_failure_keeps_old_file(self):
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write("old\n")
+        def broken():
+            yield self.course.get_by_id(self.course.id_at(0))
+            raise OSError("диск заполнен")
+
+        self.course.get_assignments = broken
+        with self.assertRaises(IOError):
+            Distributor.save_to_file(self.path, self.course)
+        with open(self.path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), "old\n")
+        self.assertEqual(os.listdir(self.tmp.name), ["output.txt"])
+
+
+if __name__ == '__main__':
+    unittest.main()
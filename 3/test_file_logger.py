@@ -0,0 +1,72 @@
+import os
+import tempfile
+import time
+import unittest
+from file_logger import FileLogger
+
+
+class TestFileLogger(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "error.log")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _read(self, path=None):
+        with open(path or self.path, encoding='utf-8') as file:
+            return [line.split("] ", 1)[1].rstrip("\n") for line in file]
+
+    def test_sync_log(self):
+        FileLogger(self.path).log_error("ошибка")
+        self.assertEqual(self._read(), ["ошибка"])
+
+    def test_buffered_keeps_order(self):
+        with FileLogger(self.path, buffered=True, batch_size=7) as logger:
+            for i in range(50):
+                logger.log_error(f"строка {i}")
+        self.assertEqual(self._read(), [f"строка {i}" for i in range(50)])
+
+    def test_flush(self):
+        logger = FileLogger(self.path, buffered=True, flush_interval=60)
+        logger.log_error("ошибка")
+        logger.flush()
+        self.assertEqual(self._read(), ["ошибка"])
+        logger.close()
+
+    def test_rotation(self):
+        logger = FileLogger(self.path, max_bytes=100, backup_count=2)
+        for i in range(20):
+            logger.log_error(f"строка {i}")
+        self.assertTrue(os.path.exists(self.path + ".1"))
+        self.assertTrue(os.path.exists(self.path + ".2"))
+        self.assertFalse(os.path.exists(self.path + ".3"))
+        self.assertEqual(self._read()[-1], "строка 19")
+
+    def test_dedup(self):
+        with FileLogger(self.path, dedup_window=60) as logger:
+            for _ in range(5):
+                logger.log_error("одно и то же")
+        self.assertEqual(self._read(), ["одно и то же", "Повтор подавлен 4 раз: одно и то же"])
+
+    def test_dedup_forgets_expired_messages(self):
+        logger = FileLogger(self.path, dedup_window=0.05)
+        logger.log_error("первое")
+        logger.log_error("первое")
+        time.sleep(0.06)
+        logger.log_error("второе")
+        self.assertEqual(list(logger._last_seen), ["второе"])
+        self.assertEqual(self._read(), ["первое", "Повтор подавлен 1 раз: первое", "второе"])
+
+    def test_flush_after_writer_died(self):
+        logger = FileLogger(self.path, buffered=True, flush_interval=60)
+        logger._queue.put(None)
+        logger._worker.join()
+        logger.log_error("ошибка")
+        logger.flush()
+        self.assertEqual(self._read(), ["ошибка"])
+        logger.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
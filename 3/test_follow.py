@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+
+from follow import FileFollower
+from models import ChangeKind, Course
+
+
+LINE_A = '"Иванов Иван" "ООП" 2025.01.15 Pending ""\n'
+LINE_B = '"Петров Петр" "Тесты" 2025.02.20 Graded 80.0\n'
+LINE_C = '"Сидоров Сидор" "ООП" 2025.03.10 Submitted ""\n'
+
+
+class TestFileFollower(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "assignments.txt")
+        self.write(LINE_A)
+        self.course = Course("", "")
+        self.events = []
+        self.course.subscribe(lambda kind, record_id: self.events.append(kind))
+        self.follower = FileFollower(self.path, self.course)
+
+    def write(self, text, mode='w'):
+        with open(self.path, mode, encoding='utf-8') as file:
+            file.write(text)
+
+    def names(self):
+        return [assignment.student_name for assignment in self.course.get_assignments()]
+
+    def test_first_poll_loads_and_later_polls_append(self):
+        update = self.follower.poll()
+        self.assertTrue(update.reloaded)
+        self.assertEqual(self.events, [ChangeKind.RELOADED])
+        self.assertFalse(self.follower.poll())
+        self.write(LINE_B + LINE_C, 'a')
+        update = self.follower.poll()
+        self.assertFalse(update.reloaded)
+        self.assertEqual([assignment.student_name for assignment in update.assignments],
+                         ["Петров Петр", "Сидоров Сидор"])
+        self.assertEqual(self.names(), ["Иванов Иван", "Петров Петр", "Сидоров Сидор"])
+        self.assertEqual(self.events[1:], [ChangeKind.ADDED, ChangeKind.ADDED])
+        self.assertEqual(self.follower.offset, os.path.getsize(self.path))
+
+    def test_partial_trailing_line_waits_for_newline(self):
+        self.follower.poll()
+        self.write(LINE_B[:10], 'a')
+        self.assertFalse(self.follower.poll())
+        self.write(LINE_B[10:], 'a')
+        self.assertEqual(len(self.follower.poll().assignments), 1)
+        self.assertEqual(self.names(), ["Иванов Иван", "Петров Петр"])
+
+    def test_unterminated_last_line_waits_across_polls(self):
+        self.write(LINE_A + LINE_B[:30])
+        self.assertEqual(len(self.follower.poll().assignments), 1)
+        self.assertFalse(self.follower.poll())
+        self.write(LINE_B[30:] + "invalid line\n", 'a')
+        update = self.follower.poll()
+        self.assertEqual([a.student_name for a in update.assignments], ["Петров Петр"])
+        self.assertEqual(update.errors[0][0], 3)
+        self.assertEqual(self.names(), ["Иванов Иван", "Петров Петр"])
+        self.assertEqual(self.follower.offset, os.path.getsize(self.path))
+
+    def test_error_line_numbers_continue_across_polls(self):
+        self.follower.poll()
+        self.write("invalid line\n" + LINE_B, 'a')
+        update = self.follower.poll()
+        self.assertEqual([line_number for line_number, _ in update.errors], [2])
+        self.write("\ninvalid line\n", 'a')
+        self.assertEqual([line_number for line_number, _ in self.follower.poll().errors], [5])
+
+    def test_truncation_rotation_and_rewrite_reload(self):
+        self.follower.poll()
+        self.write(LINE_B)
+        self.assertTrue(self.follower.poll().reloaded)
+        self.assertEqual(self.names(), ["Петров Петр"])
+
+        os.replace(self.path, self.path + ".1")
+        with self.assertRaises(FileNotFoundError):
+            self.follower.poll()
+        self.write(LINE_C + LINE_A)
+        self.assertTrue(self.follower.poll().reloaded)
+        self.assertEqual(self.names(), ["Сидоров Сидор", "Иванов Иван"])
+
+        # Same inode and size, different contents before the offset.
+        stat = os.stat(self.path)
+        with open(self.path, 'r+', encoding='utf-8') as file:
+            file.write(LINE_C.replace("Сидор", "Федор"))
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        update = self.follower.poll()
+        self.assertTrue(update.reloaded)
+        self.assertEqual(self.names(), ["Федоров Федор", "Иванов Иван"])
+
+    def test_without_course(self):
+        follower = FileFollower(self.path)
+        self.assertEqual(len(follower.poll().assignments), 1)
+        self.write(LINE_B, 'a')
+        self.assertEqual(len(follower.poll().assignments), 1)
+        self.assertEqual(len(self.course), 0)
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            FileFollower(os.path.join(self.directory.name, "missing.txt")).poll()
+
+
+if __name__ == '__main__':
+    unittest.main()
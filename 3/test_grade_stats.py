@@ -0,0 +1,76 @@
+import unittest
+from datetime import datetime
+from grade_stats import GradeStatistics
+from models import Assignment, AssignmentStatus, Course
+from storage import ColumnStore
+
+
+class TestGradeStatistics(unittest.TestCase):
+    def setUp(self):
+        self.course = Course("Программирование на Python", "Иванов И.И.")
+        self.stats = GradeStatistics(self.course)
+        self.ids = [
+            self.course.add_assignment(Assignment("Иванов Иван", "ООП", datetime(2025, 1, 15))),
+            self.course.add_assignment(Assignment("Иванов Иван", "Тесты", datetime(2025, 1, 16),
+                                                  AssignmentStatus.GRADED, 80.0)),
+            self.course.add_assignment(Assignment("Петров Петр", "ООП", datetime(2025, 2, 20),
+                                                  AssignmentStatus.GRADED, 60.0)),
+        ]
+
+    def test_incremental_updates(self):
+        self.assertEqual(self.stats.course.count, 2)
+        self.assertEqual(self.stats.course.mean, 70.0)
+        self.assertEqual(self.stats.course.variance, 100.0)
+        self.assertEqual(self.stats.course.statuses[AssignmentStatus.PENDING], 1)
+        self.course.set_grade(self.ids[0], 100.0)
+        self.assertEqual(self.stats.student("Иванов Иван").mean, 90.0)
+        self.assertEqual(self.stats.theme("ООП").max, 100.0)
+        self.assertNotIn(AssignmentStatus.PENDING, self.stats.course.statuses)
+        self.course.remove_by_id(self.ids[2])
+        self.assertEqual(self.stats.theme("ООП").min, 100.0)
+        self.assertNotIn("Петров Петр", self.stats.by_student)
+        self.assertIsNone(self.stats.student("Петров Петр").mean)
+
+    def test_matches_recompute(self):
+        self.course.update_status(self.ids[1], AssignmentStatus.SUBMITTED)
+        full = self.stats.recompute()
+        self.assertEqual(full['count'], self.stats.course.count)
+        self.assertAlmostEqual(full['mean'], self.stats.course.mean)
+        self.assertAlmostEqual(full['variance'], self.stats.course.variance)
+        self.assertEqual(full['percentiles'][50], 70.0)
+        self.assertEqual(full['histogram'][6] + full['histogram'][8], 2)
+
+    def test_failed_and_bulk_changes(self):
+        with self.assertRaises(ValueError):
+            self.course.set_grade(self.ids[0], 101)
+        with self.assertRaises(KeyError):
+            self.course.remove_by_id(999)
+        self.assertEqual((self.stats.course.count, self.stats.course.size), (2, 3))
+        self.course.bulk_set_grade({self.ids[0]: 40.0, self.ids[2]: 100.0})
+        self.assertEqual(self.stats.course.mean, 220.0 / 3)
+        self.assertEqual(self.stats.student("Петров Петр").max, 100.0)
+        self.stats.close()
+        self.course.remove_by_id(self.ids[0])
+        self.assertEqual(self.stats.course.count, 3)
+
+    def test_duplicate_ids_count_once(self):
+        changed = self.course.bulk_update_status([self.ids[0], self.ids[1], self.ids[0]], AssignmentStatus.SUBMITTED)
+        self.assertEqual(changed, [self.ids[0], self.ids[1]])
+        self.assertEqual(self.stats.course.statuses[AssignmentStatus.SUBMITTED], 2)
+        self.assertEqual(self.stats.course.size, 3)
+        full = self.stats.recompute()
+        self.assertEqual((full['count'], full['mean']), (self.stats.course.count, self.stats.course.mean))
+
+    def test_reload_rebuilds(self):
+        staging = Course("Программирование на Python", "Иванов И.И.", ColumnStore())
+        staging.add_assignment(Assignment("А", "Б", datetime(2025, 1, 1), AssignmentStatus.GRADED, 50.0))
+        self.course.swap_contents(staging)
+        self.assertEqual(self.stats.course.size, 1)
+        self.assertEqual(self.stats.recompute()['mean'], 50.0)
+        self.course.clear()
+        self.assertEqual(self.stats.course.count, 0)
+        self.assertIsNone(self.stats.recompute()['mean'])
+
+
+if __name__ == '__main__':
+    unittest.main()
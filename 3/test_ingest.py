@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+from datagen import write_file
+from distributor import Distributor
+from ingest import expand_sources, ingest
+from models import Course
+
+
+class TestIngest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.paths = []
+        for index in range(6):
+            path = self.path(f"group{index}.txt")
+            write_file(path, 200, malformed=0.1, seed=index)
+            self.paths.append(path)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def lines(self, course):
+        return [Distributor.format_record(assignment) for assignment in course.get_assignments()]
+
+    def test_expand_sources(self):
+        os.mkdir(self.path("nested"))
+        nested = self.path(os.path.join("nested", "extra.txt"))
+        write_file(nested, 1)
+        self.assertEqual(expand_sources([self.directory.name]), sorted(self.paths))
+        self.assertEqual(expand_sources([os.path.join(self.directory.name, "**", "*.txt"), self.paths[0]]),
+                         sorted(self.paths + [nested]))
+        self.assertEqual(expand_sources(["missing.txt"]), ["missing.txt"])
+
+    def test_merge_is_deterministic_and_matches_sequential_load(self):
+        expected = Course("", "")
+        cwd = os.getcwd()
+        os.chdir(self.directory.name)  # create_from_file writes error.log here
+        try:
+            for path in sorted(self.paths):
+                Distributor.create_from_file(path, expected)
+        finally:
+            os.chdir(cwd)
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                course = Course("", "")
+                report = ingest([self.directory.name], course, workers=workers, queue_size=2)
+                self.assertEqual(self.lines(course), self.lines(expected))
+                self.assertEqual([file.path for file in report.files], sorted(self.paths))
+                self.assertEqual(report.records, len(expected))
+                self.assertEqual(report.records + report.errors,
+                                 sum(file.lines for file in report.files))
+
+    def test_failures_and_error_logs_are_per_file(self):
+        with open(self.path("broken.txt"), 'wb') as file:
+            file.write(b'\xff\xfe\n')
+        error_dir = self.path("errors")
+        report = ingest([self.directory.name, self.path("missing.txt")], Course("", ""),
+                        workers=1, error_dir=error_dir)
+        failures = {os.path.basename(file.path): file.failure for file in report.failed}
+        self.assertEqual(set(failures), {"broken.txt", "missing.txt"})
+        self.assertIn("не найден", failures["missing.txt"])
+        logged = sorted(os.listdir(error_dir))
+        self.assertEqual(len(logged), sum(bool(file.errors) for file in report.files))
+        first = next(file for file in report.files if file.errors)
+        with open(os.path.join(error_dir, next(name for name in logged if os.path.basename(first.path) in name)),
+                  encoding='utf-8') as file:
+            logged_lines = file.readlines()
+        self.assertEqual(len(logged_lines), len(first.errors))
+        line_number, description, message = first.errors[0]
+        self.assertIn(f"Пропущена строка {line_number}: '{description}'. Причина: {message}", logged_lines[0])
+        self.assertIn("missing.txt: Файл", report.summary())
+
+    def test_callback_error_propagates(self):
+        def on_file(report, assignments):
+            raise RuntimeError("stop")
+        with self.assertRaises(RuntimeError):
+            ingest(self.paths, on_file=on_file, workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
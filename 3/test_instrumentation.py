@@ -0,0 +1,75 @@
+import io
+import os
+import tempfile
+import unittest
+from distributor import Distributor
+from file_logger import FileLogger
+from instrumentation import LoadStats, profiled
+from models import Course
+
+LINES = [
+    '"Иванов Иван" "Введение в Python" 2025.01.15 Pending ""',
+    '"Петров Петр" "Работа с файлами" 2025.02.20 Submitted 85.0',
+    '',
+    '"Смирнов Сергей" "Тесты" invalid_date Pending ""',
+    'invalid line',
+]
+
+
+class TestLoadStats(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        with open("input.txt", 'w', encoding='utf-8') as file:
+            file.write("\n".join(LINES) + "\n")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def _course(self):
+        return Course("Программирование на Python", "Иванов И.И.")
+
+    def test_create_from_file(self):
+        plain, timed = self._course(), self._course()
+        Distributor.create_from_file("input.txt", plain)
+        stats = LoadStats("Загрузка")
+        Distributor.create_from_file("input.txt", timed, stats=stats)
+        self.assertEqual([str(a) for a in timed.get_assignments()], [str(a) for a in plain.get_assignments()])
+        self.assertEqual((stats.lines, stats.records, stats.errors), (5, 2, 2))
+        self.assertEqual(stats.bytes, os.path.getsize("input.txt"))
+        self.assertEqual(stats.error_rate, 0.5)
+        self.assertTrue({'read', 'tokenize', 'date', 'fallback', 'log', 'add'} <= set(stats.stages))
+        self.assertGreater(stats.elapsed, 0)
+        self.assertIn("ошибок: 2", stats.summary())
+
+    def test_parallel_and_save(self):
+        stats = LoadStats()
+        course = self._course()
+        Distributor.create_from_file("input.txt", course, workers=2, stats=stats)
+        self.assertEqual((stats.lines, stats.records, stats.errors), (5, 2, 2))
+        save_stats = LoadStats()
+        Distributor.save_to_file("output.txt", course, stats=save_stats)
+        self.assertEqual(save_stats.records, 2)
+        self.assertEqual(save_stats.bytes, os.path.getsize("output.txt"))
+        self.assertEqual(set(save_stats.as_dict()['stages']), {'format', 'write'})
+
+    def test_create_from_string(self):
+        stats = LoadStats()
+        course = self._course()
+        with FileLogger("error.log") as logger:
+            Distributor.create_from_string(LINES[0], course, logger, stats)
+            with self.assertRaises(ValueError):
+                Distributor.create_from_string(LINES[4], course, logger, stats)
+        self.assertEqual((stats.lines, stats.records, stats.errors), (2, 1, 1))
+
+    def test_profiled(self):
+        stream = io.StringIO()
+        with profiled(stream, limit=5):
+            Distributor.create_from_file("input.txt", self._course())
+        self.assertIn("function calls", stream.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
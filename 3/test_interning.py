@@ -0,0 +1,35 @@
+import unittest
+from datetime import datetime
+from distributor import Distributor
+from interning import InternPool
+from models import Assignment, Course
+
+
+class TestInternPool(unittest.TestCase):
+    def test_intern_and_stats(self):
+        strings = InternPool()
+        first = strings.intern("".join(["Иванов", " Иван"]))
+        second = strings.intern("".join(["Иванов", " Иван"]))
+        self.assertIs(first, second)
+        strings.intern(first)
+        self.assertEqual((strings.hits, strings.misses, len(strings)), (1, 1, 1))
+        self.assertEqual(strings.hit_rate, 0.5)
+        self.assertGreater(strings.bytes_saved, 0)
+        strings.clear()
+        self.assertEqual((strings.hits, strings.misses, len(strings)), (0, 0, 0))
+
+    def test_scoped_to_block_and_course(self):
+        line = '"Иванов Иван" "ООП" 2025.01.15 Pending ""\n'
+        _, (first, second) = Distributor.parse_bytes((line * 2).encode('utf-8'))
+        self.assertIs(first.student_name, second.student_name)
+        course = Course("Программирование на Python", "Иванов И.И.")
+        record_id = course.add_assignment(
+            Assignment("".join(["Иванов", " Иван"]), "ООП", datetime(2025, 1, 15)))
+        self.assertIs(course.get_by_id(record_id).student_name, course.strings.intern("Иванов Иван"))
+        self.assertEqual(len(Course("", "").strings), 0)
+        course.clear()
+        self.assertEqual(len(course.strings), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from journal import Journal
+from models import Assignment, AssignmentStatus, Course
+from storage import ColumnStore
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "course.snap")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _open(self, storage=None, **kwargs):
+        course = Course("Программирование на Python", "Иванов И.И.", storage)
+        journal = Journal(self.path, **kwargs)
+        journal.open(course)
+        return course, journal
+
+    @staticmethod
+    def _state(course):
+        return [str(a) for a in course.get_assignments()]
+
+    def _make_changes(self, course):
+        first = course.add_assignment(Assignment("Иванов Иван", "Введение в Python", datetime(2025, 1, 15)))
+        second = course.add_assignment(Assignment("Петров Петр", "ООП", datetime(2025, 2, 20)))
+        third = course.add_assignment(Assignment("Сидоров Сидор", "Тесты", datetime(2025, 3, 1)))
+        course.bulk_set_grade({second: 60.0, third: 75.0})
+        course.bulk_update_status([third], AssignmentStatus.SUBMITTED)
+        course.set_grade(first, 90.0)
+        course.update_status(first, AssignmentStatus.SUBMITTED)
+        course.remove_by_id(second)
+
+    def test_replay_without_close(self):
+        course, journal = self._open()
+        self._make_changes(course)
+        expected = self._state(course)
+        # Simulate a crash: the journal is never closed or compacted.
+        restored, other = self._open(ColumnStore())
+        self.assertEqual(self._state(restored), expected)
+        other.close()
+        journal.close()
+
+    def test_compaction(self):
+        course, journal = self._open(compact_bytes=150)
+        self._make_changes(course)
+        course.set_grade(course.id_at(0), 55.0)
+        expected = self._state(course)
+        journal.close()
+        self.assertTrue(os.path.exists(self.path))
+        self.assertLess(os.path.getsize(journal.journal_path), 300)
+        restored, other = self._open()
+        self.assertEqual(self._state(restored), expected)
+        other.close()
+
+    def test_torn_tail_is_dropped(self):
+        course, journal = self._open()
+        self._make_changes(course)
+        expected = self._state(course)
+        course.add_assignment(Assignment("Лишний", "Хвост", datetime(2025, 4, 1)))
+        journal.close()
+        with open(journal.journal_path, 'r+b') as file:
+            file.truncate(os.path.getsize(journal.journal_path) - 3)
+        restored, other = self._open()
+        self.assertEqual(self._state(restored), expected)
+        restored.add_assignment(Assignment("Новый", "После сбоя", datetime(2025, 5, 1)))
+        other.close()
+        again, third = self._open()
+        self.assertEqual(self._state(again)[-1], str(Assignment("Новый", "После сбоя", datetime(2025, 5, 1))))
+        third.close()
+
+    def test_stale_journal_after_compaction_crash(self):
+        course, journal = self._open()
+        self._make_changes(course)
+        expected = self._state(course)
+        journal.close()
+        with open(journal.journal_path, 'rb') as file:
+            stale = file.read()
+        course, journal = self._open()
+        journal.compact()
+        journal.close()
+        # Crash between replacing the snapshot and resetting the journal.
+        with open(journal.journal_path, 'wb') as file:
+            file.write(stale)
+        restored, other = self._open()
+        self.assertEqual(self._state(restored), expected)
+        other.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
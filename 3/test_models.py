@@ -1,6 +1,6 @@
 import unittest
 from datetime import datetime
-from models import Assignment, AssignmentBase, AssignmentStatus, Course
+from models import Assignment, AssignmentBase, AssignmentStatus, ChangeKind, Course
 
 
 class TestAssignmentBase(unittest.TestCase):
@@ -48,6 +48,31 @@ class TestAssignment(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.assignment.set_grade(101)
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.assignment, '__dict__'))
+
+    def test_compact_date(self):
+        self.assertIsInstance(self.assignment._issue, int)
+        self.assertIs(self.assignment.issue_date, self.assignment.issue_date)
+        self.assertEqual(self.assignment.date_text, "2025.01.15")
+        with_time = Assignment("Петров Петр", "ООП", datetime(2025, 2, 20, 10, 30))
+        self.assertEqual(with_time.issue_date, datetime(2025, 2, 20, 10, 30))
+        self.assertEqual(with_time.date_text, "2025.02.20")
+        with_time.issue_date = datetime(2025, 3, 1)
+        self.assertEqual(with_time.date_text, "2025.03.01")
+
+    def test_str_cache_follows_changes(self):
+        self.assertTrue(str(self.assignment).endswith("Статус: Pending"))
+        self.assignment.update_status(AssignmentStatus.SUBMITTED)
+        self.assertTrue(str(self.assignment).endswith("Статус: Submitted"))
+        self.assignment.grade = 70.0
+        self.assertTrue(str(self.assignment).endswith("Оценка: 70.0"))
+        self.assignment.issue_date = datetime(2025, 3, 1)
+        self.assertIn("Дата выдачи: 2025.03.01", str(self.assignment))
+        self.assignment.student_name = "Петров Петр"
+        self.assignment.theme_name = "ООП"
+        self.assertTrue(str(self.assignment).startswith("Студент: Петров Петр, Тема: ООП,"))
+
     def test_str(self):
         expected = "Студент: Иванов Иван, Тема: Введение в Python, Дата выдачи: 2025.01.15, Статус: Pending"
         self.assertEqual(str(self.assignment), expected)
@@ -85,6 +110,85 @@ class TestCourse(unittest.TestCase):
         assignments = self.course.get_assignments()
         self.assertEqual(assignments, [self.assignment])
 
+    def _fill(self):
+        self.course.add_assignment(self.assignment)
+        self.course.add_assignment(Assignment("Петров Петр", "ООП", datetime(2025, 2, 20)))
+        self.course.add_assignment(Assignment("Иванов Иван", "ООП", datetime(2025, 3, 1),
+                                              AssignmentStatus.SUBMITTED))
+
+    def test_query(self):
+        self._fill()
+        self.assertEqual(len(self.course.query(student="Иванов Иван")), 2)
+        self.assertEqual(self.course.query(student="Иванов Иван", status=AssignmentStatus.PENDING),
+                         [self.assignment])
+        self.assertEqual(self.course.query(theme="ООП", student="Нет Такого"), [])
+        self.assertEqual(len(self.course.query()), 3)
+
+    def test_query_after_updates(self):
+        self._fill()
+        self.course.set_grade(1, 75.0)
+        self.course.update_status(0, AssignmentStatus.SUBMITTED)
+        self.assertEqual(self.course.query_ids(status=AssignmentStatus.SUBMITTED), [0, 2])
+        self.course.remove_assignment(0)
+        self.assertEqual(self.course.query_ids(status=AssignmentStatus.SUBMITTED), [2])
+        self.assertEqual(self.course.query_ids(status=AssignmentStatus.GRADED), [1])
+        self.course.clear()
+        self.assertEqual(self.course.query(student="Иванов Иван"), [])
+
+    def test_stable_ids(self):
+        ids = [self.course.add_assignment(Assignment(f"Студент {i}", "ООП", datetime(2025, 1, 1)))
+               for i in range(5)]
+        self.course.remove_by_id(ids[1])
+        self.course.remove_by_id(ids[3])
+        self.assertEqual(list(self.course.ids()), [ids[0], ids[2], ids[4]])
+        self.assertEqual(self.course.get_by_id(ids[4]).student_name, "Студент 4")
+        self.assertEqual(self.course.id_at(1), ids[2])
+        self.assertEqual(self.course.get_assignments()[2].student_name, "Студент 4")
+        with self.assertRaises(KeyError):
+            self.course.get_by_id(ids[1])
+        self.assertNotIn(self.course.add_assignment(self.assignment), ids)
+
+    def test_change_events(self):
+        events = []
+        self.course.subscribe(lambda kind, record_id: events.append((kind, record_id)))
+        record_id = self.course.add_assignment(self.assignment)
+        self.course.update_status(record_id, AssignmentStatus.SUBMITTED)
+        self.course.set_grade(record_id, 80.0)
+        self.course.remove_by_id(record_id)
+        self.course.clear()
+        self.assertEqual(events, [(ChangeKind.ADDED, record_id), (ChangeKind.UPDATED, record_id),
+                                  (ChangeKind.UPDATED, record_id), (ChangeKind.REMOVED, record_id),
+                                  (ChangeKind.CLEARED, None)])
+
+    def test_swap_contents(self):
+        staging = Course("Программирование на Python", "Иванов И.И.")
+        staging.add_assignment(self.assignment)
+        events = []
+        self.course.subscribe(lambda kind, record_id: events.append(kind))
+        self.course.swap_contents(staging)
+        self.assertEqual(self.course.get_assignments(), [self.assignment])
+        self.assertEqual(self.course.query(student="Иванов Иван"), [self.assignment])
+        self.assertEqual(len(staging), 0)
+        self.assertEqual(events, [ChangeKind.RELOADED])
+
+    def test_bulk_operations(self):
+        self._fill()
+        self.course.query_ids()
+        events = []
+        self.course.subscribe(lambda kind, record_id: events.append((kind, record_id)))
+        changed = self.course.bulk_update_status(lambda a: a.theme_name == "ООП", AssignmentStatus.SUBMITTED)
+        self.assertEqual(changed, [1, 2])
+        self.assertEqual(self.course.query_ids(status=AssignmentStatus.SUBMITTED), [1, 2])
+        self.course.bulk_set_grade({0: 90.0, 2: 70.0})
+        self.assertEqual(self.course.query_ids(status=AssignmentStatus.GRADED), [0, 2])
+        self.assertEqual(events, [(ChangeKind.UPDATED_MANY, [1, 2]), (ChangeKind.UPDATED_MANY, [0, 2])])
+        with self.assertRaises(ValueError):
+            self.course.bulk_set_grade({1: 50.0, 2: 101.0})
+        with self.assertRaises(KeyError):
+            self.course.bulk_update_status([1, 99], AssignmentStatus.PENDING)
+        self.assertEqual(self.course.get_by_id(1).status, AssignmentStatus.SUBMITTED)
+        self.assertEqual(len(events), 2)
+
     def test_str(self):
         expected = "Курс: Программирование на Python, Преподаватель: Иванов И.И., Количество заданий: 0"
         self.assertEqual(str(self.course), expected)
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+from models import Assignment, AssignmentStatus, Course
+from snapshot import Snapshot
+from storage import ColumnStore
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "course.snap")
+        self.course = Course("Программирование на Python", "Иванов И.И.")
+        self.course.add_assignment(Assignment("Иванов Иван", "Введение в Python", datetime(2025, 1, 15)))
+        self.course.add_assignment(Assignment("Петров Петр", "ООП", datetime(2025, 2, 20),
+                                              AssignmentStatus.GRADED, 85.5))
+        self.course.add_assignment(Assignment("Иванов Иван", "ООП", datetime(2025, 3, 1),
+                                              AssignmentStatus.SUBMITTED))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _round_trip(self, target: Course):
+        Snapshot.save_to_file(self.path, self.course)
+        self.assertEqual(Snapshot.load_from_file(self.path, target), 3)
+        self.assertEqual([str(a) for a in target.get_assignments()],
+                         [str(a) for a in self.course.get_assignments()])
+
+    def test_round_trip_records(self):
+        self._round_trip(Course("Копия", "Иванов И.И."))
+
+    def test_round_trip_columns(self):
+        target = Course("Копия", "Иванов И.И.", ColumnStore())
+        self._round_trip(target)
+        self.assertEqual(len(target.query(student="Иванов Иван")), 2)
+
+    def test_save_from_columns_with_deleted_rows(self):
+        columns = Course("Колонки", "Иванов И.И.", ColumnStore())
+        for assignment in self.course.get_assignments():
+            columns.add_assignment(assignment)
+        columns.remove_assignment(1)
+        Snapshot.save_to_file(self.path, columns)
+        target = Course("Копия", "Иванов И.И.")
+        self.assertEqual(Snapshot.load_from_file(self.path, target), 2)
+        self.assertEqual(target.get_assignments()[1].theme_name, "ООП")
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as file:
+            file.write('"Иванов Иван" "ООП" 2025.01.15 Pending ""'.encode('utf-8'))
+        with self.assertRaises(ValueError):
+            Snapshot.load_from_file(self.path, Course("Копия", "Иванов И.И."))
+
+    def test_rejects_truncated(self):
+        Snapshot.save_to_file(self.path, self.course)
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        with open(self.path, 'wb') as file:
+            file.write(data[:-5])
+        with self.assertRaises(ValueError):
+            Snapshot.load_from_file(self.path, Course("Копия", "Иванов И.И."))
+
+
+    def test_rejects_bad_status_and_date(self):
+        Snapshot.save_to_file(self.path, self.course)
+        with open(self.path, 'rb') as file:
+            data = bytearray(file.read())
+        count = len(self.course)
+        statuses = len(data) - 9 * count
+        for offset, value in ((statuses, b'\x07'), (statuses - 4 * count, b'\xff\xff\xff\x7f')):
+            with self.subTest(offset=offset):
+                corrupt = bytearray(data)
+                corrupt[offset:offset + len(value)] = value
+                with self.assertRaises(ValueError):
+                    Snapshot.load_from_bytes(bytes(corrupt), Course("Копия", "Иванов И.И."))
+                with self.assertRaises(ValueError):
+                    Snapshot.load_from_bytes(bytes(corrupt), Course("Копия", "Иванов И.И.", ColumnStore()))
+
+    def test_failed_save_keeps_old_snapshot(self):
+        Snapshot.save_to_file(self.path, self.course)
+        with mock.patch.object(Snapshot, '_to_little_endian', side_effect=OSError("диск заполнен")):
+            with self.assertRaises(IOError):
+                Snapshot.save_to_file(self.path, Course("Пустой", ""))
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), [os.path.basename(self.path)])
+        self.assertEqual(Snapshot.load_from_file(self.path, Course("Копия", "Иванов И.И.")), len(self.course))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from models import Assignment, AssignmentStatus, Course
+from sqlite_store import SqliteStore
+
+
+class TestSqliteStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "course.db")
+        self.store = SqliteStore(self.path)
+        self.course = Course("Программирование на Python", "Иванов И.И.", self.store)
+        self.first = self.course.add_assignment(
+            Assignment("Иванов Иван", "Введение в Python", datetime(2025, 1, 15)))
+        self.second = self.course.add_assignment(
+            Assignment("Петров Петр", "ООП", datetime(2025, 2, 20), AssignmentStatus.SUBMITTED, 85.0))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def _reopen(self) -> Course:
+        self.store.close()
+        self.store = SqliteStore(self.path)
+        return Course("Программирование на Python", "Иванов И.И.", self.store)
+
+    def test_changes_persist(self):
+        self.course.set_grade(self.first, 90.0)
+        self.course.update_status(self.second, AssignmentStatus.PENDING)
+        course = self._reopen()
+        self.assertEqual(len(course), 2)
+        first, second = course.get_assignments()
+        self.assertEqual(first.grade, 90.0)
+        self.assertEqual(first.status, AssignmentStatus.GRADED)
+        self.assertEqual(first.issue_date, datetime(2025, 1, 15))
+        self.assertEqual(second.status, AssignmentStatus.PENDING)
+        self.assertEqual(str(second), "Студент: Петров Петр, Тема: ООП, "
+                                      "Дата выдачи: 2025.02.20, Статус: Pending, Оценка: 85.0")
+        with self.assertRaises(ValueError):
+            course.set_grade(self.first, 101)
+
+    def test_remove_and_clear(self):
+        self.course.remove_assignment(0)
+        with self.assertRaises(KeyError):
+            self.course.get_by_id(self.first)
+        self.assertEqual(self.course.get_assignments()[0].student_name, "Петров Петр")
+        self.course.clear()
+        self.assertEqual(len(self.course), 0)
+        record_id = self.course.add_assignment(Assignment("А", "Б", datetime(2025, 1, 1)))
+        self.assertGreater(record_id, self.second)
+
+    def test_positions_come_from_database(self):
+        self.store.import_records(Assignment(f"Студент {index}", "ООП", datetime(2025, 1, 1))
+                                  for index in range(600))
+        course = self._reopen()
+        self.assertIsNone(course._order)
+        self.assertEqual(course.get_by_id(course.id_at(300)).student_name, "Студент 298")
+        course.remove_by_id(course.id_at(1))
+        self.assertEqual(course.get_by_id(course.id_at(1)).student_name, "Студент 0")
+        self.assertEqual(course.get_by_id(course.id_at(600)).student_name, "Студент 599")
+        with self.assertRaises(IndexError):
+            course.id_at(601)
+        course.remove_by_id(course.id_at(520))
+        record_id = course.add_assignment(Assignment("Новый", "ООП", datetime(2025, 1, 2)))
+        self.assertEqual([course.id_at(position) for position in range(len(course))], list(course.ids()))
+        self.assertEqual(course.id_at(600), record_id)
+
+    def test_query_uses_database(self):
+        self.assertEqual(self.course.query_ids(student="Петров Петр"), [self.second])
+        self.assertEqual(self.course.query_ids(status=AssignmentStatus.PENDING), [self.first])
+        self.assertEqual(self.course.query_ids(theme="ООП", status=AssignmentStatus.PENDING), [])
+        self.assertEqual(self.course._by_student, {})
+
+    def test_bulk_update_persists(self):
+        self.course.bulk_set_grade({self.first: 70.0, self.second: 95.0})
+        course = self._reopen()
+        self.assertEqual([a.grade for a in course.get_assignments()], [70.0, 95.0])
+        self.assertEqual(course.query_ids(status=AssignmentStatus.GRADED), [self.first, self.second])
+
+    def test_import_file(self):
+        file_path = os.path.join(self.tmp.name, "input.txt")
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write('"Сидоров Сидор" "ООП" 2025.03.10 Graded 90\n'
+                       'invalid line\n'
+                       '"Смирнов Сергей" "Тесты" 2025.04.01 Pending ""\n')
+        self.assertEqual(self.store.import_file(file_path), 2)
+        course = Course("Программирование на Python", "Иванов И.И.", self.store)
+        self.assertEqual(len(course), 4)
+        self.assertEqual(course.query(theme="ООП")[1].grade, 90.0)
+
+    def test_import_rolls_back_on_error(self):
+        def records():
+            yield Assignment("А", "Б", datetime(2025, 1, 1))
+            raise ValueError("ошибка")
+
+        with self.assertRaises(ValueError):
+            self.store.import_records(records())
+        self.assertEqual(len(self._reopen()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
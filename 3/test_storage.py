@@ -0,0 +1,67 @@
+import unittest
+from datetime import datetime
+from models import Assignment, AssignmentStatus, Course
+from storage import ColumnStore
+
+
+class TestColumnStore(unittest.TestCase):
+    def setUp(self):
+        self.course = Course("Программирование на Python", "Иванов И.И.", ColumnStore())
+        self.course.add_assignment(Assignment("Иванов Иван", "Введение в Python", datetime(2025, 1, 15)))
+        self.course.add_assignment(Assignment("Петров Петр", "ООП", datetime(2025, 2, 20),
+                                              AssignmentStatus.SUBMITTED, 85.0))
+
+    def test_views(self):
+        first, second = self.course.get_assignments()
+        self.assertEqual(first.student_name, "Иванов Иван")
+        self.assertEqual(first.issue_date, datetime(2025, 1, 15))
+        self.assertIsNone(first.grade)
+        self.assertEqual(second.status, AssignmentStatus.SUBMITTED)
+        self.assertEqual(second.grade, 85.0)
+        self.assertEqual(str(first), "Студент: Иванов Иван, Тема: Введение в Python, "
+                                     "Дата выдачи: 2025.01.15, Статус: Pending")
+
+    def test_write_through(self):
+        view = self.course.get_assignments()[0]
+        view.set_grade(90.0)
+        self.assertEqual(self.course.get_assignments()[0].grade, 90.0)
+        self.assertEqual(self.course.get_assignments()[0].status, AssignmentStatus.GRADED)
+        with self.assertRaises(ValueError):
+            view.set_grade(101)
+
+    def test_remove_and_clear(self):
+        self.course.remove_assignment(0)
+        self.assertEqual(len(self.course.assignments), 1)
+        self.assertEqual(self.course.get_assignments()[0].student_name, "Петров Петр")
+        with self.assertRaises(IndexError):
+            self.course.remove_assignment(1)
+        with self.assertRaises(KeyError):
+            self.course.get_by_id(0)
+        self.assertEqual(self.course.get_by_id(1).student_name, "Петров Петр")
+        self.course.get_assignments().clear()
+        self.assertEqual(self.course.assignments, [])
+
+    def test_compaction_keeps_ids(self):
+        self.course.clear()
+        ids = [self.course.add_assignment(Assignment(f"Студент {i}", "ООП", datetime(2025, 1, 1)))
+               for i in range(3000)]
+        kept = list(ids)
+        for record_id in ids[:2400:2] + ids[1:2400:2]:
+            self.course.remove_by_id(record_id)
+            kept.remove(record_id)
+            self.assertEqual(self.course.id_at(len(kept) // 2), kept[len(kept) // 2])
+        store = self.course.store
+        self.assertLess(len(store.statuses), len(ids))
+        self.assertEqual(list(self.course.ids()), kept)
+        self.assertEqual([self.course.id_at(i) for i in range(len(kept))], kept)
+        self.assertEqual(self.course.get_by_id(kept[-1]).student_name, "Студент 2999")
+        self.assertNotIn(ids[0], store)
+        new_id = self.course.add_assignment(Assignment("Новый", "ООП", datetime(2025, 1, 1)))
+        self.assertGreater(new_id, ids[-1])
+        self.assertEqual(self.course.get_by_id(new_id).student_name, "Новый")
+        self.course.clear()
+        self.assertGreater(self.course.add_assignment(Assignment("А", "Б", datetime(2025, 1, 1))), new_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Sequence, Tuple
+
+
+class VirtualTable(ttk.Frame):
+    """Treeview that only materializes the visible window of rows.
+
+    Rows are pulled on demand from ``row_at(position) -> (iid, values)`` and
+    the scrollbar is driven by ``row_count()``, so the widget holds a constant
+    number of Tk items regardless of how many rows the source has.
+    """
+    def __init__(self, master, columns: Sequence[str], headings: Sequence[str],
+                 row_count: Callable[[], int], row_at: Callable[[int], Tuple[str, tuple]],
+                 overscan: int = 5):
+        super().__init__(master)
+        self._row_count = row_count
+        self._row_at = row_at
+        self._overscan = overscan
+        self._top = 0
+        self._visible = 20
+
+        self.tree = ttk.Treeview(self, columns=tuple(columns), show="headings", height=self._visible)
+        for column, heading in zip(columns, headings):
+            self.tree.heading(column, text=heading)
+        self._scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scroll)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll_by(3))
+
+    def set_source(self, row_count: Callable[[], int], row_at: Callable[[int], Tuple[str, tuple]]):
+        """Switch to another row source and show it from the top."""
+        self._row_count = row_count
+        self._row_at = row_at
+        self._top = 0
+        self.refresh()
+
+    def refresh(self):
+        """Re-render the current window, e.g. after the source has changed."""
+        total = self._row_count()
+        self._top = max(0, min(self._top, total - self._visible))
+        selected = set(self.tree.selection())
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        end = min(total, self._top + self._visible + self._overscan)
+        for position in range(self._top, end):
+            iid, values = self._row_at(position)
+            self.tree.insert("", tk.END, iid=iid, values=values)
+        reselect = [iid for iid in selected if self.tree.exists(iid)]
+        if reselect:
+            self.tree.selection_set(reselect)
+        if total:
+            self._scrollbar.set(self._top / total, min(1.0, (self._top + self._visible) / total))
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+    def scroll_by(self, rows: int):
+        """Move the window by a number of rows."""
+        self._top += rows
+        self.refresh()
+
+    def _on_scroll(self, action, *args):
+        """Scrollbar callback: 'moveto fraction' or 'scroll n units|pages'."""
+        if action == "moveto":
+            self._top = int(float(args[0]) * self._row_count())
+        elif action == "scroll":
+            step = int(args[0])
+            self._top += step * (self._visible if args[1] == "pages" else 1)
+        self.refresh()
+
+    def _on_mousewheel(self, event):
+        self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_configure(self, event):
+        """Recompute how many rows fit when the widget is resized."""
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        visible = max(1, event.height // row_height - 1)
+        if visible != self._visible:
+            self._visible = visible
+            self.refresh()